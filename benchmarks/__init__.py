@@ -0,0 +1 @@
+"""Performance benchmarks for libThresholdLogic, see `python -m benchmarks --help`"""
@@ -0,0 +1,104 @@
+"""
+Run the benchmark suite, writing machine-readable JSON results which can be compared between commits
+
+    python -m benchmarks run -o before.json
+    git checkout ...
+    python -m benchmarks run -o after.json
+    python -m benchmarks compare before.json after.json
+"""
+
+from typing import Optional
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+from .suite import run
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output = True, text = True, check = True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main_run(args: argparse.Namespace) -> int:
+    results = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": args.quick,
+        "n_vectors": args.n_vectors,
+        "cases": run(args.quick, args.n_vectors, args.repeat, args.only),
+    }
+
+    if args.output == "-":
+        json.dump(results, sys.stdout, indent = 2)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent = 2)
+
+    return 0
+
+def main_compare(args: argparse.Namespace) -> int:
+    """
+    Print the ratio new / old of every metric present in both files,
+    failing if any is worse than `threshold`
+    """
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    print(f"old: {old.get('commit')}\nnew: {new.get('commit')}")
+
+    n_regressions = 0
+    for case, new_metrics in new["cases"].items():
+        old_metrics = old["cases"].get(case)
+        if old_metrics is None:
+            continue
+        for metric, new_value in new_metrics.items():
+            old_value = old_metrics.get(metric)
+            if not old_value:
+                continue
+            ratio = new_value / old_value
+            flag = ""
+            if ratio > 1 + args.threshold:
+                flag = "  REGRESSION"
+                n_regressions += 1
+            elif ratio < 1 - args.threshold:
+                flag = "  improvement"
+            print(f"{case:32} {metric:24} {old_value:12.4g} -> {new_value:12.4g}  x{ratio:.2f}{flag}")
+
+    print(f"{n_regressions} regression(s) beyond {args.threshold:.0%}")
+    return 1 if n_regressions else 0
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks", description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest = "command", required = True)
+
+    parser_run = subparsers.add_parser("run", help = "run the benchmarks")
+    parser_run.add_argument("-o", "--output", default = "-", help = "JSON results file, default stdout")
+    parser_run.add_argument("--quick", action = "store_true", help = "a smaller grid of sizes")
+    parser_run.add_argument("--n-vectors", type = int, default = 1000, help = "random input vectors per evaluation benchmark")
+    parser_run.add_argument("--repeat", type = int, default = 3, help = "repeats of each timing, of which the best is kept")
+    parser_run.add_argument("--only", help = "only run cases whose name contains this")
+    parser_run.set_defaults(func = main_run)
+
+    parser_compare = subparsers.add_parser("compare", help = "compare two JSON results files")
+    parser_compare.add_argument("old")
+    parser_compare.add_argument("new")
+    parser_compare.add_argument("--threshold", type = float, default = 0.1, help = "relative change counted as a regression, default 0.1")
+    parser_compare.set_defaults(func = main_compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
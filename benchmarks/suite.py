@@ -0,0 +1,114 @@
+from typing import Callable, Dict, List, Optional, Tuple
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from libThresholdLogic import BitSlicedNetwork, NeuronNetwork
+from libThresholdLogic.ExampleNetworks import (
+    HalfAdder, FullAdder, GenericBitAdder, GenericNumberAdder,
+    BitMultiplier2x2, GenericBitMultiplier,
+)
+
+# (name, constructor) for each network on the grid of sizes
+Case = Tuple[str, Callable[[], NeuronNetwork]]
+
+def grid(quick: bool = False) -> List[Case]:
+    bit_adder_sizes = (2, 3, 4) if quick else (2, 3, 4, 5, 6)
+    number_adder_sizes = ((8, 2), (16, 3)) if quick else ((8, 2), (32, 2), (32, 3), (128, 3), (1024, 2))
+    multiplier_sizes = (2, 4) if quick else (2, 4, 8, 16, 32)
+
+    return [
+        ("HalfAdder", HalfAdder),
+        ("FullAdder", FullAdder),
+        *((f"GenericBitAdder({n})", lambda n = n: GenericBitAdder(n)) for n in bit_adder_sizes),
+        *(
+            (f"GenericNumberAdder({n_bit}, {n_neurons})", lambda n_bit = n_bit, n_neurons = n_neurons: GenericNumberAdder(n_bit, n_neurons))
+            for n_bit, n_neurons in number_adder_sizes
+        ),
+        ("BitMultiplier2x2", BitMultiplier2x2),
+        *((f"GenericBitMultiplier({n_bit})", lambda n_bit = n_bit: GenericBitMultiplier(n_bit)) for n_bit in multiplier_sizes),
+    ]
+
+def best_time(func: Callable[[], None], repeat: int) -> float:
+    """
+    The least wall time of `repeat` calls of `func`, which is the least noisy estimate
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """
+    The peak bytes allocated by Python while calling `func`
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def run_case(constructor: Callable[[], NeuronNetwork], n_vectors: int, repeat: int) -> Dict[str, float]:
+    """
+    Time construction, compilation and each way of evaluating `n_vectors` random input vectors.
+    Times are in seconds, per network for construction and per vector for evaluation
+    """
+    results = {}
+
+    results["construct_s"] = best_time(constructor, repeat)
+    results["construct_peak_bytes"] = peak_memory(constructor)
+
+    network = constructor()
+    n_inputs = len(network.input_layer)
+    vectors = [tuple(random.getrandbits(1) for _ in range(n_inputs)) for _ in range(n_vectors)]
+
+    results["compile_s"] = best_time(network.compile, repeat)
+    results["compile_peak_bytes"] = peak_memory(network.compile)
+    compiled = network.compile()
+
+    def call() -> None:
+        for vector in vectors:
+            network(*vector)
+    results["call_s"] = best_time(call, repeat) / n_vectors
+
+    def compiled_call() -> None:
+        for vector in vectors:
+            compiled(*vector)
+    results["compiled_call_s"] = best_time(compiled_call, repeat) / n_vectors
+
+    bit_sliced = BitSlicedNetwork(compiled)
+    results["bit_sliced_s"] = best_time(lambda: bit_sliced.evaluate_batch(vectors), repeat) / n_vectors
+
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        array = np.array(vectors, dtype = np.uint8)
+        compiled.evaluate_batch(array[:1]) # build the level matrices outside of the timing
+        results["batch_s"] = best_time(lambda: compiled.evaluate_batch(array), repeat) / n_vectors
+        results["batch_peak_bytes"] = peak_memory(lambda: compiled.evaluate_batch(array))
+
+    return results
+
+def run(quick: bool = False, n_vectors: int = 1000, repeat: int = 3, only: Optional[str] = None, verbose: bool = True) -> Dict[str, Dict[str, float]]:
+    random.seed(0)
+
+    results = {}
+    for name, constructor in grid(quick):
+        if only is not None and only not in name:
+            continue
+        results[name] = run_case(constructor, n_vectors, repeat)
+        if verbose:
+            # progress goes to stderr, so that the JSON written to stdout by `python -m benchmarks run` stays parseable
+            print(name, " ".join(f"{metric}={value:.3g}" for (metric, value) in results[name].items()), file = sys.stderr, flush = True)
+
+    return results
@@ -0,0 +1,161 @@
+from typing import List, Sequence, Tuple
+
+from .CompiledNetwork import CompiledNetwork
+
+def exhaustive_lanes(n_inputs: int) -> Tuple[List[int], int]:
+    """
+    Input lanes enumerating all `2 ** n_inputs` input vectors, and the number of lanes.
+    Lane `k` holds the little bittian bits of `k`, that is input `i` of lane `k` is bit `i` of `k`
+    """
+    n_lanes = 2 ** n_inputs
+    lanes = []
+    for i in range(n_inputs):
+        period = 2 ** (i + 1)
+        block = ((1 << (period // 2)) - 1) << (period // 2) # half 0s then half 1s
+        repeats = n_lanes // period
+        # multiplying by 1 + 2 ** period + 2 ** (2 * period) + ... tiles `block`
+        lanes.append(block * (((1 << (period * repeats)) - 1) // ((1 << period) - 1)))
+
+    return lanes, n_lanes
+
+def pack_operands(rows: Sequence[Sequence[int]], widths: Sequence[int]) -> List[int]:
+    """
+    Input lanes for `len(rows)` vectors of int operands, as read by an input layer which is
+    a concatenation of little bittian operands of `widths` bits: lane `k` of input wire `j`
+    of operand `i` is bit `j` of `rows[k][i]`
+    """
+    lanes = []
+    for operand_idx, n_bit in enumerate(widths):
+        column = [row[operand_idx] for row in reversed(rows)]
+        assert all(0 <= operand < (1 << n_bit) for operand in column)
+        for bit in range(n_bit):
+            lanes.append(int("".join("1" if (operand >> bit) & 1 else "0" for operand in column), 2))
+
+    return lanes
+
+def unpack_lanes(lanes: Sequence[int], n_lanes: int) -> List[int]:
+    """
+    The little bittian int in each of `n_lanes` lanes, bit `j` of lane `k` being bit `k` of `lanes[j]`
+    """
+    # the binary string of each lane reversed, so that character `k` is lane `k`
+    columns = [bin(lane)[2:].zfill(n_lanes)[::-1] for lane in reversed(lanes)]
+    return [int("".join(bits), 2) if bits else 0 for bits in zip(*columns)] if columns else [0] * n_lanes
+
+class BitSlicedNetwork:
+    """
+    Evaluates a `CompiledNetwork` across many input vectors at once, using Python ints as wide SIMD lanes.
+    Each input, and each perceptron's output, is one int whose bit `k` is its value in lane (input vector) `k`.
+
+    Every perceptron is first rescaled exactly into integer weights and a threshold with
+    `CompiledNetwork.to_exact`, with negative weights rewritten as positive weights on complemented inputs.
+    The weighted sum of each lane is then accumulated bit-parallel into binary counter planes,
+    which is preloaded with `2 ** m - threshold` so that the carry into plane `m` is the perceptron's output.
+    This is the ideal Heaviside step, which agrees with `NeuronNetwork.__call__` except where
+    the float sum is within `Perceptron.heaviside`'s epsilon below the bias
+    """
+    def __init__(self, compiled: CompiledNetwork) -> None:
+        self.n_inputs = compiled.n_inputs
+        self.const_values = compiled.const_values
+        self.output_slots = compiled.output_slots
+        self.first_perceptron_slot = compiled.first_perceptron_slot
+
+        const_slots = range(compiled.n_inputs, compiled.first_perceptron_slot)
+        valid_const_outputs = {0.0, 1.0}
+        assert all(
+            compiled.const_values[slot - compiled.n_inputs] in valid_const_outputs
+            for slot in self.output_slots if slot in const_slots
+        )
+
+        exact = compiled.to_exact()
+
+        self.program = [] # of `(terms, m, preload)` or `(None, constant_output, None)`
+        for threshold, start, stop in zip(exact.biases, exact.offsets, exact.offsets[1:]):
+            int_weights = exact.weights[start:stop]
+            sources = exact.sources[start:stop]
+
+            terms = [] # of `(weight, source, complemented)` with `weight > 0`
+            for int_weight, source in zip(int_weights, sources):
+                if int_weight > 0:
+                    terms.append((int_weight, source, False))
+                elif int_weight < 0:
+                    # w * x == -w * (1 - x) + w
+                    terms.append((-int_weight, source, True))
+                    threshold -= int_weight
+
+            total = sum(weight for (weight, _, _) in terms)
+            if threshold <= 0:
+                self.program.append((None, True, None))
+            elif threshold > total:
+                self.program.append((None, False, None))
+            else:
+                # need `2 ** m >= threshold` to preload, and `total - threshold < 2 ** m` so plane `m` is the result
+                m = max(threshold.bit_length(), (total - threshold).bit_length())
+                self.program.append((terms, m, (1 << m) - threshold))
+
+    def evaluate_lanes(self, input_lanes: Sequence[int], n_lanes: int) -> List[int]:
+        """
+        Evaluate every slot of the network for `n_lanes` input vectors packed into `input_lanes`,
+        returning the lanes of every slot, in slot order
+        """
+        assert len(input_lanes) == self.n_inputs
+
+        full = (1 << n_lanes) - 1
+
+        values = [lane & full for lane in input_lanes]
+        for value in self.const_values:
+            # perceptrons have constants folded into their thresholds, so these are only read as outputs
+            values.append(full if value == 1.0 else 0)
+
+        for terms, m, preload in self.program:
+            if terms is None:
+                values.append(full if m else 0)
+                continue
+
+            planes = [full if (preload >> k) & 1 else 0 for k in range(m + 1)]
+            for weight, source, complemented in terms:
+                lane = values[source] ^ full if complemented else values[source]
+                k = 0
+                while weight:
+                    if weight & 1:
+                        # ripple-add `lane` into the counter at plane `k`
+                        carry = lane
+                        j = k
+                        while carry:
+                            plane = planes[j]
+                            planes[j] = plane ^ carry
+                            carry &= plane
+                            j += 1
+                    weight >>= 1
+                    k += 1
+
+            values.append(planes[m])
+
+        return values
+
+    def evaluate_batch(self, inputs: Sequence[Sequence[int]]) -> List[Tuple[int]]:
+        """
+        Evaluate the network on each row of `inputs`, returning a list of output tuples
+        just as calling the network on each row would
+        """
+        n_lanes = len(inputs)
+        if n_lanes == 0:
+            return []
+
+        valid_inputs = {0, 1}
+        input_lanes = []
+        for column in zip(*inputs):
+            assert all(i in valid_inputs for i in column)
+            input_lanes.append(int("".join("1" if i else "0" for i in reversed(column)), 2))
+
+        output_lanes = self.output_lanes(input_lanes, n_lanes)
+
+        # lane `k` is character `k` of each reversed binary string
+        columns = [bin(lane)[2:].zfill(n_lanes)[::-1] for lane in output_lanes]
+        return [tuple(int(bit) for bit in row) for row in zip(*columns)]
+
+    def output_lanes(self, input_lanes: Sequence[int], n_lanes: int) -> List[int]:
+        """
+        The lanes of the output layer only, see `evaluate_lanes`
+        """
+        values = self.evaluate_lanes(input_lanes, n_lanes)
+        return [values[slot] for slot in self.output_slots]
@@ -0,0 +1,688 @@
+from array import array
+from fractions import Fraction
+from operator import itemgetter, mul
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+import mmap
+import os
+import struct
+import sys
+
+from .Neurons import BaseNeuron, ConstNeuron, Perceptron, ProxyNeuron
+from .Neurons.Perceptron import epsilon
+from .util import ideal_step_agrees, integer_threshold_form, topological_order
+
+def _as_array(typecode: str, values: Sequence) -> Union[array, memoryview]:
+    """
+    A compact array of `values`, leaving a memory-mapped `memoryview` of the same type as it is
+    """
+    if isinstance(values, memoryview) and values.format == typecode:
+        return values
+    return array(typecode, values)
+
+def _int_array(values: Sequence[int]) -> Union[array, memoryview, List[int]]:
+    """
+    A compact array of int64s, or a plain list for ints too large to fit
+    """
+    try:
+        return _as_array("q", values)
+    except OverflowError:
+        return list(values)
+
+_MAGIC = b"libTLnet"
+_VERSION = 1
+_FLAG_EXACT = 1
+_HEADER = struct.Struct("<8sII6Q")
+# magic, version, flags, n_inputs, n_consts, n_perceptrons, n_edges, len(level_offsets), n_outputs
+
+class CompiledNetwork:
+    """
+    A flattened, levelized form of a `NeuronNetwork`, created by `NeuronNetwork.compile`
+
+    Every value of the network lives in a numbered slot:
+    - slots `[0, n_inputs)` are the input layer
+    - the next `len(const_values)` slots are the distinct `ConstNeuron` values
+    - the remaining slots are the perceptrons, sorted by level (logic depth)
+
+    `ProxyNeuron`s are stripped out entirely, each aliasing the slot of its source.
+    Perceptron `p` has bias `biases[p]` and reads the slots `sources[offsets[p]:offsets[p + 1]]`
+    with the corresponding `weights`, in the same order as `Perceptron.inputs`,
+    so outputs are identical to `NeuronNetwork.__call__`.
+    These arrays are stored as compact `array.array`s, a few bytes per edge rather than
+    the several Python objects per edge of a network of `Perceptron`s and `ProxyNeuron`s
+
+    An `exact` compiled network, see `to_exact`, instead has integer weights and thresholds
+    in place of biases, and evaluates with pure integer sums and no epsilon
+    """
+    def __init__(
+        self,
+        n_inputs: int,
+        const_values: List[float],
+        biases: List[float],
+        offsets: List[int],
+        sources: List[int],
+        weights: List[float],
+        level_offsets: List[int],
+        output_slots: List[int],
+        neurons: List[BaseNeuron] = None,
+        exact: bool = False,
+    ) -> None:
+        self.n_inputs = n_inputs
+        self.const_values = list(const_values)
+        self.offsets = _as_array("q", offsets)
+        self.sources = _as_array("q", sources)
+        self.level_offsets = _as_array("q", level_offsets) # perceptrons `[level_offsets[l], level_offsets[l + 1])` are at level `l + 1`
+        self.output_slots = _as_array("q", output_slots)
+        self.neurons = neurons # the original neuron of each slot, for reporting; may be `None`
+        self.exact = exact
+
+        if exact:
+            self.biases = _int_array(biases)
+            self.weights = _int_array(weights)
+            self.value_type = int
+            self.tolerance = 0
+        else:
+            self.biases = _as_array("d", biases)
+            self.weights = _as_array("d", weights)
+            self.value_type = float
+            self.tolerance = epsilon # see `Perceptron.heaviside`
+
+        self.path = None # of the file this network was memory-mapped from by `load`, if any
+
+        self._program = None # built on first use by `evaluate`
+        self._batch_levels = None # built on first use by `evaluate_batch`
+        self._batch_levels_dtype = None # of `_batch_levels`, found along with them
+        self._bit_sliced = None # built on first use by `stream`
+        self._generated = None # built on first use by `codegen`
+        self._epsilon_free = None # found on first use by `epsilon_free`
+
+    @classmethod
+    def from_layers(
+        cls,
+        input_layer: List[ProxyNeuron],
+        output_layer: List[BaseNeuron],
+        keep_neurons: bool = True,
+    ) -> "CompiledNetwork":
+        """
+        Compile the network between `input_layer` and `output_layer`.
+        The input layer's `ProxyNeuron`s are treated as inputs regardless of what their source is,
+        so a network that has been chained up with `connect_inputs` compiles to just itself.
+        Without `keep_neurons` the compiled network holds no reference to the neurons,
+        so they can be garbage collected, leaving just the compact arrays
+        """
+        order = topological_order(output_layer, input_layer)
+
+        n_inputs = len(input_layer)
+        input_set = set(input_layer)
+
+        # level 0 for inputs and constants, else one more than the deepest perceptron input
+        levels: Dict[BaseNeuron, int] = {neuron: 0 for neuron in input_layer}
+        perceptrons: List[Perceptron] = []
+        const_values: List[float] = []
+        const_neurons: List[ConstNeuron] = []
+        const_slots: Dict[float, int] = {}
+        aliases: Dict[BaseNeuron, BaseNeuron] = {} # of `ProxyNeuron` or `ConstNeuron` to the neuron holding its slot
+
+        for neuron in order:
+            if neuron in input_set:
+                continue
+
+            if isinstance(neuron, ProxyNeuron):
+                if neuron.source is None:
+                    raise ValueError("ProxyNeuron source unset")
+                aliases[neuron] = aliases.get(neuron.source, neuron.source)
+                levels[neuron] = levels[neuron.source]
+            elif isinstance(neuron, ConstNeuron):
+                if neuron.value not in const_slots:
+                    const_slots[neuron.value] = n_inputs + len(const_values)
+                    const_values.append(neuron.value)
+                    const_neurons.append(neuron)
+                levels[neuron] = 0
+            elif isinstance(neuron, Perceptron):
+                perceptrons.append(neuron)
+                levels[neuron] = 1 + max((levels[input_] for (_, input_) in neuron.inputs), default = 0)
+            else:
+                raise TypeError(f"Cannot compile neuron of type {type(neuron).__name__}")
+
+        # a stable sort keeps the topological order within each level
+        perceptrons.sort(key = lambda neuron: levels[neuron])
+
+        slots: Dict[BaseNeuron, int] = {neuron: slot for (slot, neuron) in enumerate(input_layer)}
+        for neuron in order:
+            if isinstance(neuron, ConstNeuron) and neuron not in input_set:
+                slots[neuron] = const_slots[neuron.value]
+
+        first_perceptron_slot = n_inputs + len(const_values)
+        for idx, neuron in enumerate(perceptrons):
+            slots[neuron] = first_perceptron_slot + idx
+
+        def slot_of(neuron: BaseNeuron) -> int:
+            return slots[aliases.get(neuron, neuron)]
+
+        biases = []
+        offsets = [0]
+        sources = []
+        weights = []
+        level_offsets = [0]
+        for idx, neuron in enumerate(perceptrons):
+            if idx and levels[neuron] != levels[perceptrons[idx - 1]]:
+                level_offsets.append(idx)
+
+            biases.append(neuron.bias)
+            for weight, input_ in neuron.inputs:
+                weights.append(weight)
+                sources.append(slot_of(input_))
+            offsets.append(len(sources))
+        if perceptrons:
+            level_offsets.append(len(perceptrons))
+
+        output_slots = [slot_of(neuron) for neuron in output_layer]
+
+        neurons = list(input_layer) + const_neurons + perceptrons if keep_neurons else None
+
+        return cls(
+            n_inputs,
+            const_values,
+            biases,
+            offsets,
+            sources,
+            weights,
+            level_offsets,
+            output_slots,
+            neurons,
+        )
+
+    def to_exact(self) -> "CompiledNetwork":
+        """
+        The same network with each perceptron rescaled exactly to integer weights and a threshold
+        by `integer_threshold_form`, after folding any `ConstNeuron` inputs into its bias.
+        Since floats are dyadic rationals the rescaling is by a power of two, and the result
+        is exact at any size, unlike the float sums of weights such as `GenericBitAdder`'s `2 ** -i`
+        """
+        if self.exact:
+            return self
+
+        const_slots = range(self.n_inputs, self.first_perceptron_slot)
+
+        biases = []
+        offsets = [0]
+        sources = []
+        weights = []
+        for bias, start, stop in zip(self.biases, self.offsets, self.offsets[1:]):
+            bias = Fraction(bias)
+            edges = []
+            for weight, source in zip(self.weights[start:stop], self.sources[start:stop]):
+                if source in const_slots:
+                    bias -= Fraction(weight) * Fraction(self.const_values[source - self.n_inputs])
+                else:
+                    edges.append((weight, source))
+
+            int_weights, threshold = integer_threshold_form((weight for (weight, _) in edges), bias)
+
+            biases.append(threshold)
+            weights += int_weights
+            sources += [source for (_, source) in edges]
+            offsets.append(len(sources))
+
+        return CompiledNetwork(
+            self.n_inputs,
+            self.const_values,
+            biases,
+            offsets,
+            sources,
+            weights,
+            self.level_offsets,
+            self.output_slots,
+            self.neurons,
+            exact = True,
+        )
+
+    def __getstate__(self) -> dict:
+        """
+        Pickle only the flat arrays, so that a compiled network is cheap to ship to worker processes,
+        unlike the deeply recursive object graph of the `NeuronNetwork` it came from.
+        A network memory-mapped by `load` pickles as just its path, and each unpickling maps the file again,
+        so that worker processes share the one copy in the page cache
+        """
+        if self.path is not None:
+            return {"path": self.path}
+
+        state = self.__dict__.copy()
+        state["neurons"] = None
+        state["_program"] = None
+        state["_batch_levels"] = None
+        state["_batch_levels_dtype"] = None
+        state["_bit_sliced"] = None
+        state["_generated"] = None
+        for key, value in state.items():
+            if isinstance(value, memoryview):
+                # eg the arrays shared with a network loaded by `load`, as in `to_exact`
+                state[key] = array(value.format, value)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        if state.keys() == {"path"}:
+            state = self.load(state["path"]).__dict__
+        self.__dict__.update(state)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Write the network to `path` in a compact binary format, which `load` memory-maps:
+        a header of the magic bytes `libTLnet`, format version, flags (bit 0 for exact) and the
+        array lengths, then the little endian arrays `const_values`, `biases`, `offsets`, `sources`,
+        `weights`, `level_offsets` and `output_slots`, each of 8 byte float64s or int64s,
+        with `biases` and `weights` int64s only for an exact network
+        """
+        value_typecode = "q" if self.exact else "d"
+        try:
+            sections = [
+                array("d", self.const_values),
+                array(value_typecode, self.biases),
+                array("q", self.offsets),
+                array("q", self.sources),
+                array(value_typecode, self.weights),
+                array("q", self.level_offsets),
+                array("q", self.output_slots),
+            ]
+        except OverflowError as e:
+            raise ValueError("Exact weights and thresholds too large for the file format") from e
+
+        header = _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            _FLAG_EXACT if self.exact else 0,
+            self.n_inputs,
+            len(self.const_values),
+            self.n_perceptrons,
+            self.n_edges,
+            len(self.level_offsets),
+            len(self.output_slots),
+        )
+
+        with open(path, "wb") as f:
+            f.write(header)
+            for section in sections:
+                if sys.byteorder == "big":
+                    section.byteswap()
+                f.write(section)
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], memory_map: bool = True) -> "CompiledNetwork":
+        """
+        Read a network written by `save`. With `memory_map` the arrays are read-only `memoryview`s
+        straight into the mapped file, so loading costs no more than reading the header,
+        pages are only read in as evaluation touches them, and every process mapping the same file
+        shares one physical copy. The compiled network has no `neurons`
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"{path} is not a libThresholdLogic network file")
+            if memory_map and sys.byteorder == "little":
+                buffer = memoryview(mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ))
+            else:
+                buffer = memoryview(f.read())
+
+        magic, version, flags, n_inputs, n_consts, n_perceptrons, n_edges, n_level_offsets, n_outputs = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a libThresholdLogic network file")
+        if version != _VERSION:
+            raise ValueError(f"{path} has unsupported format version {version}")
+
+        exact = bool(flags & _FLAG_EXACT)
+        value_typecode = "q" if exact else "d"
+
+        sections = []
+        position = _HEADER.size
+        for typecode, length in (
+            ("d", n_consts),
+            (value_typecode, n_perceptrons),
+            ("q", n_perceptrons + 1),
+            ("q", n_edges),
+            (value_typecode, n_edges),
+            ("q", n_level_offsets),
+            ("q", n_outputs),
+        ):
+            section = buffer[position:position + 8 * length]
+            if len(section) != 8 * length:
+                raise ValueError(f"{path} is truncated")
+            section = section.cast(typecode)
+            if sys.byteorder == "big":
+                section = array(typecode, section)
+                section.byteswap()
+            sections.append(section)
+            position += 8 * length
+
+        const_values, biases, offsets, sources, weights, level_offsets, output_slots = sections
+
+        compiled = cls(
+            n_inputs,
+            const_values.tolist(),
+            biases,
+            offsets,
+            sources,
+            weights,
+            level_offsets,
+            output_slots,
+            exact = exact,
+        )
+        if isinstance(buffer.obj, mmap.mmap):
+            compiled.path = os.fspath(path)
+        return compiled
+
+    @property
+    def program(self) -> List[Tuple[float, Tuple[float, ...], Callable[[List[float]], Sequence[float]]]]:
+        """
+        One `(bias, weights, gather)` entry per perceptron, see `_build_program`.
+        Only built when first needed, as it takes far more memory than the arrays
+        """
+        if self._program is None:
+            self._program = self._build_program()
+        return self._program
+
+    @property
+    def bit_sliced(self):
+        """
+        The `BitSlicedNetwork` of this network, built on first use
+        """
+        if self._bit_sliced is None:
+            from .BitSlicedNetwork import BitSlicedNetwork
+            self._bit_sliced = BitSlicedNetwork(self)
+        return self._bit_sliced
+
+    @property
+    def epsilon_free(self) -> bool:
+        """
+        Whether the ideal Heaviside step of `to_exact`, and so of `bit_sliced`, gives the same outputs as
+        `evaluate` and `NeuronNetwork.__call__` for every input, as it always does for an exact network,
+        and for every example network; see `util.ideal_step_agrees`. Found on first use
+        """
+        if self._epsilon_free is None:
+            self._epsilon_free = self.exact or all(self._perceptron_epsilon_free(perceptron) for perceptron in range(self.n_perceptrons))
+        return self._epsilon_free
+
+    def _perceptron_epsilon_free(self, perceptron: int) -> bool:
+        start, stop = self.offsets[perceptron], self.offsets[perceptron + 1]
+        weights = []
+        for weight, source in zip(self.weights[start:stop], self.sources[start:stop]):
+            if self.n_inputs <= source < self.first_perceptron_slot:
+                # taking a constant input as a free input of weight `weight * value` only adds sums to check
+                weights.append(Fraction(weight) * Fraction(self.const_values[source - self.n_inputs]))
+            else:
+                weights.append(weight)
+        return ideal_step_agrees(weights, self.biases[perceptron])
+
+    def output_lanes(self, input_lanes: Sequence[int], n_lanes: int) -> List[int]:
+        """
+        The lanes of the output layer for `n_lanes` input vectors packed into `input_lanes`,
+        as by `BitSlicedNetwork.output_lanes` but always with the same outputs as `__call__`:
+        by `bit_sliced` when `epsilon_free`, else lane by lane with `evaluate`
+        """
+        if self.epsilon_free:
+            return self.bit_sliced.output_lanes(input_lanes, n_lanes)
+
+        output_lanes = [0] * len(self.output_slots)
+        for k in range(n_lanes):
+            values = self.evaluate([(lane >> k) & 1 for lane in input_lanes])
+            for idx, slot in enumerate(self.output_slots):
+                if values[slot]:
+                    output_lanes[idx] |= 1 << k
+        return output_lanes
+
+    def codegen(self) -> Callable[..., Tuple[int]]:
+        """
+        The network as one generated straight-line Python function, `exec`ed once and cached,
+        taking the inputs as ints 0 or 1 and returning the outputs as a tuple of ints,
+        like `__call__` but without checking the inputs. Every perceptron is one local variable,
+        its weighted sum written out with the weights and constants as literals in the same order
+        as `Perceptron.inputs` and compared with the threshold, so outputs are identical to `__call__`.
+        The generated source is the function's `source` attribute
+        """
+        if self._generated is None:
+            source = self.codegen_source()
+            namespace = {}
+            exec(compile(source, f"<codegen {type(self).__name__} at {id(self):#x}>", "exec"), namespace)
+            self._generated = namespace["network"]
+            self._generated.source = source
+        return self._generated
+
+    def codegen_source(self) -> str:
+        """
+        The Python source of `codegen`'s function
+        """
+        def name(slot: int) -> str:
+            if slot < self.n_inputs:
+                return f"i{slot}"
+            elif slot < self.first_perceptron_slot:
+                return repr(self.const_values[slot - self.n_inputs])
+            else:
+                return f"p{slot - self.first_perceptron_slot}"
+
+        def term(weight, slot: int) -> str:
+            # multiplying an int 0 or 1 by 1.0 or -1.0 gives the same float once summed
+            if slot < self.n_inputs or slot >= self.first_perceptron_slot:
+                if weight == 1:
+                    return name(slot)
+                elif weight == -1:
+                    return f"-{name(slot)}"
+            return f"{weight!r} * {name(slot)}"
+
+        threshold = repr(0 - self.tolerance)
+        inputs = ", ".join(name(slot) for slot in range(self.n_inputs))
+
+        lines = [f"def network({inputs}):"]
+        for perceptron, (bias, start, stop) in enumerate(zip(self.biases, self.offsets, self.offsets[1:])):
+            terms = [term(weight, source) for (weight, source) in zip(self.weights[start:stop], self.sources[start:stop])]
+            if not terms:
+                terms = ["0"]
+            # the sum is split into statements of at most 100 terms, still summing left to right,
+            # lest a huge expression overflow the compiler's recursion limit
+            for chunk_start in range(0, len(terms), 100):
+                chunk = " + ".join(terms[chunk_start:chunk_start + 100])
+                if chunk_start:
+                    lines.append(f"    s = s + {chunk}")
+                else:
+                    lines.append(f"    s = {chunk}")
+            lines.append(f"    p{perceptron} = 1 if s - {bias!r} >= {threshold} else 0")
+
+        outputs = []
+        for slot in self.output_slots:
+            if self.n_inputs <= slot < self.first_perceptron_slot:
+                value = self.const_values[slot - self.n_inputs]
+                assert value in {0.0, 1.0}
+                outputs.append(repr(int(value)))
+            else:
+                outputs.append(name(slot))
+        lines.append(f"    return ({', '.join(outputs)}{',' if len(outputs) == 1 else ''})")
+
+        return "\n".join(lines) + "\n"
+
+    def _build_program(self) -> List[Tuple[float, Tuple[float, ...], Callable[[List[float]], Sequence[float]]]]:
+        """
+        Zip the flat arrays into one `(bias, weights, gather)` entry per perceptron for `evaluate`,
+        where `gather(values)` fetches the perceptron's input values in one C-level call
+        """
+        program = []
+        for bias, start, stop in zip(self.biases, self.offsets, self.offsets[1:]):
+            sources = self.sources[start:stop].tolist()
+            if len(sources) > 1:
+                gather = itemgetter(*sources)
+            else:
+                # `itemgetter` of a single item doesn't return a tuple, but of a slice it returns a list
+                gather = itemgetter(slice(sources[0], sources[0] + 1) if sources else slice(0, 0))
+            program.append((bias, tuple(self.weights[start:stop]), gather))
+
+        return program
+
+    def _build_batch_levels(self, dtype) -> list:
+        """
+        For each level, the distinct slots read by its perceptrons,
+        and a dense `(len(level_sources), len(level))` weight matrix over them, of `dtype`
+        """
+        import numpy as np
+
+        batch_levels = []
+        for level_start, level_stop in zip(self.level_offsets, self.level_offsets[1:]):
+            edge_start, edge_stop = self.offsets[level_start], self.offsets[level_stop]
+            level_sources = np.unique(np.array(self.sources[edge_start:edge_stop], dtype = np.intp))
+            rows = {source: row for (row, source) in enumerate(level_sources.tolist())}
+
+            level_weights = np.zeros((len(level_sources), level_stop - level_start), dtype = dtype)
+            for column, perceptron in enumerate(range(level_start, level_stop)):
+                for edge in range(self.offsets[perceptron], self.offsets[perceptron + 1]):
+                    level_weights[rows[self.sources[edge]], column] += self.weights[edge]
+
+            level_biases = np.array(self.biases[level_start:level_stop], dtype = dtype)
+
+            batch_levels.append((level_start, level_stop, level_sources, level_weights, level_biases))
+
+        return batch_levels
+
+    def _batch_dtype(self):
+        """
+        `float64`, or for an exact network `int64` when no sum can overflow it, else Python ints
+        """
+        import numpy as np
+
+        if not self.exact:
+            return np.float64
+
+        bound = max((
+            abs(bias) + sum(abs(weight) for weight in self.weights[start:stop])
+            for bias, start, stop in zip(self.biases, self.offsets, self.offsets[1:])
+        ), default = 0)
+
+        return np.int64 if bound < 2 ** 62 else object
+
+    @property
+    def n_perceptrons(self) -> int:
+        return len(self.biases)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.sources)
+
+    @property
+    def n_slots(self) -> int:
+        return self.n_inputs + len(self.const_values) + self.n_perceptrons
+
+    @property
+    def first_perceptron_slot(self) -> int:
+        return self.n_inputs + len(self.const_values)
+
+    @property
+    def depth(self) -> int:
+        return len(self.level_offsets) - 1
+
+    def evaluate(self, inputs: Sequence[int]) -> List[float]:
+        """
+        Evaluate every slot of the network for a sequence of 0/1 inputs, in slot order.
+        Values are floats, or ints for an exact network
+        """
+        value_type = self.value_type
+        values = [value_type(i) for i in inputs]
+        values += self.const_values
+        values += [value_type(0)] * self.n_perceptrons
+
+        slot = self.first_perceptron_slot
+        one = value_type(1)
+        threshold = 0 - self.tolerance
+        for bias, weights, gather in self.program:
+            if sum(map(mul, weights, gather(values))) - bias >= threshold:
+                values[slot] = one
+            slot += 1
+
+        return values
+
+    def __call__(self, *inputs: int) -> Tuple[int]:
+        """
+        The compiled equivalent of `NeuronNetwork.__call__`
+        """
+        assert len(inputs) == self.n_inputs
+        valid_inputs = {0, 1}
+        assert all(i in valid_inputs for i in inputs)
+
+        values = self.evaluate(inputs)
+
+        float_outputs = tuple(values[slot] for slot in self.output_slots)
+        valid_float_outputs = {0.0, 1.0}
+
+        assert all(o in valid_float_outputs for o in float_outputs)
+
+        return tuple(int(o) for o in float_outputs)
+
+    def evaluate_batch(self, inputs, chunk_size: int = None):
+        """
+        Evaluate the network on each row of `inputs`, an `(N, n_inputs)` array-like of 0s and 1s,
+        returning an `(N, len(output_slots))` `numpy.uint8` array of 0s and 1s.
+        Each level of perceptrons is evaluated for `chunk_size` rows at a time
+        as one matrix product followed by a vectorised `Perceptron.heaviside`.
+        Each chunk holds a value for every slot, so by default `chunk_size` keeps that
+        to about two million values however large the network is.
+        With non-dyadic weights the matrix product may sum in a different order to `__call__`,
+        but for 0/1 inputs and the weights of the example networks the sums are exact.
+        An exact network uses integer matrices instead
+        Requires NumPy
+        """
+        import numpy as np
+
+        inputs = np.asarray(inputs)
+        assert inputs.ndim == 2 and inputs.shape[1] == self.n_inputs
+        assert np.isin(inputs, (0, 1)).all()
+
+        if self._batch_levels is None:
+            # a pass over every edge for an exact network, so found once rather than per call
+            self._batch_levels_dtype = self._batch_dtype()
+            self._batch_levels = self._build_batch_levels(self._batch_levels_dtype)
+
+        dtype = self._batch_levels_dtype
+        first_perceptron_slot = self.first_perceptron_slot
+        output_slots = np.array(self.output_slots, dtype = np.intp)
+        outputs = np.empty((len(inputs), len(self.output_slots)), dtype = np.uint8)
+        if chunk_size is None:
+            chunk_size = max(1, 2 ** 21 // self.n_slots)
+        # reused by every chunk, the last one using only its first rows
+        all_values = np.empty((min(chunk_size, len(inputs)), self.n_slots), dtype = dtype)
+
+        for chunk_start in range(0, len(inputs), chunk_size):
+            chunk = inputs[chunk_start:chunk_start + chunk_size]
+
+            values = all_values[:len(chunk)]
+            values[:, :self.n_inputs] = chunk
+            values[:, self.n_inputs:first_perceptron_slot] = self.const_values
+
+            for level_start, level_stop, level_sources, level_weights, level_biases in self._batch_levels:
+                acc = values[:, level_sources] @ level_weights
+                values[:, first_perceptron_slot + level_start:first_perceptron_slot + level_stop] = (
+                    acc - level_biases >= 0 - self.tolerance
+                )
+
+            float_outputs = values[:, output_slots]
+            assert np.isin(float_outputs, (0.0, 1.0)).all()
+            outputs[chunk_start:chunk_start + chunk_size] = float_outputs
+
+        return outputs
+
+    def stream(self, rows: Iterable[Sequence[int]], chunk_size: int = 4096) -> Iterator[Tuple[int]]:
+        """
+        Lazily evaluate the network on each row of 0s and 1s pulled from `rows`, any iterable such as
+        a generator or file reader, yielding the output tuples in order.
+        Rows are evaluated `chunk_size` at a time, so no more than one chunk of inputs and outputs
+        is held in memory at once, by the fastest evaluator giving the same outputs as `__call__`:
+        `bit_sliced` when `epsilon_free`, else `evaluate_batch` with NumPy, or else `__call__` itself
+        """
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield from self._evaluate_chunk(chunk)
+
+    def _evaluate_chunk(self, chunk: List[Sequence[int]]) -> List[Tuple[int]]:
+        if self.epsilon_free:
+            return self.bit_sliced.evaluate_batch(chunk)
+
+        try:
+            import numpy # only needed by `evaluate_batch`
+        except ImportError:
+            return [self(*row) for row in chunk]
+        return [tuple(outputs) for outputs in self.evaluate_batch(chunk).tolist()]
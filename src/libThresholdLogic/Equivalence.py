@@ -0,0 +1,287 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+import time
+
+from .CompiledNetwork import CompiledNetwork
+
+class BDD:
+    """
+    A manager of reduced ordered binary decision diagrams over variables `0, 1, ..., n_vars - 1`,
+    tested in that order from the root down.
+    Nodes are ints: `FALSE` and `TRUE` are the terminals, and every other node is a unique
+    `(var, low, high)` triple, so two functions are equal exactly when their nodes are.
+    Operations recurse at most once per variable, so very many variables would hit the recursion limit
+    """
+    FALSE = 0
+    TRUE = 1
+
+    def __init__(self, n_vars: int) -> None:
+        self.n_vars = n_vars
+        self.nodes: List[Tuple[int, int, int]] = [(n_vars, 0, 0), (n_vars, 1, 1)] # terminals sort after every variable
+        self.unique: Dict[Tuple[int, int, int], int] = {}
+        self.computed: Dict[Tuple[int, int, int], int] = {} # memo of `ite`, which `clear_computed` empties
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def node(self, var: int, low: int, high: int) -> int:
+        """
+        The node testing `var`, going to `low` when it is 0 and to `high` when it is 1
+        """
+        if low == high:
+            return low
+        key = (var, low, high)
+        node = self.unique.get(key)
+        if node is None:
+            node = self.unique[key] = len(self.nodes)
+            self.nodes.append(key)
+        return node
+
+    def var(self, var: int) -> int:
+        return self.node(var, self.FALSE, self.TRUE)
+
+    def ite(self, f: int, g: int, h: int) -> int:
+        """
+        If `f` then `g` else `h`, from which every other operation is built
+        """
+        if f == self.TRUE:
+            return g
+        if f == self.FALSE:
+            return h
+        if g == h:
+            return g
+        if g == self.TRUE and h == self.FALSE:
+            return f
+
+        key = (f, g, h)
+        result = self.computed.get(key)
+        if result is not None:
+            return result
+
+        f_var, f0, f1 = self.nodes[f]
+        g_var, g0, g1 = self.nodes[g]
+        h_var, h0, h1 = self.nodes[h]
+        var = min(f_var, g_var, h_var)
+        # the cofactors of each function with `var` set to 0 and to 1
+        if f_var != var:
+            f0 = f1 = f
+        if g_var != var:
+            g0 = g1 = g
+        if h_var != var:
+            h0 = h1 = h
+
+        result = self.node(var, self.ite(f0, g0, h0), self.ite(f1, g1, h1))
+        self.computed[key] = result
+        return result
+
+    def negate(self, f: int) -> int:
+        return self.ite(f, self.FALSE, self.TRUE)
+
+    def xor(self, f: int, g: int) -> int:
+        return self.ite(f, self.negate(g), g)
+
+    def clear_computed(self) -> None:
+        self.computed.clear()
+
+    def threshold(self, weights: Sequence[int], inputs: Sequence[int], threshold) -> int:
+        """
+        The function `sum(weights[j] * inputs[j]) >= threshold` of the functions `inputs`,
+        built from the last input back to the first over the distinct partial sums reached,
+        a partial sum being decided as soon as the remaining weights can't bring it across `threshold`.
+        The inputs are taken in the order of their top variables, so that the innermost,
+        most often combined functions are of the variables nearest the bottom
+        """
+        terms = sorted(zip(weights, inputs), key = lambda term: self.nodes[term[1]][0])
+        weights = [weight for (weight, _) in terms]
+        inputs = [input_ for (_, input_) in terms]
+
+        n = len(weights)
+        # the greatest and least sums of the weights from `j` onwards
+        max_rest = [0] * (n + 1)
+        min_rest = [0] * (n + 1)
+        for j in reversed(range(n)):
+            max_rest[j] = max_rest[j + 1] + max(weights[j], 0)
+            min_rest[j] = min_rest[j + 1] + min(weights[j], 0)
+
+        # forwards, the undecided partial sums after each input
+        levels: List[set] = [{0}]
+        for j in range(n):
+            reached = set()
+            for partial in levels[j]:
+                for total in (partial, partial + weights[j]):
+                    if total + max_rest[j + 1] >= threshold and total + min_rest[j + 1] < threshold:
+                        reached.add(total)
+            levels.append(reached)
+
+        def decided(j: int, partial) -> Optional[int]:
+            if partial + min_rest[j] >= threshold:
+                return self.TRUE
+            if partial + max_rest[j] < threshold:
+                return self.FALSE
+            return None
+
+        # backwards, the node of each undecided partial sum
+        below: Dict[int, int] = {}
+        for j in reversed(range(n)):
+            here = {}
+            for partial in levels[j]:
+                result = decided(j, partial)
+                if result is None:
+                    low = decided(j + 1, partial)
+                    high = decided(j + 1, partial + weights[j])
+                    low = below[partial] if low is None else low
+                    high = below[partial + weights[j]] if high is None else high
+                    result = self.ite(inputs[j], high, low)
+                here[partial] = result
+            below = here
+
+        result = decided(0, 0)
+        return below[0] if result is None else result
+
+    def satisfying_assignment(self, f: int) -> Optional[Dict[int, int]]:
+        """
+        Values of the variables on one path from `f` to `TRUE`, or `None` if `f` is `FALSE`.
+        Variables not on the path may take either value
+        """
+        if f == self.FALSE:
+            return None
+        assignment = {}
+        while f != self.TRUE:
+            var, low, high = self.nodes[f]
+            # a reduced node other than `FALSE` always has a path to `TRUE`
+            if high != self.FALSE:
+                assignment[var] = 1
+                f = high
+            else:
+                assignment[var] = 0
+                f = low
+        return assignment
+
+def _compiled(network) -> CompiledNetwork:
+    if isinstance(network, CompiledNetwork):
+        return network
+    return network.compiled
+
+def variable_order(compiled: CompiledNetwork) -> List[int]:
+    """
+    A heuristic BDD variable order of the network's inputs: the order in which a depth-first walk
+    back from each output in turn first reaches them, so inputs feeding the same perceptrons
+    end up next to each other, such as the bits of equal significance of an adder's operands
+    """
+    first_perceptron_slot = compiled.first_perceptron_slot
+    order = {} # ordered set of inputs
+    visited = set()
+    for output in compiled.output_slots:
+        stack = [output]
+        while stack:
+            slot = stack.pop()
+            if slot in visited:
+                continue
+            visited.add(slot)
+            if slot < compiled.n_inputs:
+                order[slot] = None
+            elif slot >= first_perceptron_slot:
+                perceptron = slot - first_perceptron_slot
+                # reversed so that inputs are visited in order
+                stack.extend(reversed(compiled.sources[compiled.offsets[perceptron]:compiled.offsets[perceptron + 1]]))
+
+    # inputs on which no output depends go last
+    return list(order) + [slot for slot in range(compiled.n_inputs) if slot not in order]
+
+def output_functions(bdd: BDD, compiled: CompiledNetwork, levels: Sequence[int]) -> List[int]:
+    """
+    The BDD of every output of the network, input `i` being variable `levels[i]` of `bdd`.
+    Perceptrons are built in slot order from their exact integer form, see `CompiledNetwork.to_exact`
+    """
+    exact = compiled.to_exact()
+
+    functions = [bdd.var(level) for level in levels]
+    for value in exact.const_values:
+        # perceptrons have constants folded into their thresholds, so these are only read as outputs
+        functions.append(bdd.TRUE if value == 1.0 else bdd.FALSE)
+
+    for threshold, start, stop in zip(exact.biases, exact.offsets, exact.offsets[1:]):
+        inputs = [functions[source] for source in exact.sources[start:stop]]
+        functions.append(bdd.threshold(exact.weights[start:stop], inputs, threshold))
+    bdd.clear_computed()
+
+    return [functions[slot] for slot in exact.output_slots]
+
+class EquivalenceResult:
+    """
+    The outcome of `check_equivalence`; when the networks differ, `mismatched_outputs` are the indices
+    of the outputs which differ for some input, `counterexample` is an input vector on which
+    the first of them differs, and `outputs` is each network's outputs on it
+    """
+    def __init__(
+        self,
+        equivalent: bool,
+        counterexample: Optional[Tuple[int]],
+        outputs: Optional[Tuple[Tuple[int], Tuple[int]]],
+        mismatched_outputs: List[int],
+        n_nodes: int,
+        elapsed: float,
+    ) -> None:
+        self.equivalent = equivalent
+        self.counterexample = counterexample
+        self.outputs = outputs
+        self.mismatched_outputs = mismatched_outputs
+        self.n_nodes = n_nodes
+        self.elapsed = elapsed
+
+    def __bool__(self) -> bool:
+        return self.equivalent
+
+    def __str__(self) -> str:
+        if self.equivalent:
+            status = "EQUIVALENT"
+        else:
+            status = f"DIFFERENT at inputs {self.counterexample}, outputs {self.outputs[0]} vs {self.outputs[1]}"
+        return f"{status}: {self.n_nodes:_} BDD nodes in {self.elapsed:.3f}s"
+
+def check_equivalence(network_a, network_b, order: Optional[Sequence[int]] = None) -> EquivalenceResult:
+    """
+    Prove that two networks, `NeuronNetwork`s or `CompiledNetwork`s, compute the same outputs
+    for every input, or find an input on which they don't, without enumerating the inputs.
+
+    Every output of both networks is built as a reduced ordered BDD over their shared inputs,
+    each perceptron as the threshold function of its inputs' BDDs, so the networks are equivalent
+    exactly when their output nodes are identical. `order` lists the inputs from the root of the BDDs down,
+    by default `variable_order(network_a)`; BDD size, and so time, depends heavily on it.
+    Adders need their operands' bits interleaved, as the default order finds, whereas multipliers
+    are exponential in any order.
+    Perceptrons are taken in their exact integer form, the ideal Heaviside step, like `verify`
+    """
+    start_time = time.perf_counter()
+
+    compiled_a = _compiled(network_a)
+    compiled_b = _compiled(network_b)
+    if compiled_a.n_inputs != compiled_b.n_inputs:
+        raise ValueError(f"Networks have {compiled_a.n_inputs} and {compiled_b.n_inputs} inputs")
+    if len(compiled_a.output_slots) != len(compiled_b.output_slots):
+        raise ValueError(f"Networks have {len(compiled_a.output_slots)} and {len(compiled_b.output_slots)} outputs")
+
+    n_inputs = compiled_a.n_inputs
+    if order is None:
+        order = variable_order(compiled_a)
+    assert sorted(order) == list(range(n_inputs))
+    levels = [0] * n_inputs
+    for level, input_ in enumerate(order):
+        levels[input_] = level
+
+    bdd = BDD(n_inputs)
+    functions_a = output_functions(bdd, compiled_a, levels)
+    functions_b = output_functions(bdd, compiled_b, levels)
+
+    mismatched_outputs = [idx for (idx, (f, g)) in enumerate(zip(functions_a, functions_b)) if f != g]
+
+    counterexample = None
+    outputs = None
+    if mismatched_outputs:
+        idx = mismatched_outputs[0]
+        assignment = bdd.satisfying_assignment(bdd.xor(functions_a[idx], functions_b[idx]))
+        counterexample = tuple(assignment.get(levels[input_], 0) for input_ in range(n_inputs))
+        outputs = (compiled_a(*counterexample), compiled_b(*counterexample))
+
+    elapsed = time.perf_counter() - start_time
+
+    return EquivalenceResult(not mismatched_outputs, counterexample, outputs, mismatched_outputs, len(bdd), elapsed)
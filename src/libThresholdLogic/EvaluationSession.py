@@ -0,0 +1,99 @@
+from heapq import heappop, heappush
+from operator import mul
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+from .CompiledNetwork import CompiledNetwork
+
+class EvaluationSession:
+    """
+    A stateful evaluation of a `CompiledNetwork` which keeps the value of every slot between calls.
+    When some inputs change only the perceptrons in their fan-out cone are re-evaluated,
+    and only for as long as values keep changing, like the event queue of a logic simulator.
+    Perceptron slots are in topological order, so processing the queue lowest slot first
+    evaluates each perceptron at most once per update
+    """
+    def __init__(self, compiled: CompiledNetwork, inputs: Optional[Sequence[int]] = None) -> None:
+        self.compiled = compiled
+
+        # the perceptrons reading each slot
+        self.fan_out: List[List[int]] = [[] for _ in range(compiled.n_slots)]
+        for perceptron, (start, stop) in enumerate(zip(compiled.offsets, compiled.offsets[1:])):
+            for source in sorted(set(compiled.sources[start:stop])):
+                self.fan_out[source].append(perceptron)
+
+        self.n_evaluations = 0 # of perceptrons, for measuring activity
+
+        if inputs is None:
+            inputs = [0] * compiled.n_inputs
+        self._check_inputs(inputs)
+        self.values = compiled.evaluate(inputs)
+        self.n_evaluations += compiled.n_perceptrons
+
+    @staticmethod
+    def _check_inputs(inputs: Sequence[int]) -> None:
+        valid_inputs = {0, 1}
+        assert all(i in valid_inputs for i in inputs)
+
+    @property
+    def inputs(self) -> Tuple[int]:
+        return tuple(int(value) for value in self.values[:self.compiled.n_inputs])
+
+    @property
+    def outputs(self) -> Tuple[int]:
+        return tuple(int(self.values[slot]) for slot in self.compiled.output_slots)
+
+    def update(self, changes: Mapping[int, int]) -> Tuple[int]:
+        """
+        Set the inputs at the indices of `changes` to their new values,
+        propagate the changes through the network, and return the outputs
+        """
+        self._check_inputs(changes.values())
+
+        compiled = self.compiled
+        values = self.values
+        fan_out = self.fan_out
+        program = compiled.program
+        first_perceptron_slot = compiled.first_perceptron_slot
+        value_type = compiled.value_type
+        one, zero = value_type(1), value_type(0)
+        threshold = 0 - compiled.tolerance
+
+        queue: List[int] = []
+        queued = set()
+
+        def schedule(slot: int) -> None:
+            for perceptron in fan_out[slot]:
+                if perceptron not in queued:
+                    queued.add(perceptron)
+                    heappush(queue, perceptron)
+
+        for input_idx, value in changes.items():
+            assert 0 <= input_idx < compiled.n_inputs
+            value = value_type(value)
+            if values[input_idx] != value:
+                values[input_idx] = value
+                schedule(input_idx)
+
+        while queue:
+            perceptron = heappop(queue)
+            bias, weights, gather = program[perceptron]
+            value = one if sum(map(mul, weights, gather(values))) - bias >= threshold else zero
+            self.n_evaluations += 1
+
+            slot = first_perceptron_slot + perceptron
+            if values[slot] != value:
+                values[slot] = value
+                schedule(slot)
+
+        return self.outputs
+
+    def __call__(self, *inputs: int) -> Tuple[int]:
+        """
+        Evaluate the network on a whole new input vector, only propagating the inputs that differ
+        """
+        assert len(inputs) == self.compiled.n_inputs
+        return self.update({
+            input_idx: value
+            for input_idx, (value, old_value) in enumerate(zip(inputs, self.inputs))
+            if value != old_value
+        })
@@ -1,4 +1,6 @@
-from libThresholdLogic import Perceptron, ProxyNeuron, NeuronNetwork
+from typing import List, Tuple
+
+from libThresholdLogic import BaseNeuron, IntegerNetwork, Perceptron, ProxyNeuron, NeuronNetwork
 
 class HalfAdder(NeuronNetwork):
     def __init__(self) -> None:
@@ -85,7 +87,8 @@ class GenericNumberAdder(NeuronNetwork):
         self.n_bit = n_bit
         self.n_neurons = n_neurons
 
-        bit_adders = [GenericBitAdder(n_neurons) for _ in range(n_bit)]
+        # every bit adder is identical, so stamp them out from one template
+        bit_adders = [GenericBitAdder.instance(n_neurons) for _ in range(n_bit)]
 
         bit_adder_n_real_inputs = len(bit_adders[0].real_inputs)
         bit_adder_n_carry_inputs = len(bit_adders[0].carry_inputs)
@@ -113,3 +116,78 @@ class GenericNumberAdder(NeuronNetwork):
             carry_in_adder.pad_unconnected_inputs()
 
         super().__init__(input_layer, output_layer)
+
+    def integers(self) -> IntegerNetwork:
+        """
+        This adder taking and returning ints, `adder.integers()(x, y, ...)` being `x + y + ...`
+        modulo `2 ** n_bit`, and `adder.integers().stream(rows)` summing each row
+        """
+        n_numbers = len(self.input_layer) // self.n_bit
+        return IntegerNetwork(self, [self.n_bit] * n_numbers)
+
+class PrefixAdder(NeuronNetwork):
+    """
+    Adds two `n_bit` numbers with a Kogge-Stone parallel prefix carry-lookahead,
+    so its depth is `ceil(log2(n_bit)) + 2` rather than the `2 * n_bit + 1`
+    of a `GenericNumberAdder` rippling its carries.
+    The input layer is the two little bittian numbers, and the output layer their sum's `n_bit` bits,
+    followed by the carry out if `return_carry_bit`
+    """
+    @staticmethod
+    def add_neurons(x_bits: List[BaseNeuron], y_bits: List[BaseNeuron]) -> Tuple[List[Perceptron], Perceptron]:
+        """
+        Connect up the perceptrons adding the little bittian numbers `x_bits` and `y_bits`,
+        returning the sum bits and the carry out
+        """
+        n_bit = len(x_bits)
+        assert n_bit == len(y_bits) and n_bit > 0
+
+        # each bit position generates a carry when both bits are 1, and propagates one when either is
+        generate = [Perceptron(1.5, [(1.0, x), (1.0, y)]) for (x, y) in zip(x_bits, y_bits)]
+        propagate = [Perceptron(0.5, [(1.0, x), (1.0, y)]) for (x, y) in zip(x_bits, y_bits)]
+
+        # after the level combining spans of `distance` bits, `generate[i]` is whether bits `[i - 2 * distance + 1, i]`
+        # generate a carry, which is whether the upper half does, or propagates one that the lower half generates
+        distance = 1
+        while distance < n_bit:
+            next_generate = generate[:]
+            next_propagate = propagate[:]
+            for i in range(distance, n_bit):
+                next_generate[i] = Perceptron(1.5, [(2.0, generate[i]), (1.0, propagate[i]), (1.0, generate[i - distance])])
+                if i >= 2 * distance:
+                    # only needed by the next level
+                    next_propagate[i] = Perceptron(1.5, [(1.0, propagate[i]), (1.0, propagate[i - distance])])
+            generate = next_generate
+            propagate = next_propagate
+            distance *= 2
+
+        # `generate[i]` is now the carry out of bit `i`, so as in `FullAdder`
+        # each sum bit is 1 when an odd number of `x`, `y` and carry in are 1
+        sum_bits = []
+        for i, (x, y) in enumerate(zip(x_bits, y_bits)):
+            neuron_sum = Perceptron(0.5, [(1.0, x), (1.0, y), (-2.0, generate[i])])
+            if i:
+                neuron_sum.add_input(1.0, generate[i - 1])
+            sum_bits.append(neuron_sum)
+
+        return sum_bits, generate[-1]
+
+    def __init__(self, n_bit: int, return_carry_bit: bool = False) -> None:
+        self.n_bit = n_bit
+
+        input_layer = [ProxyNeuron() for _ in range(2 * n_bit)]
+
+        sum_bits, carry_out = self.add_neurons(input_layer[:n_bit], input_layer[n_bit:])
+
+        if return_carry_bit:
+            output_layer = sum_bits + [carry_out]
+        else:
+            output_layer = sum_bits
+
+        super().__init__(input_layer, output_layer)
+
+    def integers(self) -> IntegerNetwork:
+        """
+        This adder taking and returning ints, see `GenericNumberAdder.integers`
+        """
+        return IntegerNetwork(self, (self.n_bit, self.n_bit))
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import List, Sequence, Tuple, Union
 
 from libThresholdLogic import Perceptron, ProxyNeuron, NeuronNetwork
 
@@ -17,7 +17,7 @@ class HammingGate(NeuronNetwork):
 
         n_inputs = len(target_vector)
 
-        bias = (2 * sum(target_vector) - 2 * max_distance - 1) / 2
+        bias = self.bias_of(target_vector, max_distance)
 
         neuron = Perceptron(bias) # the things we can achieve with just 1 perceptron!
 
@@ -31,6 +31,13 @@ class HammingGate(NeuronNetwork):
 
         super().__init__(input_layer, output_layer)
 
+    @staticmethod
+    def bias_of(target_vector: Tuple[int], max_distance: int) -> float:
+        """
+        The bias of the perceptron, whose weighted sum is `sum(target_vector)` less the input's distance
+        """
+        return (2 * sum(target_vector) - 2 * max_distance - 1) / 2
+
 # XXX GAND and GNAND arguments could be styled in Latin like
 # centri'petal' (seek) and centri'fugal' (flee)
 
@@ -141,3 +148,179 @@ class XNOR(NeuronNetwork):
             output_layer = neurons[:1]
 
         super().__init__(input_layer, output_layer)
+
+class HammingGateBank:
+    """
+    Many `HammingGate`s over the same inputs evaluated all at once, for classifying an input
+    against thousands of Hamming balls without building or calling a network per ball.
+
+    Each target vector is packed into one int, bit `i` being `target_vector[i]`, so the distance
+    of a packed input to every target is an XOR and a popcount per target; the batched methods
+    do the same with NumPy over packed `uint64` matrices of all the inputs and targets.
+    Each gate's `max_distance` is turned into the greatest distance for which that gate's perceptron,
+    with its bias from `HammingGate.bias_of` and `Perceptron.heaviside`, outputs 1, so memberships are
+    exactly the outputs of the corresponding `HammingGate`s, even for non-integer `max_distance`s
+    """
+    def __init__(self, target_vectors: Sequence[Tuple[int]], max_distances: Union[int, Sequence[int]]) -> None:
+        self.target_vectors = [tuple(target_vector) for target_vector in target_vectors]
+        if isinstance(max_distances, (int, float)):
+            max_distances = [max_distances] * len(self.target_vectors)
+        self.max_distances = list(max_distances)
+        assert len(self.max_distances) == len(self.target_vectors)
+
+        assert self.target_vectors
+        self.n_bits = len(self.target_vectors[0])
+        assert all(len(target_vector) == self.n_bits for target_vector in self.target_vectors)
+        assert all(bit in {0, 1} for target_vector in self.target_vectors for bit in target_vector)
+
+        self.targets = [self.pack(target_vector) for target_vector in self.target_vectors]
+        self.limits = [
+            self.distance_limit(target_vector, max_distance)
+            for (target_vector, max_distance) in zip(self.target_vectors, self.max_distances)
+        ]
+
+        self._packed_targets = None # built on first use by the batched methods
+
+    @classmethod
+    def from_gates(cls, gates: Sequence[HammingGate]) -> "HammingGateBank":
+        """
+        The bank of existing `HammingGate`s, including `GAND`s, `AND`s and their kin
+        """
+        return cls([gate.target_vector for gate in gates], [gate.max_distance for gate in gates])
+
+    @staticmethod
+    def pack(bits: Sequence[int]) -> int:
+        return int("".join("1" if bit else "0" for bit in reversed(bits)) or "0", 2)
+
+    def distance_limit(self, target_vector: Tuple[int], max_distance: int) -> int:
+        """
+        The greatest distance from `target_vector` at which its `HammingGate` outputs 1, or -1 if none
+        """
+        bias = HammingGate.bias_of(target_vector, max_distance)
+        n_ones = sum(target_vector)
+
+        def contains(distance: int) -> bool:
+            # the gate's weighted sum, of +-1.0 weights, is an exact float
+            return Perceptron.heaviside(float(n_ones - distance) - bias) == 1.0
+
+        limit = min(max(int(n_ones - bias), -1), self.n_bits)
+        while limit < self.n_bits and contains(limit + 1):
+            limit += 1
+        while limit >= 0 and not contains(limit):
+            limit -= 1
+        return limit
+
+    @property
+    def n_targets(self) -> int:
+        return len(self.targets)
+
+    def distances(self, inputs: Sequence[int]) -> List[int]:
+        """
+        The Hamming distance of one input vector to every target
+        """
+        assert len(inputs) == self.n_bits
+        packed = self.pack(inputs)
+        return [bin(packed ^ target).count("1") for target in self.targets]
+
+    def __call__(self, *inputs: int) -> Tuple[int]:
+        """
+        The output of every gate for one input vector, 1 when it's within the gate's ball, else 0
+        """
+        valid_inputs = {0, 1}
+        assert all(i in valid_inputs for i in inputs)
+        return tuple(int(distance <= limit) for (distance, limit) in zip(self.distances(inputs), self.limits))
+
+    def nearest(self, inputs: Sequence[int], within_ball: bool = False) -> Tuple[int, int]:
+        """
+        The index of the nearest target to one input vector, the lowest index of any ties, and its distance.
+        With `within_ball` only targets whose ball contains the input are considered, giving `(-1, -1)` if none do
+        """
+        best = (-1, -1)
+        for idx, (distance, limit) in enumerate(zip(self.distances(inputs), self.limits)):
+            if within_ball and distance > limit:
+                continue
+            if best[0] == -1 or distance < best[1]:
+                best = (idx, distance)
+        return best
+
+    def _pack_rows(self, rows):
+        """
+        An `(N, n_words)` `uint64` matrix of each row's bits, bit `i` of the row being bit `i % 64` of word `i // 64`
+        """
+        import numpy as np
+
+        n_words = max(1, (self.n_bits + 63) // 64)
+        packed = np.packbits(np.asarray(rows, dtype = np.uint8).reshape(-1, self.n_bits), axis = 1, bitorder = "little")
+        padded = np.zeros((len(packed), 8 * n_words), dtype = np.uint8)
+        padded[:, :packed.shape[1]] = packed
+        return padded.view("<u8")
+
+    def distance_matrix(self, inputs, chunk_size: int = None):
+        """
+        The `(N, n_targets)` matrix of the Hamming distance of each row of `inputs`, an `(N, n_bits)`
+        array-like of 0s and 1s, to each target, by XORing packed words and counting their bits.
+        Rows are processed `chunk_size` at a time, by default enough to keep each XOR to a few million words
+        Requires NumPy
+        """
+        import numpy as np
+
+        inputs = np.asarray(inputs)
+        assert inputs.ndim == 2 and inputs.shape[1] == self.n_bits
+        assert np.isin(inputs, (0, 1)).all()
+
+        if self._packed_targets is None:
+            self._packed_targets = self._pack_rows(self.target_vectors)
+        targets = self._packed_targets
+        rows = self._pack_rows(inputs)
+
+        n_words = targets.shape[1]
+        if chunk_size is None:
+            chunk_size = max(1, 2 ** 22 // max(1, self.n_targets * n_words))
+
+        if hasattr(np, "bitwise_count"):
+            popcount = np.bitwise_count
+        else:
+            table = np.array([bin(byte).count("1") for byte in range(256)], dtype = np.uint8)
+            def popcount(words):
+                return table[words.view(np.uint8)].reshape(words.shape + (8,)).sum(axis = -1, dtype = np.uint8)
+
+        distances = np.empty((len(rows), self.n_targets), dtype = np.int64)
+        for chunk_start in range(0, len(rows), chunk_size):
+            chunk = rows[chunk_start:chunk_start + chunk_size]
+            distances[chunk_start:chunk_start + chunk_size] = (
+                popcount(chunk[:, None, :] ^ targets[None, :, :]).sum(axis = 2, dtype = np.int64)
+            )
+
+        return distances
+
+    def evaluate_batch(self, inputs, chunk_size: int = None):
+        """
+        The `(N, n_targets)` `numpy.uint8` membership matrix of each row of `inputs` in each gate's ball,
+        the output of every gate on every row; see `distance_matrix`
+        Requires NumPy
+        """
+        import numpy as np
+
+        limits = np.array(self.limits, dtype = np.int64)
+        return (self.distance_matrix(inputs, chunk_size) <= limits).astype(np.uint8)
+
+    def nearest_batch(self, inputs, within_ball: bool = False, chunk_size: int = None):
+        """
+        For each row of `inputs`, the index of the nearest target and its distance, as two arrays;
+        see `nearest` and `distance_matrix`
+        Requires NumPy
+        """
+        import numpy as np
+
+        distances = self.distance_matrix(inputs, chunk_size)
+        if within_ball:
+            outside = distances > np.array(self.limits, dtype = np.int64)
+            distances = np.where(outside, self.n_bits + 1, distances)
+
+        indices = distances.argmin(axis = 1) # the first minimum, so the lowest index of any ties
+        nearest_distances = distances[np.arange(len(distances)), indices]
+        if within_ball:
+            none = nearest_distances > self.n_bits
+            indices = np.where(none, -1, indices)
+            nearest_distances = np.where(none, -1, nearest_distances)
+        return indices.astype(np.int64), nearest_distances.astype(np.int64)
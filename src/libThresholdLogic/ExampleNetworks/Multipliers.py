@@ -1,8 +1,8 @@
 from typing import List, Tuple
 import math
 
-from libThresholdLogic import ProxyNeuron, NeuronNetwork
-from .Adders import GenericBitAdder
+from libThresholdLogic import ConstNeuron, IntegerNetwork, ProxyNeuron, NeuronNetwork
+from .Adders import GenericBitAdder, PrefixAdder
 from .LogicGates import AND, GAND, XOR
 
 class BitMultiplier2x2(NeuronNetwork):
@@ -93,7 +93,8 @@ class GenericBitMultiplier(NeuronNetwork):
         input_neurons_x = input_layer[:n_bit]
         input_neurons_y = input_layer[n_bit:]
 
-        adders = [GenericBitAdder(n) for n in self.n_neurons_per_adder(n_bit)]
+        # adders of the same size, and all of the AND gates, are stamped out from templates
+        adders = [GenericBitAdder.instance(n) for n in self.n_neurons_per_adder(n_bit)]
 
         convolution_indices = self.convolution_indices(n_bit)
 
@@ -101,7 +102,7 @@ class GenericBitMultiplier(NeuronNetwork):
             # there is often less convol_indices than adders
             # the last adders are purely for carry bits
             for input_neurons_x_idx, input_neurons_y_idx in convol_indices:
-                and_gate = AND()
+                and_gate = AND.instance()
                 and_gate.connect_inputs(input_neurons_x[input_neurons_x_idx], input_neurons_y[input_neurons_y_idx])
                 adder.connect_inputs(and_gate.output_layer[0])
 
@@ -116,3 +117,104 @@ class GenericBitMultiplier(NeuronNetwork):
         output_layer = [adder.real_output for adder in adders]
 
         super().__init__(input_layer, output_layer)
+
+    def integers(self) -> IntegerNetwork:
+        """
+        This multiplier taking and returning ints, `mult.integers()(x, y)` being `x * y`,
+        and `mult.integers().stream(rows)` multiplying each pair
+        """
+        return IntegerNetwork(self, (self.n_bit, self.n_bit))
+
+class WallaceTreeMultiplier(NeuronNetwork):
+    """
+    Multiplies two `n_bit` numbers by reducing the partial products in a Wallace tree
+    of `GenericBitAdder(n_neurons)` compressors, each counting up to `2 ** n_neurons - 1` bits
+    of the same place value, then adding the final two rows with a `PrefixAdder`.
+    As in Dadda's scheme, each stage only compresses as many bits as it takes to bring
+    every column down to the next of a shrinking sequence of heights, and the reduction stops
+    once no column holds more than two bits.
+    Every stage shrinks the columns by a constant factor, so the depth grows
+    logarithmically with `n_bit`, unlike `GenericBitMultiplier`'s ripple carries.
+    The input and output layers are as `GenericBitMultiplier`'s, with `2 * n_bit` output bits
+    """
+    def __init__(self, n_bit: int, n_neurons: int = 2) -> None:
+        assert n_neurons >= 2
+
+        self.n_bit = n_bit
+        self.n_neurons = n_neurons
+
+        input_layer = [ProxyNeuron() for _ in range(2 * n_bit)]
+        input_neurons_x = input_layer[:n_bit]
+        input_neurons_y = input_layer[n_bit:]
+
+        # the bits of each place value, starting with the partial products
+        n_columns = 2 * n_bit
+        columns = [[] for _ in range(n_columns)]
+        for x_idx, x in enumerate(input_neurons_x):
+            for y_idx, y in enumerate(input_neurons_y):
+                and_gate = AND.instance()
+                and_gate.connect_inputs(x, y)
+                columns[x_idx + y_idx].append(and_gate.output_layer[0])
+
+        max_group = 2 ** n_neurons - 1
+
+        # Dadda's column heights, each about the most that compressors of `max_group` bits,
+        # each leaving one bit in its column and `n_neurons - 1` carries in the columns above,
+        # can reduce to the one before it in one stage
+        heights = [2]
+        while heights[-1] < max(len(column) for column in columns):
+            heights.append(heights[-1] * max_group // n_neurons)
+
+        self.n_stages = 0
+        while max(len(column) for column in columns) > 2:
+            target = max(height for height in heights if height < max(len(column) for column in columns))
+
+            next_columns = [[] for _ in range(n_columns)]
+            for place, column in enumerate(columns):
+                # the carries of this stage's compressors in the columns below are already in `next_columns[place]`
+                idx = 0
+                while len(column) - idx >= 2 and len(column) - idx + len(next_columns[place]) > target:
+                    excess = len(column) - idx + len(next_columns[place]) - target
+                    # compressing `excess + 1` bits leaves one in their place
+                    group = column[idx:idx + min(max_group, excess + 1)]
+                    idx += len(group)
+
+                    compressor = GenericBitAdder.instance(len(group).bit_length())
+                    compressor.connect_inputs(*group)
+                    compressor.pad_unconnected_inputs()
+
+                    for bit, neuron in enumerate([compressor.real_output] + compressor.carry_outputs):
+                        # the product has `2 * n_bit` bits, so any carries beyond are always 0
+                        if place + bit < n_columns:
+                            next_columns[place + bit].append(neuron)
+
+                # the rest of the column passes through to the next stage
+                next_columns[place] += column[idx:]
+
+            columns = next_columns
+            self.n_stages += 1
+
+        # the columns below the first holding two bits, and any above the last holding a bit but for
+        # the final carry out, need no adding
+        paired = [place for (place, column) in enumerate(columns) if len(column) == 2]
+        if paired:
+            low = paired[0]
+            high = max(place for (place, column) in enumerate(columns) if column) + 1
+            zero = ConstNeuron(0.0)
+            x_row = [column[0] for column in columns[low:high]]
+            y_row = [column[1] if len(column) > 1 else zero for column in columns[low:high]]
+            sum_bits, carry_out = PrefixAdder.add_neurons(x_row, y_row)
+            columns[low:high] = [[neuron] for neuron in sum_bits]
+            if high < n_columns:
+                columns[high] = [carry_out]
+
+        zero = ConstNeuron(0.0)
+        output_layer = [column[0] if column else zero for column in columns]
+
+        super().__init__(input_layer, output_layer)
+
+    def integers(self) -> IntegerNetwork:
+        """
+        This multiplier taking and returning ints, see `GenericBitMultiplier.integers`
+        """
+        return IntegerNetwork(self, (self.n_bit, self.n_bit))
@@ -1,4 +1,7 @@
-from .Adders import HalfAdder, FullAdder, GenericBitAdder, GenericNumberAdder
-from .LogicGates import HammingGate, GAND, GNAND, AND, NOR, NAND, OR, NOT, XOR, XNOR
-from .Multipliers import BitMultiplier2x2, GenericBitMultiplier
-from .util import int_to_bit_tuple_lb, int_to_bit_tuple_bb, bit_tuple_lb_to_int, bit_tuple_bb_to_int
+from .Adders import HalfAdder, FullAdder, GenericBitAdder, GenericNumberAdder, PrefixAdder
+from .LogicGates import HammingGate, HammingGateBank, GAND, GNAND, AND, NOR, NAND, OR, NOT, XOR, XNOR
+from .Multipliers import BitMultiplier2x2, GenericBitMultiplier, WallaceTreeMultiplier
+from .util import (
+    int_to_bit_tuple_lb, int_to_bit_tuple_bb, bit_tuple_lb_to_int, bit_tuple_bb_to_int,
+    ints_to_bit_tuple_lb, ints_to_bit_matrix, bit_matrix_to_ints,
+)
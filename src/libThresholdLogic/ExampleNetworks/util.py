@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Sequence, Tuple
 
 # 'bittian' inspired by 'endian'ness
 # enumerating the bits of a binary number in little bittian form corresponds to
@@ -7,10 +7,10 @@ from typing import Tuple
 
 def int_to_bit_tuple_lb(x: int, n_bits: int) -> Tuple[int]:
     """First `n_bits` of x in little bittian"""
-    return tuple((
-        1 if x & (1 << bit_n) else 0
-        for bit_n in range(n_bits)
-    ))
+    if n_bits <= 0:
+        return ()
+    # one C-level conversion to a binary string rather than a Python step per bit
+    return tuple(map(int, format(x & ((1 << n_bits) - 1), f"0{n_bits}b")[::-1]))
 
 def int_to_bit_tuple_bb(x: int, n_bits: int) -> Tuple[int]:
     """First `n_bits` of x in big bittian"""
@@ -18,11 +18,92 @@ def int_to_bit_tuple_bb(x: int, n_bits: int) -> Tuple[int]:
 
 def bit_tuple_lb_to_int(t: Tuple[int]) -> int:
     """Little bittian tuple to int"""
-    return sum((
-        2 ** idx if bit else 0
-        for (idx, bit) in enumerate(t)
-    ))
+    return int("".join("1" if bit else "0" for bit in reversed(t)) or "0", 2)
 
 def bit_tuple_bb_to_int(t: Tuple[int]) -> int:
     """Big bittian tuple to int"""
     return bit_tuple_lb_to_int(t[::-1])
+
+def ints_to_bit_tuple_lb(xs: Sequence[int], n_bits: int) -> Tuple[int]:
+    """
+    The concatenation of the first `n_bits` of each of `xs` in little bittian,
+    the input layer order of for example `GenericNumberAdder`, in linear time
+    """
+    mask = (1 << n_bits) - 1
+    packed = 0
+    for idx, x in enumerate(xs):
+        packed |= (x & mask) << (idx * n_bits)
+    return int_to_bit_tuple_lb(packed, len(xs) * n_bits)
+
+# batched codecs, between columns of ints and `(N, n_bits)` NumPy matrices of 0s and 1s,
+# one row per input vector as read by `NeuronNetwork.evaluate_batch`
+
+def ints_to_bit_matrix(columns: Sequence, widths: Sequence[int]):
+    """
+    A `(N, sum(widths))` `numpy.uint8` matrix of 0s and 1s whose row `k` is the concatenation
+    of the `widths[i]` bits of `columns[i][k]` in little bittian for each operand `i`,
+    in the input layer order of `GenericNumberAdder` and `GenericBitMultiplier`.
+    Each column is an array-like of `N` non-negative ints; NumPy integer arrays are converted
+    without a Python step per value, and Python ints of any width are supported.
+    Raises `ValueError` for operands which don't fit in their width
+    Requires NumPy
+    """
+    import numpy as np
+
+    assert len(columns) == len(widths)
+
+    blocks = []
+    for column, n_bits in zip(columns, widths):
+        if isinstance(column, np.ndarray) and column.dtype.kind in "iu" and n_bits <= 64:
+            if (column < 0).any():
+                raise ValueError("Operands must be non-negative")
+            # the little endian bytes of each value, unpacked least significant bit first
+            column_bytes = column.astype("<u8").reshape(-1, 1).view(np.uint8)
+        else:
+            n_bytes = max(1, (n_bits + 7) // 8)
+            column = [int(x) for x in column]
+            try:
+                packed = b"".join(x.to_bytes(n_bytes, "little") for x in column)
+            except OverflowError as e:
+                raise ValueError(f"Operand doesn't fit in {n_bits} bits") from e
+            column_bytes = np.frombuffer(packed, dtype = np.uint8).reshape(len(column), n_bytes)
+
+        bits = np.unpackbits(column_bytes, axis = 1, bitorder = "little")
+        if bits[:, n_bits:].any():
+            raise ValueError(f"Operand doesn't fit in {n_bits} bits")
+        blocks.append(bits[:, :n_bits])
+
+    if not blocks:
+        return np.zeros((0, 0), dtype = np.uint8)
+    return np.concatenate(blocks, axis = 1)
+
+def bit_matrix_to_ints(matrix, widths: Sequence[int] = None) -> list:
+    """
+    The inverse of `ints_to_bit_matrix`, splitting each row of a matrix of 0s and 1s
+    into little bittian operands of `widths` bits, by default one operand of the whole row
+    such as the output layer of `GenericNumberAdder` or `GenericBitMultiplier`.
+    Returns one NumPy array per operand, of `uint64` for operands up to 64 bits
+    or else of Python ints
+    Requires NumPy
+    """
+    import numpy as np
+
+    matrix = np.asarray(matrix, dtype = np.uint8)
+    assert matrix.ndim == 2
+    if widths is None:
+        widths = (matrix.shape[1],)
+    assert sum(widths) == matrix.shape[1]
+
+    columns = []
+    start = 0
+    for n_bits in widths:
+        packed = np.packbits(matrix[:, start:start + n_bits], axis = 1, bitorder = "little")
+        start += n_bits
+        if n_bits <= 64:
+            padded = np.zeros((len(matrix), 8), dtype = np.uint8)
+            padded[:, :packed.shape[1]] = packed
+            columns.append(padded.view("<u8").reshape(-1).astype(np.uint64))
+        else:
+            columns.append(np.array([int.from_bytes(row.tobytes(), "little") for row in packed], dtype = object))
+
+    return columns
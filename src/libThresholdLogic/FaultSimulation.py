@@ -0,0 +1,303 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+import multiprocessing
+import os
+import time
+
+from .CompiledNetwork import CompiledNetwork
+from .Neurons import BaseNeuron
+
+class Gaussian:
+    """
+    Normally distributed noise of standard deviation `sigma`, added to each value,
+    or with `relative` scaling each value by `1 + noise`
+    """
+    def __init__(self, sigma: float, relative: bool = False) -> None:
+        self.sigma = sigma
+        self.relative = relative
+
+    def __call__(self, rng, values):
+        noise = rng.normal(0.0, self.sigma, values.shape)
+        return values * (1.0 + noise) if self.relative else values + noise
+
+    def __repr__(self) -> str:
+        return f"Gaussian({self.sigma!r}, relative = {self.relative})"
+
+class Uniform:
+    """
+    Noise uniformly distributed in `[-half_width, half_width)`, added to each value,
+    or with `relative` scaling each value by `1 + noise`
+    """
+    def __init__(self, half_width: float, relative: bool = False) -> None:
+        self.half_width = half_width
+        self.relative = relative
+
+    def __call__(self, rng, values):
+        noise = rng.uniform(-self.half_width, self.half_width, values.shape)
+        return values * (1.0 + noise) if self.relative else values + noise
+
+    def __repr__(self) -> str:
+        return f"Uniform({self.half_width!r}, relative = {self.relative})"
+
+class NoiseModel:
+    """
+    The imperfections of the hardware a network runs on, sampled afresh for every trial:
+    - `bias` and `weight` perturb every perceptron's bias and every edge's weight, as `Gaussian` or `Uniform`
+      or any callable taking a `numpy.random.Generator` and an array of values and returning them perturbed;
+      `None` leaves them exact
+    - each perceptron is stuck at 0 with probability `stuck_at_0`, or else stuck at 1 with probability `stuck_at_1`,
+      outputting that whatever its inputs
+    """
+    def __init__(
+        self,
+        bias: Optional[Callable] = None,
+        weight: Optional[Callable] = None,
+        stuck_at_0: float = 0.0,
+        stuck_at_1: float = 0.0,
+    ) -> None:
+        assert 0.0 <= stuck_at_0 and 0.0 <= stuck_at_1 and stuck_at_0 + stuck_at_1 <= 1.0
+        self.bias = bias
+        self.weight = weight
+        self.stuck_at_0 = stuck_at_0
+        self.stuck_at_1 = stuck_at_1
+
+    def __repr__(self) -> str:
+        return f"NoiseModel(bias = {self.bias!r}, weight = {self.weight!r}, stuck_at_0 = {self.stuck_at_0!r}, stuck_at_1 = {self.stuck_at_1!r})"
+
+class FaultSimulationResult:
+    """
+    The outcome of `simulate_faults`, accumulated over `n_trials` trials:
+    - `bit_errors[j]` counts the trials in which output `j` differed from the ideal network's
+    - `word_errors` counts the trials in which any output differed
+    - `fault_counts[p]` counts the trials in which perceptron `p` was stuck,
+      and `fault_errors[p]` those of them in which any output differed
+    """
+    def __init__(
+        self,
+        compiled: CompiledNetwork,
+        n_trials: int,
+        bit_errors: List[int],
+        word_errors: int,
+        fault_counts: List[int],
+        fault_errors: List[int],
+        elapsed: float,
+    ) -> None:
+        self.compiled = compiled
+        self.n_trials = n_trials
+        self.bit_errors = bit_errors
+        self.word_errors = word_errors
+        self.fault_counts = fault_counts
+        self.fault_errors = fault_errors
+        self.elapsed = elapsed
+
+    @property
+    def bit_error_rates(self) -> List[float]:
+        return [errors / self.n_trials for errors in self.bit_errors]
+
+    @property
+    def word_error_rate(self) -> float:
+        return self.word_errors / self.n_trials
+
+    @property
+    def trials_per_second(self) -> float:
+        return self.n_trials / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def sensitivity(self, perceptron: int) -> Optional[float]:
+        """
+        The error rate of the trials in which perceptron `p` was stuck, or `None` if it never was
+        """
+        if not self.fault_counts[perceptron]:
+            return None
+        return self.fault_errors[perceptron] / self.fault_counts[perceptron]
+
+    def most_sensitive(self, n: int = 10, min_faults: int = 1) -> List[Tuple[int, Optional[BaseNeuron], float, int]]:
+        """
+        The `n` perceptrons whose faults most often gave wrong outputs, among those stuck in at least
+        `min_faults` trials, as `(slot, neuron, sensitivity, n_faults)`, `neuron` being the original
+        neuron of the slot if the compiled network kept them, else `None`
+        """
+        ranked = sorted(
+            (perceptron for perceptron in range(len(self.fault_counts)) if self.fault_counts[perceptron] >= max(min_faults, 1)),
+            key = lambda perceptron: (-self.sensitivity(perceptron), perceptron),
+        )
+        first_perceptron_slot = self.compiled.first_perceptron_slot
+        neurons = self.compiled.neurons
+        return [(
+            first_perceptron_slot + perceptron,
+            neurons[first_perceptron_slot + perceptron] if neurons is not None else None,
+            self.sensitivity(perceptron),
+            self.fault_counts[perceptron],
+        ) for perceptron in ranked[:n]]
+
+    def __str__(self) -> str:
+        lines = [
+            f"{self.n_trials:_} trials in {self.elapsed:.3f}s ({self.trials_per_second:_.0f} trials/sec)",
+            f"word error rate: {self.word_error_rate:.6f}",
+            "bit error rates: " + " ".join(f"{rate:.6f}" for rate in self.bit_error_rates),
+        ]
+        most_sensitive = self.most_sensitive(5)
+        if most_sensitive:
+            lines.append("most sensitive perceptrons: " + ", ".join(
+                f"slot {slot} ({sensitivity:.3f} of {n_faults:_} faults)" for (slot, _, sensitivity, n_faults) in most_sensitive
+            ))
+        return "\n".join(lines)
+
+def _simulation_levels(compiled: CompiledNetwork) -> list:
+    """
+    For each level of perceptrons, the sources and weights of its edges as NumPy arrays,
+    and the offsets of each perceptron's edges within them, for `numpy.add.reduceat`
+    """
+    import numpy as np
+
+    levels = []
+    for level_start, level_stop in zip(compiled.level_offsets, compiled.level_offsets[1:]):
+        edge_start, edge_stop = compiled.offsets[level_start], compiled.offsets[level_stop]
+        sources = np.array(compiled.sources[edge_start:edge_stop], dtype = np.intp)
+        weights = np.array(compiled.weights[edge_start:edge_stop], dtype = np.float64)
+        offsets = np.array(compiled.offsets[level_start:level_stop], dtype = np.intp) - edge_start
+        n_edges = np.diff(np.append(offsets, edge_stop - edge_start))
+        biases = np.array(compiled.biases[level_start:level_stop], dtype = np.float64)
+        levels.append((level_start, level_stop, sources, weights, offsets, n_edges > 0, biases))
+
+    return levels
+
+def _simulate_chunk(compiled: CompiledNetwork, levels: list, noise: NoiseModel, n_trials: int, seed_sequence) -> Tuple:
+    """
+    Simulate `n_trials` trials with the generator of `seed_sequence`, each on its own uniformly random
+    input vector with its own noise and faults, evaluated level by level over every trial at once.
+    Returns the counts of `FaultSimulationResult` for these trials, as NumPy arrays
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed_sequence)
+
+    inputs = rng.integers(0, 2, (n_trials, compiled.n_inputs), dtype = np.uint8)
+    expected = compiled.evaluate_batch(inputs)
+
+    first_perceptron_slot = compiled.first_perceptron_slot
+    stuck_at_0, stuck_at_1 = noise.stuck_at_0, noise.stuck_at_1
+
+    values = np.empty((n_trials, compiled.n_slots), dtype = np.float64)
+    values[:, :compiled.n_inputs] = inputs
+    values[:, compiled.n_inputs:first_perceptron_slot] = compiled.const_values
+    faulted = np.zeros((n_trials, compiled.n_perceptrons), dtype = bool)
+
+    for level_start, level_stop, sources, weights, offsets, has_edges, biases in levels:
+        n_perceptrons = level_stop - level_start
+
+        acc = np.zeros((n_trials, n_perceptrons), dtype = np.float64)
+        if len(sources):
+            trial_weights = np.broadcast_to(weights, (n_trials, len(weights)))
+            if noise.weight is not None:
+                trial_weights = noise.weight(rng, trial_weights)
+            products = values[:, sources] * trial_weights
+            # `reduceat` gives the element at the offset of a perceptron without edges, rather than 0
+            acc[:, has_edges] = np.add.reduceat(products, offsets[has_edges], axis = 1)
+
+        trial_biases = np.broadcast_to(biases, (n_trials, n_perceptrons))
+        if noise.bias is not None:
+            trial_biases = noise.bias(rng, trial_biases)
+
+        outputs = acc - trial_biases >= 0 - compiled.tolerance
+
+        if stuck_at_0 or stuck_at_1:
+            u = rng.random((n_trials, n_perceptrons))
+            stuck_0 = u < stuck_at_0
+            stuck_1 = (u >= stuck_at_0) & (u < stuck_at_0 + stuck_at_1)
+            outputs[stuck_0] = False
+            outputs[stuck_1] = True
+            faulted[:, level_start:level_stop] = stuck_0 | stuck_1
+
+        values[:, first_perceptron_slot + level_start:first_perceptron_slot + level_stop] = outputs
+
+    actual = values[:, np.array(compiled.output_slots, dtype = np.intp)]
+    errors = actual != expected
+    word_errors = errors.any(axis = 1)
+
+    return (
+        errors.sum(axis = 0, dtype = np.int64),
+        int(word_errors.sum()),
+        faulted.sum(axis = 0, dtype = np.int64),
+        (faulted & word_errors[:, None]).sum(axis = 0, dtype = np.int64),
+    )
+
+# per worker process state, set up once by `_init_worker` rather than shipped with every chunk
+_worker_state = None
+
+def _init_worker(compiled: CompiledNetwork, noise: NoiseModel) -> None:
+    global _worker_state
+    _worker_state = (compiled, _simulation_levels(compiled), noise)
+
+def _simulate_worker_chunk(n_trials: int, seed_sequence) -> Tuple:
+    compiled, levels, noise = _worker_state
+    return _simulate_chunk(compiled, levels, noise, n_trials, seed_sequence)
+
+def simulate_faults(
+    network,
+    noise: NoiseModel,
+    n_trials: int,
+    seed: int = 0,
+    n_workers: Optional[int] = None,
+    chunk_size: int = 4096,
+) -> FaultSimulationResult:
+    """
+    Monte Carlo estimate of how often `network`, a `NeuronNetwork` or `CompiledNetwork`, gives
+    wrong outputs on imperfect hardware described by `noise`, compared to the ideal network.
+
+    Every trial evaluates one uniformly random input vector with freshly sampled perturbations of every bias
+    and weight, and freshly sampled stuck-at faults. Trials are simulated `chunk_size` at a time as NumPy
+    arrays, each level of perceptrons at once across the chunk, so millions of trials are practical.
+    Chunks are farmed out to a pool of `n_workers` processes (by default one per CPU) as by `verify`.
+
+    Chunk `k` draws everything from its own generator, seeded by child `k` of `numpy.random.SeedSequence(seed)`,
+    so results depend only on `seed` and `chunk_size` and are reproducible whatever the number of workers.
+    Requires NumPy
+    """
+    import numpy as np
+
+    if isinstance(network, CompiledNetwork):
+        compiled = network
+    else:
+        compiled = network.compiled
+
+    assert n_trials > 0 and chunk_size > 0
+
+    chunks = [min(chunk_size, n_trials - start) for start in range(0, n_trials, chunk_size)]
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(chunks))
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+
+    start_time = time.perf_counter()
+
+    if n_workers <= 1 or len(chunks) <= 1:
+        levels = _simulation_levels(compiled)
+        results = [
+            _simulate_chunk(compiled, levels, noise, chunk_trials, seed_sequence)
+            for (chunk_trials, seed_sequence) in zip(chunks, seed_sequences)
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers = n_workers,
+            mp_context = multiprocessing.get_context(),
+            initializer = _init_worker,
+            initargs = (compiled, noise),
+        ) as executor:
+            results = list(executor.map(_simulate_worker_chunk, chunks, seed_sequences))
+
+    bit_errors = sum(result[0] for result in results)
+    word_errors = sum(result[1] for result in results)
+    fault_counts = sum(result[2] for result in results)
+    fault_errors = sum(result[3] for result in results)
+
+    elapsed = time.perf_counter() - start_time
+
+    return FaultSimulationResult(
+        compiled,
+        n_trials,
+        bit_errors.tolist(),
+        word_errors,
+        fault_counts.tolist(),
+        fault_errors.tolist(),
+        elapsed,
+    )
@@ -0,0 +1,51 @@
+from itertools import islice
+from typing import Iterable, Iterator, Sequence
+
+from .BitSlicedNetwork import pack_operands, unpack_lanes
+from .CompiledNetwork import CompiledNetwork
+
+class IntegerNetwork:
+    """
+    Wraps a network whose input layer is a concatenation of little bittian operands
+    of `widths` bits, and whose output layer is one little bittian number,
+    such as `GenericNumberAdder` or `GenericBitMultiplier`, so that it takes and returns ints.
+    The operands are packed straight into `BitSlicedNetwork` lanes and the outputs unpacked
+    straight from them, without building a tuple of bits per operand;
+    the lanes are evaluated by `CompiledNetwork.output_lanes`, so outputs are those of `__call__`
+    """
+    def __init__(self, network, widths: Sequence[int]) -> None:
+        if isinstance(network, CompiledNetwork):
+            self.compiled = network
+        else:
+            self.compiled = network.compiled
+
+        assert sum(widths) == self.compiled.n_inputs
+        self.widths = tuple(widths)
+
+    def evaluate_batch(self, rows: Sequence[Sequence[int]]) -> list:
+        """
+        The output int for each row of operands
+        """
+        if not rows:
+            return []
+        input_lanes = pack_operands(rows, self.widths)
+        return unpack_lanes(self.compiled.output_lanes(input_lanes, len(rows)), len(rows))
+
+    def stream(self, rows: Iterable[Sequence[int]], chunk_size: int = 4096) -> Iterator[int]:
+        """
+        Lazily evaluate the network on each row of operands pulled from `rows`,
+        `chunk_size` rows at a time, yielding the output ints in order
+        """
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield from self.evaluate_batch(chunk)
+
+    def __call__(self, *operands: int) -> int:
+        assert len(operands) == len(self.widths)
+        return self.evaluate_batch([operands])[0]
+
+    def __repr__(self) -> str:
+        return f"IntegerNetwork(widths = {self.widths})"
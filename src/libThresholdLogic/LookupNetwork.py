@@ -0,0 +1,318 @@
+from operator import itemgetter, mul
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from .BitSlicedNetwork import exhaustive_lanes
+from .CompiledNetwork import CompiledNetwork
+
+class LookupBlock:
+    """
+    A group of perceptrons of a `CompiledNetwork` evaluated as one lookup table:
+    the perceptrons read `input_slots`, constants and each other, and the values of `output_slots`,
+    those perceptrons read outside the block, are `table[index]` where bit `i` of `index`
+    is the value of `input_slots[i]`.
+    A perceptron with too many inputs for a table is a block by itself, without `lookup`,
+    which is evaluated directly
+    """
+    def __init__(self, perceptrons: List[int], input_slots: List[int], output_slots: List[int], lookup: bool = True) -> None:
+        self.perceptrons = perceptrons
+        self.input_slots = input_slots
+        self.output_slots = output_slots
+        self.lookup = lookup
+        self.table: List[Tuple[int]] = None # built on first use by `LookupNetwork`
+
+    def subnetwork(self, compiled: CompiledNetwork) -> CompiledNetwork:
+        """
+        The block on its own, its inputs being `input_slots` and its outputs `output_slots`
+        """
+        first_perceptron_slot = compiled.first_perceptron_slot
+        n_consts = len(compiled.const_values)
+        local_slots = {slot: idx for (idx, slot) in enumerate(self.input_slots)}
+        for idx, perceptron in enumerate(self.perceptrons):
+            local_slots[first_perceptron_slot + perceptron] = len(self.input_slots) + n_consts + idx
+
+        biases, offsets, sources, weights = [], [0], [], []
+        for perceptron in self.perceptrons:
+            start, stop = compiled.offsets[perceptron], compiled.offsets[perceptron + 1]
+            for source, weight in zip(compiled.sources[start:stop], compiled.weights[start:stop]):
+                if compiled.n_inputs <= source < first_perceptron_slot:
+                    # every constant of the network, at the same offset after the inputs
+                    sources.append(len(self.input_slots) + source - compiled.n_inputs)
+                else:
+                    sources.append(local_slots[source])
+                weights.append(weight)
+            biases.append(compiled.biases[perceptron])
+            offsets.append(len(sources))
+
+        # the perceptrons are in slot order, so in topological order, and levels only matter for batches
+        return CompiledNetwork(
+            len(self.input_slots),
+            compiled.const_values,
+            biases,
+            offsets,
+            sources,
+            weights,
+            [0, len(biases)],
+            [local_slots[slot] for slot in self.output_slots],
+            exact = compiled.exact,
+        )
+
+    def build_table(self, compiled: CompiledNetwork) -> List[Tuple[int]]:
+        """
+        The block's outputs for every combination of its inputs, evaluated all at once by
+        `CompiledNetwork.output_lanes`, so exactly as `NeuronNetwork.__call__` evaluates them:
+        by a `BitSlicedNetwork` when the block is `epsilon_free`, else input by input with `evaluate`
+        """
+        subnetwork = self.subnetwork(compiled)
+        input_lanes, n_lanes = exhaustive_lanes(subnetwork.n_inputs)
+        output_lanes = subnetwork.output_lanes(input_lanes, n_lanes)
+
+        # lane `k` is character `k` of each reversed binary string
+        columns = [map(int, bin(lane)[2:].zfill(n_lanes)[::-1]) for lane in output_lanes]
+        # blocks have few distinct output tuples, so share them
+        distinct: Dict[Tuple[int], Tuple[int]] = {}
+        return [distinct.setdefault(row, row) for row in zip(*columns)]
+
+    def key(self, compiled: CompiledNetwork) -> Tuple:
+        """
+        The block's structure, independent of where in the network it is,
+        identical for identical subnetworks such as every `GenericBitAdder` of a `GenericNumberAdder`
+        """
+        subnetwork = self.subnetwork(compiled)
+        return (
+            subnetwork.n_inputs,
+            tuple(subnetwork.const_values),
+            subnetwork.exact,
+            tuple(subnetwork.biases),
+            tuple(subnetwork.offsets),
+            tuple(subnetwork.sources),
+            tuple(subnetwork.weights),
+            tuple(subnetwork.output_slots),
+        )
+
+class LookupNetwork:
+    """
+    Evaluates a `CompiledNetwork` as a graph of lookup tables rather than of perceptrons.
+
+    The perceptrons are grouped, in topological order, into `LookupBlock`s of at most `max_inputs` inputs:
+    each perceptron joins the latest block it reads from, together with the other blocks it reads which
+    nothing else reads, while that keeps the block within `max_inputs`, else joins the sibling block sharing
+    the most inputs with it, else starts a new block, so blocks only ever read earlier blocks; a perceptron
+    with more than `max_inputs` inputs is evaluated directly, as by `CompiledNetwork.evaluate`.
+    Small subnetworks such as `AND`, `XOR` or a `GenericBitAdder`, and runs of them chained by their carries,
+    each become one block, and the `AND`s of a `GenericBitMultiplier` feeding columns too wide for a table
+    are tiled into blocks of the same few operand bits.
+    On first use every block's truth table is computed, see `LookupBlock.build_table`, and blocks of identical
+    structure share one table. Evaluating a block is then one index
+    computed from its inputs and one lookup, in place of evaluating each of its perceptrons.
+
+    Tables hold `2 ** max_inputs` entries, so `max_inputs` should be at most about 16.
+    Outputs are identical to `NeuronNetwork.__call__`'s, epsilon and all
+    """
+    def __init__(self, compiled: CompiledNetwork, max_inputs: int = 10) -> None:
+        assert max_inputs >= 1
+        self.compiled = compiled
+        self.max_inputs = max_inputs
+        self.blocks = self._partition()
+
+        self._program = None # built on first use by `evaluate`
+        self._tables: Dict[Tuple, List[Tuple[int]]] = {} # of each distinct block's structure
+
+    def _partition(self) -> List[LookupBlock]:
+        compiled = self.compiled
+        first_perceptron_slot = compiled.first_perceptron_slot
+        const_slots = range(compiled.n_inputs, first_perceptron_slot)
+
+        # blocks are numbered in the order they're started, and only ever read lower numbered blocks
+        block_of: List[int] = [] # of each perceptron
+        members: Dict[int, List[int]] = {}
+        inputs: Dict[int, Set[int]] = {} # the slots read from outside each block, other than constants
+        reads: Dict[int, Set[int]] = {}
+        readers: Dict[int, Set[int]] = {}
+        direct: Set[int] = set() # blocks of one perceptron too wide for a table
+        blocks_reading: Dict[int, Set[int]] = {} # of each slot, the blocks with it as an input
+
+        def set_inputs(block: int, slots: Set[int]) -> None:
+            for slot in inputs.get(block, ()):
+                blocks_reading[slot].discard(block)
+            inputs[block] = slots
+            for slot in slots:
+                blocks_reading.setdefault(slot, set()).add(block)
+
+        for perceptron, (start, stop) in enumerate(zip(compiled.offsets, compiled.offsets[1:])):
+            sources = {source for source in compiled.sources[start:stop] if source not in const_slots}
+            read = {block_of[source - first_perceptron_slot] for source in sources if source >= first_perceptron_slot}
+
+            block = None
+            latest = max(read, default = None)
+            if latest is not None and latest not in direct:
+                # the perceptron joins the latest block it reads, along with any other block it reads which is
+                # read by nothing but that block, so no block in between reads one and is read by the other;
+                # failing that it joins the latest block alone
+                absorbable = [b for b in read if b != latest and b not in direct and readers[b] <= {latest}]
+                for absorbed in (absorbable, []) if absorbable else ([],):
+                    merged = [latest] + absorbed
+                    merged_slots = {first_perceptron_slot + p for b in merged for p in members[b]}
+                    merged_slots.add(first_perceptron_slot + perceptron)
+                    merged_inputs = sources.union(*(inputs[b] for b in merged)) - merged_slots
+                    if len(merged_inputs) <= self.max_inputs:
+                        block = latest
+                        break
+
+                if block is not None:
+                    set_inputs(block, merged_inputs)
+                    for b in absorbed:
+                        for p in members.pop(b):
+                            block_of[p] = block
+                            members[block].append(p)
+                        set_inputs(b, set())
+                        del inputs[b], readers[b]
+                        reads[block].discard(b)
+                        for r in reads.pop(b):
+                            readers[r].discard(b)
+                            if r != block:
+                                readers[r].add(block)
+                                reads[block].add(r)
+                    read.difference_update(absorbed)
+
+            if block is None and len(sources) <= self.max_inputs:
+                # failing that, the perceptron joins a sibling, the block sharing the most inputs with it
+                # which is evaluated after every block it reads, such as an `AND` of the same operand bits
+                # as other `AND`s of a `GenericBitMultiplier`
+                latest = max(read, default = -1)
+                shared: Dict[int, int] = {}
+                for source in sources:
+                    for b in blocks_reading.get(source, ()):
+                        if b > latest and b not in direct:
+                            shared[b] = shared.get(b, 0) + 1
+                for b in sorted(shared, key = lambda b: (-shared[b], -b)):
+                    if len(inputs[b] | sources) <= self.max_inputs:
+                        block = b
+                        set_inputs(block, inputs[b] | sources)
+                        break
+
+            if block is None:
+                block = perceptron # unique, and greater than every block started so far
+                members[block] = []
+                set_inputs(block, sources)
+                reads[block] = set()
+                readers[block] = set()
+                if len(sources) > self.max_inputs:
+                    direct.add(block)
+
+            members[block].append(perceptron)
+            block_of.append(block)
+            for r in read:
+                if r != block:
+                    readers[r].add(block)
+                    reads[block].add(r)
+
+        # a block's outputs are those of its perceptrons read by other blocks or by the output layer
+        read_outside = set(compiled.output_slots)
+        for perceptron, (start, stop) in enumerate(zip(compiled.offsets, compiled.offsets[1:])):
+            for source in compiled.sources[start:stop]:
+                if source >= first_perceptron_slot and block_of[source - first_perceptron_slot] != block_of[perceptron]:
+                    read_outside.add(source)
+
+        blocks = []
+        for block in sorted(members):
+            perceptrons = sorted(members[block])
+            if block in direct:
+                blocks.append(LookupBlock(perceptrons, sorted(inputs[block]), [first_perceptron_slot + perceptrons[0]], lookup = False))
+                continue
+
+            # inputs in the order first read, so identical subnetworks have identical blocks
+            block_inputs = {}
+            own_slots = {first_perceptron_slot + perceptron for perceptron in perceptrons}
+            for perceptron in perceptrons:
+                for source in compiled.sources[compiled.offsets[perceptron]:compiled.offsets[perceptron + 1]]:
+                    if source not in const_slots and source not in own_slots:
+                        block_inputs[source] = None
+            output_slots = [slot for slot in sorted(own_slots) if slot in read_outside]
+            blocks.append(LookupBlock(perceptrons, list(block_inputs), output_slots))
+
+        return blocks
+
+    @property
+    def program(self) -> List[Tuple[Callable[[List[int]], Sequence[int]], Tuple, Optional[List[Tuple[int]]], List[int], float]]:
+        """
+        One `(gather, powers, table, output_slots, bias)` entry per block, each table built on first use
+        or fetched from those of identical blocks built before.
+        A block without `lookup` has its perceptron's weights in place of `powers` and no table
+        """
+        if self._program is None:
+            self._program = self._build_program()
+        return self._program
+
+    def _build_program(self) -> list:
+        program = []
+        compiled = self.compiled
+        for block in self.blocks:
+            sources = block.input_slots
+            if len(sources) > 1:
+                gather = itemgetter(*sources)
+            else:
+                # as in `CompiledNetwork._build_program`, a slice so that `gather` always returns a sequence
+                gather = itemgetter(slice(sources[0], sources[0] + 1) if sources else slice(0, 0))
+
+            if not block.lookup:
+                # the perceptron's own entry, which also reads its constants
+                bias, weights, gather = compiled.program[block.perceptrons[0]]
+                program.append((gather, weights, None, block.output_slots, bias))
+                continue
+
+            if block.table is None:
+                key = block.key(self.compiled)
+                table = self._tables.get(key)
+                if table is None:
+                    table = self._tables[key] = block.build_table(self.compiled)
+                block.table = table
+
+            powers = tuple(1 << i for i in range(len(sources)))
+            program.append((gather, powers, block.table, block.output_slots, None))
+
+        return program
+
+    @property
+    def n_blocks(self) -> int:
+        return len(self.blocks)
+
+    def evaluate(self, inputs: Sequence[int]) -> List[int]:
+        """
+        Evaluate the network for a sequence of 0/1 inputs, returning the values of its slots as ints.
+        Only the input and constant slots and the blocks' output slots are set, the rest are 0
+        """
+        compiled = self.compiled
+        values = list(inputs)
+        values += compiled.const_values
+        values += [0] * compiled.n_perceptrons
+
+        threshold = 0 - compiled.tolerance
+        for gather, coefficients, table, output_slots, bias in self.program:
+            total = sum(map(mul, gather(values), coefficients))
+            if table is not None:
+                for slot, value in zip(output_slots, table[total]):
+                    values[slot] = value
+            elif total - bias >= threshold:
+                values[output_slots[0]] = 1
+
+        return values
+
+    def __call__(self, *inputs: int) -> Tuple[int]:
+        """
+        The lookup table equivalent of `NeuronNetwork.__call__`
+        """
+        assert len(inputs) == self.compiled.n_inputs
+        valid_inputs = {0, 1}
+        assert all(i in valid_inputs for i in inputs)
+
+        values = self.evaluate(inputs)
+
+        outputs = tuple(values[slot] for slot in self.compiled.output_slots)
+        valid_outputs = {0, 1}
+
+        assert all(o in valid_outputs for o in outputs)
+
+        return tuple(int(o) for o in outputs)
+
+    def __repr__(self) -> str:
+        return f"LookupNetwork({self.n_blocks} blocks of at most {self.max_inputs} inputs)"
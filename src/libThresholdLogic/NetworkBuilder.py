@@ -0,0 +1,227 @@
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .CompiledNetwork import CompiledNetwork
+
+_CONST, _PERCEPTRON, _PROXY = range(3)
+
+class NodeHandle:
+    """
+    A lightweight reference to a neuron being built by a `NetworkBuilder`
+    """
+    __slots__ = ("builder", "node")
+
+    def __init__(self, builder: "NetworkBuilder", node: int) -> None:
+        self.builder = builder
+        self.node = node
+
+class PerceptronHandle(NodeHandle):
+    """
+    Mirrors the `Perceptron` API, storing the bias and inputs in the builder's arrays
+    """
+    __slots__ = ()
+
+    @property
+    def bias(self) -> float:
+        return self.builder.params[self.node]
+
+    @bias.setter
+    def bias(self, bias: float) -> None:
+        self.builder.params[self.node] = bias
+
+    def add_input(self, weight: float, input_: NodeHandle) -> None:
+        self.builder.edge_dest.append(self.node)
+        self.builder.edge_source.append(input_.node)
+        self.builder.edge_weight.append(weight)
+
+class ProxyHandle(NodeHandle):
+    """
+    Mirrors the `ProxyNeuron` API, storing the source in the builder's arrays
+    """
+    __slots__ = ()
+
+    @property
+    def source(self) -> Optional[NodeHandle]:
+        source = self.builder.proxy_sources[self.node]
+        return None if source < 0 else self.builder.handle(source)
+
+    @source.setter
+    def source(self, source: Optional[NodeHandle]) -> None:
+        self.builder.proxy_sources[self.node] = -1 if source is None else source.node
+
+class NetworkBuilder:
+    """
+    Builds a `CompiledNetwork` directly, storing the network as it is built in compact
+    struct-of-arrays form rather than as `Perceptron` and `ProxyNeuron` objects:
+    a kind and a parameter (bias or constant value) per neuron, a source per proxy,
+    and the edges' destinations, sources and weights, which `build` sorts into CSR form.
+
+    The handles returned by `perceptron`, `proxy` and `const` mirror the neuron classes' API,
+    so a network's `__init__` translates directly, for example
+
+    ```py
+    builder = NetworkBuilder()
+    neuron_sum = builder.perceptron(1.0)
+    neuron_carry = builder.perceptron(1.0)
+    neuron_sum.add_input(-2.0, neuron_carry)
+    input_layer = [builder.proxy() for _ in range(2)]
+    ...
+    half_adder = builder.build(input_layer, [neuron_sum, neuron_carry])
+    ```
+
+    The handles need not be kept; this is how to hold very large networks in memory.
+    `Perceptron` and `ProxyNeuron` are deliberately not views onto a builder's arrays:
+    networks are wired together by pointing one network's `ProxyNeuron`s at another's neurons,
+    so neurons can't belong to any one set of arrays. Instead a `Perceptron` stores its inputs
+    compactly itself, see `Perceptron.weights`, and the example networks, such as `GenericBitAdder`,
+    still create neuron objects in their `__init__`, so building one of them with a `NetworkBuilder`
+    means translating its `__init__` to the handles by hand
+    """
+    def __init__(self) -> None:
+        self.kinds = array("b")
+        self.params = array("d")
+        self.proxy_sources = array("q")
+        self.edge_dest = array("q")
+        self.edge_source = array("q")
+        self.edge_weight = array("d")
+
+    def _add_node(self, kind: int, param: float = 0.0, source: int = -1) -> int:
+        self.kinds.append(kind)
+        self.params.append(param)
+        self.proxy_sources.append(source)
+        return len(self.kinds) - 1
+
+    def handle(self, node: int) -> NodeHandle:
+        kind = self.kinds[node]
+        if kind == _PERCEPTRON:
+            return PerceptronHandle(self, node)
+        elif kind == _PROXY:
+            return ProxyHandle(self, node)
+        else:
+            return NodeHandle(self, node)
+
+    def perceptron(self, bias: float, inputs: Optional[List[Tuple[float, NodeHandle]]] = None) -> PerceptronHandle:
+        handle = PerceptronHandle(self, self._add_node(_PERCEPTRON, bias))
+        for weight, input_ in inputs or ():
+            handle.add_input(weight, input_)
+        return handle
+
+    def proxy(self, source: Optional[NodeHandle] = None) -> ProxyHandle:
+        return ProxyHandle(self, self._add_node(_PROXY, source = -1 if source is None else source.node))
+
+    def const(self, value: float) -> NodeHandle:
+        return NodeHandle(self, self._add_node(_CONST, value))
+
+    @property
+    def n_neurons(self) -> int:
+        return len(self.kinds)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.edge_dest)
+
+    def build(self, input_layer: Sequence[ProxyHandle], output_layer: Sequence[NodeHandle]) -> CompiledNetwork:
+        """
+        Levelize the network between `input_layer` and `output_layer` into a `CompiledNetwork`,
+        with the same semantics as `CompiledNetwork.from_layers`
+        """
+        kinds = self.kinds
+        proxy_sources = self.proxy_sources
+        n_nodes = len(kinds)
+
+        input_nodes = {handle.node: idx for (idx, handle) in enumerate(input_layer)}
+
+        def resolve(node: int) -> int:
+            while kinds[node] == _PROXY and node not in input_nodes:
+                node = proxy_sources[node]
+                if node < 0:
+                    raise ValueError("ProxyNeuron source unset")
+            return node
+
+        # counting sort the edges by destination, keeping the order they were added in
+        edge_starts = array("q", bytes(8 * (n_nodes + 1)))
+        for dest in self.edge_dest:
+            edge_starts[dest + 1] += 1
+        for node in range(n_nodes):
+            edge_starts[node + 1] += edge_starts[node]
+        sorted_edges = array("q", bytes(8 * len(self.edge_dest)))
+        fill = array("q", edge_starts)
+        for edge, dest in enumerate(self.edge_dest):
+            sorted_edges[fill[dest]] = edge
+            fill[dest] += 1
+
+        # iterative depth-first walk from the outputs, levelling perceptrons in post-order
+        levels: Dict[int, int] = {node: 0 for node in input_nodes}
+        perceptrons: List[int] = []
+        const_slots: Dict[float, int] = {}
+        const_values: List[float] = []
+        for root in output_layer:
+            root = resolve(root.node)
+            if root in levels:
+                continue
+            stack = [(root, edge_starts[root])]
+            while stack:
+                node, position = stack[-1]
+                if kinds[node] == _PERCEPTRON and position < edge_starts[node + 1]:
+                    stack[-1] = (node, position + 1)
+                    source = resolve(self.edge_source[sorted_edges[position]])
+                    if source not in levels:
+                        stack.append((source, edge_starts[source]))
+                    continue
+
+                stack.pop()
+                if kinds[node] == _PERCEPTRON:
+                    levels[node] = 1 + max((
+                        levels[resolve(self.edge_source[sorted_edges[position]])]
+                        for position in range(edge_starts[node], edge_starts[node + 1])
+                    ), default = 0)
+                    perceptrons.append(node)
+                else: # `_CONST`, as proxies are resolved and inputs are already levelled
+                    levels[node] = 0
+                    value = self.params[node]
+                    if value not in const_slots:
+                        const_slots[value] = len(input_layer) + len(const_values)
+                        const_values.append(value)
+
+        perceptrons.sort(key = levels.__getitem__)
+
+        first_perceptron_slot = len(input_layer) + len(const_values)
+        slots = {node: slot for (node, slot) in input_nodes.items()}
+        slots.update((node, first_perceptron_slot + idx) for (idx, node) in enumerate(perceptrons))
+
+        def slot_of(node: int) -> int:
+            node = resolve(node)
+            if kinds[node] == _CONST:
+                return const_slots[self.params[node]]
+            return slots[node]
+
+        biases = array("d")
+        offsets = array("q", [0])
+        sources = array("q")
+        weights = array("d")
+        level_offsets = array("q", [0])
+        for idx, node in enumerate(perceptrons):
+            if idx and levels[node] != levels[perceptrons[idx - 1]]:
+                level_offsets.append(idx)
+
+            biases.append(self.params[node])
+            for position in range(edge_starts[node], edge_starts[node + 1]):
+                edge = sorted_edges[position]
+                sources.append(slot_of(self.edge_source[edge]))
+                weights.append(self.edge_weight[edge])
+            offsets.append(len(sources))
+        if perceptrons:
+            level_offsets.append(len(perceptrons))
+
+        output_slots = [slot_of(handle.node) for handle in output_layer]
+
+        return CompiledNetwork(
+            len(input_layer),
+            const_values,
+            biases,
+            offsets,
+            sources,
+            weights,
+            level_offsets,
+            output_slots,
+        )
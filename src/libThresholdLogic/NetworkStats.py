@@ -0,0 +1,124 @@
+from collections import Counter
+from typing import Dict, List
+
+from .Neurons import BaseNeuron, ConstNeuron, Perceptron, ProxyNeuron
+from .util import topological_order
+
+class NetworkStats:
+    """
+    Structural measurements of a network, see `NeuronNetwork.stats`
+    - `depth` is the number of perceptrons on the longest path from the input layer to the output layer
+    - `fan_in` is a histogram of how many perceptrons have each number of inputs
+    - `fan_out` is a histogram of how many perceptrons and input layer neurons
+      are read by each number of perceptron inputs, looking through `ProxyNeuron`s
+    - `critical_path` is a longest path, from the input layer neuron (or `ConstNeuron`)
+      at its start to the output neuron at its end, not including `ProxyNeuron`s
+    """
+    def __init__(
+        self,
+        n_perceptrons: int,
+        n_edges: int,
+        n_proxies: int,
+        n_consts: int,
+        depth: int,
+        fan_in: Dict[int, int],
+        fan_out: Dict[int, int],
+        critical_path: List[BaseNeuron],
+    ) -> None:
+        self.n_perceptrons = n_perceptrons
+        self.n_edges = n_edges
+        self.n_proxies = n_proxies
+        self.n_consts = n_consts
+        self.depth = depth
+        self.fan_in = fan_in
+        self.fan_out = fan_out
+        self.critical_path = critical_path
+
+    @classmethod
+    def from_layers(cls, input_layer: List[ProxyNeuron], output_layer: List[BaseNeuron]) -> "NetworkStats":
+        """
+        Measure the network between `input_layer` and `output_layer`,
+        in one pass over its neurons in topological order
+        """
+        order = topological_order(output_layer, input_layer)
+        input_set = set(input_layer)
+
+        n_perceptrons = 0
+        n_edges = 0
+        n_proxies = len(input_set)
+        n_consts = 0
+        fan_in = Counter()
+        fan_out = Counter({neuron: 0 for neuron in input_layer}) # of each neuron
+
+        driver: Dict[BaseNeuron, BaseNeuron] = {} # the non-proxy neuron behind each neuron
+        levels: Dict[BaseNeuron, int] = {}
+        predecessor: Dict[BaseNeuron, BaseNeuron] = {} # a deepest input of each perceptron
+
+        for neuron in order:
+            if neuron in input_set:
+                driver[neuron] = neuron
+                levels[neuron] = 0
+            elif isinstance(neuron, ProxyNeuron):
+                if neuron.source is None:
+                    raise ValueError("ProxyNeuron source unset")
+                n_proxies += 1
+                driver[neuron] = driver[neuron.source]
+                levels[neuron] = levels[neuron.source]
+            elif isinstance(neuron, Perceptron):
+                n_perceptrons += 1
+                n_edges += len(neuron.inputs)
+                fan_in[len(neuron.inputs)] += 1
+                fan_out[neuron] += 0
+
+                deepest = None
+                for _, input_ in neuron.inputs:
+                    source = driver[input_]
+                    fan_out[source] += 1
+                    if deepest is None or levels[source] > levels[deepest]:
+                        deepest = source
+
+                driver[neuron] = neuron
+                levels[neuron] = 1 + (levels[deepest] if deepest is not None else 0)
+                if deepest is not None:
+                    predecessor[neuron] = deepest
+            else:
+                if isinstance(neuron, ConstNeuron):
+                    n_consts += 1
+                driver[neuron] = neuron
+                levels[neuron] = max((levels[dependency] for dependency in neuron.dependencies()), default = 0)
+
+        critical_path = []
+        if output_layer:
+            neuron = max((driver[neuron] for neuron in output_layer), key = levels.__getitem__)
+            critical_path.append(neuron)
+            while neuron in predecessor:
+                neuron = predecessor[neuron]
+                critical_path.append(neuron)
+            critical_path.reverse()
+
+        depth = max((levels[neuron] for neuron in output_layer), default = 0)
+
+        return cls(
+            n_perceptrons,
+            n_edges,
+            n_proxies,
+            n_consts,
+            depth,
+            dict(sorted(fan_in.items())),
+            dict(sorted(Counter(
+                count for (neuron, count) in fan_out.items() if not isinstance(neuron, ConstNeuron)
+            ).items())),
+            critical_path,
+        )
+
+    def __str__(self) -> str:
+        return "\n".join((
+            f"perceptrons:   {self.n_perceptrons}",
+            f"edges:         {self.n_edges}",
+            f"proxy neurons: {self.n_proxies}",
+            f"const neurons: {self.n_consts}",
+            f"depth:         {self.depth}",
+            f"fan-in:        {self.fan_in}",
+            f"fan-out:       {self.fan_out}",
+            f"critical path: {len(self.critical_path)} neurons",
+        ))
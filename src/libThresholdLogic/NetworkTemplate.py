@@ -0,0 +1,252 @@
+from copy import copy
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, Tuple
+
+from .Neurons import BaseNeuron, ConstNeuron, Perceptron, ProxyNeuron
+from .util import topological_order
+
+_CONST, _PERCEPTRON, _PROXY = range(3)
+_VALUE, _MUTABLE, _NEURON, _NEURON_LIST, _NEURON_TUPLE, _NESTED = range(6)
+
+class _NeuronRef:
+    """
+    Stands in for neuron `idx` of a template in the attributes of its prototype network
+    """
+    __slots__ = ("idx",)
+
+    def __init__(self, idx: int) -> None:
+        self.idx = idx
+
+class _NetworkRef:
+    """
+    Stands in for a subnetwork held in the attributes of a template's prototype, such as `self.inner = XOR()`,
+    with its own attributes in their `_to_refs` form, so that every instance gets its own subnetwork
+    over its own neurons rather than sharing the prototype's
+    """
+    __slots__ = ("network_class", "attributes")
+
+    def __init__(self, network_class: type, attributes: Dict[str, Any]) -> None:
+        self.network_class = network_class
+        self.attributes = attributes
+
+def _is_network(value: Any) -> bool:
+    from .NeuronNetwork import NeuronNetwork # which imports this module
+    return isinstance(value, NeuronNetwork)
+
+def _network_attributes(network) -> Dict[str, Any]:
+    """
+    The attributes of `network` to carry over to an instance, not those cached by `cached_property`,
+    such as `NeuronNetwork.compiled`, which are recomputed on first use
+    """
+    network_class = type(network)
+    return {
+        key: value for (key, value) in vars(network).items()
+        if not isinstance(getattr(network_class, key, None), cached_property)
+    }
+
+class NetworkTemplate:
+    """
+    The structure of a freshly constructed network, captured once, from which identical
+    independent copies are stamped out without re-running the network's `__init__`.
+
+    Every neuron between the prototype's input and output layers is stored in topological order
+    as a flat record, perceptrons as their bias and tuples of their input weights and neuron indices,
+    so `instantiate` is one pass creating each neuron with its whole inputs list at once.
+    Each instance's perceptrons share the template's tuple of weights, see `Perceptron.from_weights`,
+    only their lists of input neurons being their own.
+    The prototype's attributes, such as `GenericBitAdder.carry_inputs`, are remapped
+    onto the new neurons, as are subnetworks held in them, which are copied over the new neurons too;
+    `ConstNeuron`s are shared between instances. Attributes holding neurons in any other way,
+    such as in a dict, can't be remapped and raise `TypeError`
+
+    Templates are usually used through `NeuronNetwork.instance`, which caches one template
+    per network class and constructor arguments
+    """
+    def __init__(self, prototype) -> None:
+        if any(neuron.source is not None for neuron in prototype.input_layer):
+            raise ValueError("Template input layer must be unconnected")
+
+        self.network_class = type(prototype)
+
+        # attribute neurons are roots too, in case any aren't in the output layer
+        attributes = _network_attributes(prototype)
+        roots = list(prototype.output_layer)
+        for value in attributes.values():
+            roots.extend(self._neurons_in(value))
+
+        order = topological_order(roots, prototype.input_layer)
+        input_set = set(prototype.input_layer)
+        # the input layer comes first, so that `instantiate` can slice it off
+        order = list(prototype.input_layer) + [neuron for neuron in order if neuron not in input_set]
+        indices = {neuron: idx for (idx, neuron) in enumerate(order)}
+
+        self.n_inputs = len(prototype.input_layer)
+        self.records: List[Tuple] = [] # of `(kind, bias or source_idx or const_neuron, weights, input_indices)`
+        weight_tuples: Dict[Tuple[float, ...], Tuple[float, ...]] = {} # so equal weights are stored once
+        for neuron in order[self.n_inputs:]:
+            if isinstance(neuron, Perceptron):
+                weights = tuple(neuron.weights)
+                self.records.append((
+                    _PERCEPTRON,
+                    neuron.bias,
+                    weight_tuples.setdefault(weights, weights),
+                    tuple(indices[input_] for input_ in neuron.sources),
+                ))
+            elif isinstance(neuron, ProxyNeuron):
+                # only a neuron held in the attributes, such as the input layer of an unconnected subnetwork,
+                # can be unset, else it would be in the prototype's input layer
+                self.records.append((_PROXY, None if neuron.source is None else indices[neuron.source], None, None))
+            elif isinstance(neuron, ConstNeuron):
+                self.records.append((_CONST, neuron, None, None))
+            else:
+                raise TypeError(f"Cannot template neuron of type {type(neuron).__name__}")
+
+        # how to rebuild each attribute: a lone neuron or a flat list or tuple of neurons
+        # are remapped by index, anything else holding neurons or subnetworks is remapped recursively
+        self.attributes: List[Tuple[str, int, Any]] = []
+        network_refs: Dict[int, _NetworkRef] = {} # by `id` of each subnetwork, so one held twice is copied once
+        for key, value in attributes.items():
+            if isinstance(value, BaseNeuron):
+                self.attributes.append((key, _NEURON, indices[value]))
+            elif isinstance(value, (list, tuple)) and all(isinstance(item, BaseNeuron) for item in value):
+                self.attributes.append((key, _NEURON_LIST if isinstance(value, list) else _NEURON_TUPLE, [indices[item] for item in value]))
+            elif self._neurons_in(value) or self._holds_networks(value):
+                self.attributes.append((key, _NESTED, self._to_refs(value, indices, network_refs)))
+            elif self._holds_neurons(value):
+                raise TypeError(f"Cannot template attribute {key!r} of type {type(value).__name__}, which holds neurons")
+            elif isinstance(value, (list, dict, set)):
+                self.attributes.append((key, _MUTABLE, value))
+            else:
+                self.attributes.append((key, _VALUE, value))
+
+    @classmethod
+    def _neurons_in(cls, value: Any) -> List[BaseNeuron]:
+        """
+        The neurons in `value` which can be remapped: itself, or those in its lists, tuples and subnetworks
+        """
+        if isinstance(value, BaseNeuron):
+            return [value]
+        if isinstance(value, (list, tuple)):
+            return [neuron for item in value for neuron in cls._neurons_in(item)]
+        if _is_network(value):
+            return [neuron for item in _network_attributes(value).values() for neuron in cls._neurons_in(item)]
+        return []
+
+    @classmethod
+    def _holds_networks(cls, value: Any) -> bool:
+        if _is_network(value):
+            return True
+        if isinstance(value, (list, tuple)):
+            return any(cls._holds_networks(item) for item in value)
+        return False
+
+    @classmethod
+    def _holds_neurons(cls, value: Any) -> bool:
+        """
+        Whether `value` holds neurons or subnetworks where they can't be remapped, such as in a dict or set,
+        or in the attributes of some other object
+        """
+        if isinstance(value, BaseNeuron) or _is_network(value):
+            return True
+        if isinstance(value, dict):
+            return any(cls._holds_neurons(key) or cls._holds_neurons(item) for (key, item) in value.items())
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return any(cls._holds_neurons(item) for item in value)
+        if not isinstance(value, type) and hasattr(value, "__dict__"):
+            return any(isinstance(item, BaseNeuron) or _is_network(item) for item in vars(value).values())
+        return False
+
+    @classmethod
+    def _to_refs(cls, value: Any, indices: Dict[BaseNeuron, int], network_refs: Dict[int, _NetworkRef]) -> Any:
+        if isinstance(value, BaseNeuron):
+            return _NeuronRef(indices[value])
+        if isinstance(value, (list, tuple)):
+            return type(value)(cls._to_refs(item, indices, network_refs) for item in value)
+        if _is_network(value):
+            if id(value) not in network_refs:
+                network_refs[id(value)] = _NetworkRef(type(value), {}) # before its attributes, lest it holds itself
+                network_refs[id(value)].attributes = {
+                    key: cls._to_refs(item, indices, network_refs)
+                    for (key, item) in _network_attributes(value).items()
+                }
+            return network_refs[id(value)]
+        if cls._holds_neurons(value):
+            raise TypeError(f"Cannot template a {type(value).__name__} holding neurons")
+        return value
+
+    @classmethod
+    def _from_refs(cls, value: Any, neurons: List[BaseNeuron], networks: Dict[int, Any]) -> Any:
+        if isinstance(value, _NeuronRef):
+            return neurons[value.idx]
+        if isinstance(value, (list, tuple)):
+            return type(value)(cls._from_refs(item, neurons, networks) for item in value)
+        if isinstance(value, _NetworkRef):
+            network = networks.get(id(value))
+            if network is None:
+                network = networks[id(value)] = object.__new__(value.network_class)
+                attributes = vars(network)
+                for key, item in value.attributes.items():
+                    item = cls._from_refs(item, neurons, networks)
+                    # lists are rebuilt by `_from_refs`, but other mutable values must be copied as for the prototype's
+                    attributes[key] = copy(item) if isinstance(item, (dict, set)) else item
+            return network
+        return value
+
+    @property
+    def n_neurons(self) -> int:
+        return self.n_inputs + len(self.records)
+
+    def instantiate(self):
+        """
+        A new network of the prototype's class with its own neurons, wired identically
+        """
+        neurons: List[BaseNeuron] = [ProxyNeuron() for _ in range(self.n_inputs)]
+        append = neurons.append
+        neuron_at = neurons.__getitem__
+        from_weights = Perceptron.from_weights
+
+        for kind, param, weights, input_indices in self.records:
+            if kind == _PERCEPTRON:
+                append(from_weights(param, weights, list(map(neuron_at, input_indices))))
+            elif kind == _PROXY:
+                append(ProxyNeuron(None if param is None else neurons[param]))
+            else:
+                append(param)
+
+        network = object.__new__(self.network_class)
+        attributes = vars(network)
+        networks: Dict[int, Any] = {} # of each `_NetworkRef`, by `id`
+        for key, kind, value in self.attributes:
+            if kind == _NEURON:
+                attributes[key] = neurons[value]
+            elif kind == _NEURON_LIST:
+                attributes[key] = list(map(neuron_at, value))
+            elif kind == _NEURON_TUPLE:
+                attributes[key] = tuple(map(neuron_at, value))
+            elif kind == _NESTED:
+                attributes[key] = self._from_refs(value, neurons, networks)
+            elif kind == _MUTABLE:
+                attributes[key] = copy(value)
+            else:
+                attributes[key] = value
+
+        return network
+
+@lru_cache(maxsize = 64)
+def _cached_template(network_class: type, args: Tuple, kwargs: Tuple) -> NetworkTemplate:
+    return NetworkTemplate(network_class(*args, **dict(kwargs)))
+
+def template_of(network_class: type, *args, **kwargs) -> NetworkTemplate:
+    """
+    The template of `network_class(*args, **kwargs)`, constructed on first use and cached.
+    The arguments must be hashable. Only the most recently used 64 templates are kept,
+    so a long-running process building networks of many sizes doesn't keep every one alive;
+    `clear_templates` frees them all
+    """
+    return _cached_template(network_class, args, tuple(sorted(kwargs.items())))
+
+def clear_templates() -> None:
+    """
+    Forget every cached template, such as once a short-lived process has built all of its networks
+    """
+    _cached_template.cache_clear()
@@ -1,12 +1,44 @@
-from typing import List, Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import cached_property
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import os
+import weakref
 
+from .CompiledNetwork import CompiledNetwork
+from .EvaluationSession import EvaluationSession
+from .LookupNetwork import LookupNetwork
+from .NetworkStats import NetworkStats
+from .NetworkTemplate import template_of
+from .Optimizer import OptimizationReport, optimize_layers
+from .Profiler import Profiler
+from .ShortCircuitNetwork import ShortCircuitNetwork
+from .TimingAnalysis import TimingReport, analyze_timing
 from .Neurons import BaseNeuron, ConstNeuron, ProxyNeuron
+from .util import topological_order
+
+# the networks whose construction finished while another's was under way, in order, until that one claims them
+# as its `subnetworks`, and weak references to the networks under construction, dead if their `__init__` failed
+_unclaimed: List["NeuronNetwork"] = []
+_under_construction: List[weakref.ref] = []
+
+def _constructing() -> bool:
+    """
+    Whether a network is under construction, which will claim those constructed meanwhile
+    """
+    return any(ref() is not None for ref in _under_construction)
 
 class NeuronNetwork:
     """
     The abstract base class for a Neuron Network
     Child classes should extend `__init__`
     """
+    def __new__(cls, *args, **kwargs) -> "NeuronNetwork":
+        network = super().__new__(cls)
+        # networks constructed from now until `__init__` are this one's subnetworks
+        network._first_unclaimed = len(_unclaimed)
+        _under_construction.append(weakref.ref(network))
+        return network
+
     def __init__(
         self,
         input_layer: List[ProxyNeuron],
@@ -19,12 +51,41 @@ class NeuronNetwork:
         self.input_layer = input_layer
         self.output_layer = output_layer
 
+        # the networks constructed within this one's `__init__`, such as the `AND`s and `GenericBitAdder`s
+        # of a `GenericBitMultiplier`, recorded whether or not a `Profiler` is active for its `report`
+        first_unclaimed = vars(self).pop("_first_unclaimed", len(_unclaimed))
+        self.subnetworks = _unclaimed[first_unclaimed:]
+        del _unclaimed[first_unclaimed:]
+        _under_construction[:] = [ref for ref in _under_construction if ref() is not None and ref() is not self]
+        if _constructing():
+            _unclaimed.append(self)
+        else:
+            _unclaimed.clear() # nothing is left to claim them, eg of a failed construction
+
+    @classmethod
+    def instance(cls, *args, **kwargs) -> "NeuronNetwork":
+        """
+        A new network identical to `cls(*args, **kwargs)`, stamped out from a `NetworkTemplate`
+        which is built by constructing the network just once per distinct (hashable) arguments.
+        Useful when building a large network out of many copies of the same subnetwork
+        """
+        first_unclaimed = len(_unclaimed)
+        template = template_of(cls, *args, **kwargs)
+        del _unclaimed[first_unclaimed:] # the template's prototype, if just constructed, is no subnetwork
+
+        network = template.instantiate()
+        if _constructing():
+            _unclaimed.append(network)
+        return network
+
     def __call__(self, *inputs: int) -> Tuple[int]:
         """
         For calling the network directly with int inputs, returning int outputs.
         Useful for when evaluating a network as an ALU with binary IO.
         If chaining neuron networks together then this function should not be called;
         connect up the output layer neurons as desired instead.
+        The inputs are bound in this call's own `cache` rather than by connecting up the input layer,
+        so the network isn't modified and can be called from many threads at once, see `map`
         """
         assert len(inputs) == len(self.input_layer)
         valid_inputs = {0, 1}
@@ -32,12 +93,18 @@ class NeuronNetwork:
 
         float_inputs = tuple(float(i) for i in inputs) # somewhat unnecessary for Python
 
-        cache = {} # of type `Dict[BaseNeuron, float]`
+        # of type `Dict[BaseNeuron, float]`, starting with the input layer's values, so that
+        # evaluating the input layer's `ProxyNeuron`s returns them without reading their sources
+        cache = dict(zip(self.input_layer, float_inputs))
 
-        for input_value, neuron_input in zip(float_inputs, self.input_layer):
-            neuron_input.source = ConstNeuron(input_value)
+        # evaluating in topological order means every neuron's inputs are already in the cache,
+        # so no neuron recurses, however deep the network
+        if Profiler.active is None:
+            for neuron in self.evaluation_order:
+                neuron(cache)
+        else:
+            cache = Profiler.active.evaluate(self, cache)
 
-        # this is a depth-first evaluation; having cache really helps
         float_outputs = tuple(neuron(cache) for neuron in self.output_layer)
         valid_float_outputs = {0.0, 1.0}
 
@@ -48,6 +115,164 @@ class NeuronNetwork:
 
         return int_outputs
 
+    def map(
+        self,
+        inputs: Iterable[Sequence[int]],
+        executor: Optional[Executor] = None,
+        chunk_size: int = 64,
+    ) -> List[Tuple[int]]:
+        """
+        Call the network on each row of `inputs`, fanning the rows out `chunk_size` at a time
+        across `executor`, by default a new `concurrent.futures.ThreadPoolExecutor`,
+        and return the outputs in order. Every thread shares this one network, as `__call__`
+        doesn't modify it; on a free-threaded build of CPython the rows are evaluated in parallel
+        """
+        rows = list(inputs)
+        chunks = [rows[start:start + chunk_size] for start in range(0, len(rows), chunk_size)]
+
+        if executor is None:
+            with ThreadPoolExecutor() as executor:
+                results = list(executor.map(self._call_rows, chunks))
+        else:
+            results = list(executor.map(self._call_rows, chunks))
+
+        return [outputs for chunk in results for outputs in chunk]
+
+    def _call_rows(self, rows: Sequence[Sequence[int]]) -> List[Tuple[int]]:
+        return [self(*row) for row in rows]
+
+    @cached_property
+    def evaluation_order(self) -> List[BaseNeuron]:
+        """
+        Every neuron between the input and output layers, each listed after all of its inputs,
+        found once with an iterative walk and reused by every `__call__`.
+        Like `compile` this is a snapshot of the network's neurons when first called
+        """
+        return topological_order(self.output_layer, self.input_layer)
+
+    def compile(self, exact: bool = False, keep_neurons: bool = True) -> CompiledNetwork:
+        """
+        Levelize the network once into a `CompiledNetwork`, a flat program over index arrays
+        which gives identical outputs to `__call__` but without the recursion and `cache` dict.
+        With `exact` the perceptrons are rescaled to integer weights and thresholds,
+        see `CompiledNetwork.to_exact`, evaluating without `Perceptron.heaviside`'s epsilon.
+        Without `keep_neurons` the compiled network doesn't reference this network's neurons,
+        so that once this network is discarded only the compact compiled arrays remain in memory.
+        The compiled network is a snapshot; compile again after changing the network's neurons
+        """
+        compiled = CompiledNetwork.from_layers(self.input_layer, self.output_layer, keep_neurons)
+        if exact:
+            compiled = compiled.to_exact()
+        return compiled
+
+    @cached_property
+    def compiled(self) -> CompiledNetwork:
+        """
+        The network compiled on first use, shared by the batched evaluation methods
+        """
+        return self.compile()
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Compile the network and write it to `path` in a compact binary format, see `CompiledNetwork.save`
+        """
+        self.compiled.save(path)
+
+    @staticmethod
+    def load(path: Union[str, os.PathLike], memory_map: bool = True) -> CompiledNetwork:
+        """
+        Load a network saved by `save` as a `CompiledNetwork`, memory-mapping its arrays
+        rather than reconstructing any neurons, see `CompiledNetwork.load`
+        """
+        return CompiledNetwork.load(path, memory_map)
+
+    def codegen(self) -> Callable[..., Tuple[int]]:
+        """
+        The network compiled to one straight-line Python function, generated on first use,
+        which returns the same outputs as `__call__` without walking any neurons;
+        see `CompiledNetwork.codegen`
+        """
+        return self.compiled.codegen()
+
+    def lookup(self, max_inputs: int = 10) -> LookupNetwork:
+        """
+        The network grouped into blocks of at most `max_inputs` inputs, each evaluated by looking up
+        a truth table computed on first use, see `LookupNetwork`
+        """
+        return LookupNetwork(self.compiled, max_inputs)
+
+    def short_circuit(self) -> Union[ShortCircuitNetwork, CompiledNetwork]:
+        """
+        The network evaluated on demand from its outputs, each perceptron reading its inputs
+        largest weight first only until its result is settled, see `ShortCircuitNetwork`.
+        Where its perceptrons are too narrow for that to pay off, `compiled` instead
+        """
+        if ShortCircuitNetwork.pays_off(self.compiled):
+            return ShortCircuitNetwork(self.compiled)
+        return self.compiled
+
+    def evaluate_batch(self, inputs, chunk_size: int = None):
+        """
+        Evaluate the network on each row of `inputs`, an `(N, len(input_layer))` array of 0s and 1s,
+        returning an `(N, len(output_layer))` array; see `CompiledNetwork.evaluate_batch`
+        Requires NumPy
+        """
+        return self.compiled.evaluate_batch(inputs, chunk_size)
+
+    def stream(self, rows: Iterable[Sequence[int]], chunk_size: int = 4096) -> Iterator[Tuple[int]]:
+        """
+        Lazily evaluate the network on each row pulled from `rows`, in chunks of `chunk_size`,
+        yielding output tuples in order; see `CompiledNetwork.stream`
+        """
+        return self.compiled.stream(rows, chunk_size)
+
+    def stats(self) -> NetworkStats:
+        """
+        Count the network's perceptrons, edges and proxy neurons, and measure its depth,
+        fan-in, fan-out and critical path, in linear time without recursion
+        """
+        return NetworkStats.from_layers(self.input_layer, self.output_layer)
+
+    def timing(
+        self,
+        delay: Optional[Callable[[BaseNeuron], float]] = None,
+        input_arrivals: Optional[Sequence[float]] = None,
+        required_time: Optional[float] = None,
+    ) -> TimingReport:
+        """
+        Static timing analysis: the arrival time of every output, the critical path,
+        and the slack of every neuron against `required_time`, in linear time; see `analyze_timing`.
+        `delay` gives each neuron's delay, eg a `DelayModel` configured per class or by fan-in
+        """
+        return analyze_timing(self.input_layer, self.output_layer, delay, input_arrivals, required_time)
+
+    def optimize(
+        self,
+        fold_constants: bool = True,
+        eliminate_proxies: bool = True,
+        merge_duplicates: bool = True,
+    ) -> Tuple["NeuronNetwork", OptimizationReport]:
+        """
+        An equivalent plain `NeuronNetwork` with constants folded, proxies eliminated, duplicate
+        perceptrons merged and dead perceptrons removed, along with a report of the before and after
+        neuron and edge counts; see `optimize_layers`. This network is left untouched
+        """
+        input_layer, output_layer, report = optimize_layers(
+            self.input_layer,
+            self.output_layer,
+            fold_constants,
+            eliminate_proxies,
+            merge_duplicates,
+        )
+        return NeuronNetwork(input_layer, output_layer), report
+
+    def session(self, inputs: Optional[Sequence[int]] = None) -> EvaluationSession:
+        """
+        A stateful `EvaluationSession` starting from `inputs` (by default all 0s), which
+        re-evaluates only the fan-out of whichever inputs change from one call to the next
+        """
+        return EvaluationSession(self.compiled, inputs)
+
     def connect_inputs(self, *src: BaseNeuron) -> None:
         """
         Try connecting each neuron in `src` to the next available `ProxyNeuron` in `input_layer`
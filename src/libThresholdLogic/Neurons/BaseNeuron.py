@@ -1,14 +1,26 @@
+from typing import List
+
 class BaseNeuron:
     """
     The abstract base class for all neuron-like components of a Neuron Network
     Child classes must override `do_call`
     """
+    # networks can have very many neurons, so rather than a `__dict__` each has only the slots
+    # child classes declare, and `__weakref__` so neurons can still be weakly referenced
+    __slots__ = ("__weakref__",)
     def do_call(self, cache) -> float:
         """
         The implementation of evaluating the neuron
         """
         raise NotImplementedError
 
+    def dependencies(self) -> List["BaseNeuron"]:
+        """
+        The neurons whose values `do_call` reads, used for walking the network without recursion
+        Child classes with inputs should override this
+        """
+        return []
+
     def __call__(self, cache) -> float:
         """
         Evaluate the neuron's value and store it in cache, a dictionary of type `Dict[BaseNeuron, float]`
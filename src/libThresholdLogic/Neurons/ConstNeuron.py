@@ -4,6 +4,8 @@ class ConstNeuron(BaseNeuron):
     """
     A neuron that always returns a constant
     """
+    __slots__ = ("value",)
+
     def __init__(self, value: float) -> None:
         self.value = value
 
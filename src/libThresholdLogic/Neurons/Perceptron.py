@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from .BaseNeuron import BaseNeuron
 
@@ -9,19 +9,48 @@ epsilon = 0.000001
 class Perceptron(BaseNeuron):
     """
     A real neuron with weighted inputs, bias, and transfer function
+    Its inputs are stored as two parallel sequences, `weights` and `sources`, rather than
+    as a tuple per input, and `weights` may be a tuple shared between many perceptrons,
+    such as every copy of a `NetworkTemplate`'s perceptron, which `add_input` copies before appending to
     """
+    __slots__ = ("bias", "weights", "sources")
+
     def __init__(self, bias: float, inputs: Optional[List[Tuple[float, BaseNeuron]]] = None) -> None:
         self.bias = bias
-        if inputs is not None:
-            self.inputs = inputs
-        else:
-            self.inputs = []
+        self.inputs = inputs or []
+
+    @classmethod
+    def from_weights(cls, bias: float, weights: Sequence[float], sources: List[BaseNeuron]) -> "Perceptron":
+        """
+        A perceptron reading `sources` with the corresponding `weights`, which are used as-is
+        rather than copied, so may be shared
+        """
+        neuron = cls.__new__(cls)
+        neuron.bias = bias
+        neuron.weights = weights
+        neuron.sources = sources
+        return neuron
+
+    @property
+    def inputs(self) -> List[Tuple[float, BaseNeuron]]:
+        """
+        The `(weight, neuron)` pair of each input, a new list; use `add_input` to add to them
+        """
+        return list(zip(self.weights, self.sources))
+
+    @inputs.setter
+    def inputs(self, inputs: List[Tuple[float, BaseNeuron]]) -> None:
+        self.weights = [weight for (weight, _) in inputs]
+        self.sources = [input_ for (_, input_) in inputs]
 
     def do_call(self, cache) -> float:
         return self.heaviside(
-            sum(weight * input_(cache) for (weight, input_) in self.inputs) - self.bias
+            sum(weight * input_(cache) for (weight, input_) in zip(self.weights, self.sources)) - self.bias
         )
 
+    def dependencies(self) -> List[BaseNeuron]:
+        return list(self.sources)
+
     @staticmethod
     def heaviside(f: float) -> float:
         if f >= 0.0 - epsilon:
@@ -30,4 +59,7 @@ class Perceptron(BaseNeuron):
             return 0.0
 
     def add_input(self, weight: float, input_: BaseNeuron) -> None:
-        self.inputs.append((weight, input_))
+        if not isinstance(self.weights, list):
+            self.weights = list(self.weights)
+        self.weights.append(weight)
+        self.sources.append(input_)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from .BaseNeuron import BaseNeuron
 
@@ -9,6 +9,8 @@ class ProxyNeuron(BaseNeuron):
     as the inputs may be either other real `Perceptron`s (linking networks together)
     or `ConstNeuron`s (for evaluating the network)
     """
+    __slots__ = ("source",)
+
     def __init__(self, source: Optional[BaseNeuron] = None) -> None:
         self.source = source
 
@@ -17,3 +19,9 @@ class ProxyNeuron(BaseNeuron):
             raise ValueError("ProxyNeuron source unset")
 
         return self.source(cache)
+
+    def dependencies(self) -> List[BaseNeuron]:
+        if self.source is None:
+            return []
+
+        return [self.source]
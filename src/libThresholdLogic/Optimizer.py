@@ -0,0 +1,167 @@
+from typing import Dict, List, Tuple, Union
+
+from .NetworkStats import NetworkStats
+from .Neurons import BaseNeuron, ConstNeuron, Perceptron, ProxyNeuron
+from .Neurons.Perceptron import epsilon
+from .util import topological_order
+
+class OptimizationReport:
+    """
+    What `optimize_layers` did: `NetworkStats` of the network before and after,
+    and how many edges, perceptrons and proxies each pass removed
+    - `n_folded_edges` edges from constants folded into their perceptron's bias
+    - `n_folded_perceptrons` perceptrons with a constant output replaced by that constant
+    - `n_eliminated_proxies` `ProxyNeuron`s, other than the input layer, replaced by their source
+    - `n_merged_perceptrons` perceptrons merged into an identical perceptron with identical inputs
+    - `n_dead_perceptrons` perceptrons which no longer reach the output layer once the others were folded
+    """
+    def __init__(
+        self,
+        before: NetworkStats,
+        after: NetworkStats,
+        n_folded_edges: int,
+        n_folded_perceptrons: int,
+        n_eliminated_proxies: int,
+        n_merged_perceptrons: int,
+        n_dead_perceptrons: int,
+    ) -> None:
+        self.before = before
+        self.after = after
+        self.n_folded_edges = n_folded_edges
+        self.n_folded_perceptrons = n_folded_perceptrons
+        self.n_eliminated_proxies = n_eliminated_proxies
+        self.n_merged_perceptrons = n_merged_perceptrons
+        self.n_dead_perceptrons = n_dead_perceptrons
+
+    def __str__(self) -> str:
+        return "\n".join((
+            f"perceptrons:   {self.before.n_perceptrons} -> {self.after.n_perceptrons}",
+            f"edges:         {self.before.n_edges} -> {self.after.n_edges}",
+            f"proxy neurons: {self.before.n_proxies} -> {self.after.n_proxies}",
+            f"const neurons: {self.before.n_consts} -> {self.after.n_consts}",
+            f"depth:         {self.before.depth} -> {self.after.depth}",
+            f"folded {self.n_folded_edges} constant edges and {self.n_folded_perceptrons} constant perceptrons, "
+            f"eliminated {self.n_eliminated_proxies} proxies, merged {self.n_merged_perceptrons} duplicate perceptrons, "
+            f"removed {self.n_dead_perceptrons} dead perceptrons",
+        ))
+
+def optimize_layers(
+    input_layer: List[ProxyNeuron],
+    output_layer: List[BaseNeuron],
+    fold_constants: bool = True,
+    eliminate_proxies: bool = True,
+    merge_duplicates: bool = True,
+) -> Tuple[List[ProxyNeuron], List[BaseNeuron], OptimizationReport]:
+    """
+    Rebuild the network between `input_layer` and `output_layer` out of new neurons,
+    in one pass in topological order, leaving the original neurons untouched:
+    - `fold_constants` folds each edge from a `ConstNeuron` into its perceptron's bias,
+      and replaces a perceptron by a constant when it has no other inputs, or when no 0/1 inputs
+      could bring its weighted sum across the bias
+    - `eliminate_proxies` wires every reader of a `ProxyNeuron` straight to the proxy's source
+    - `merge_duplicates` shares one perceptron between all perceptrons with the same bias
+      and the same weighted inputs, in any order, which cascades as their readers become identical
+    Neurons which no longer reach the output layer are dropped.
+    Folding a constant `c` on weight `w` subtracts `w * c` from the bias, which is exact for the
+    `pad_unconnected_inputs` default of 0; reordering inputs when merging changes a sum by far less
+    than `Perceptron.heaviside`'s epsilon.
+    Returns the new input layer (new unconnected `ProxyNeuron`s), the new output layer, and a report
+    """
+    order = topological_order(output_layer, input_layer)
+    input_set = set(input_layer)
+
+    new_input_layer = [ProxyNeuron() for _ in input_layer]
+    # each neuron's replacement, either a new neuron or a constant value
+    replacements: Dict[BaseNeuron, Union[BaseNeuron, float]] = dict(zip(input_layer, new_input_layer))
+
+    const_neurons: Dict[float, ConstNeuron] = {}
+    def const_neuron(value: float) -> ConstNeuron:
+        if value not in const_neurons:
+            const_neurons[value] = ConstNeuron(value)
+        return const_neurons[value]
+
+    perceptron_keys: Dict[Tuple, Perceptron] = {}
+    n_perceptrons = 0
+    n_folded_edges = 0
+    n_folded_perceptrons = 0
+    n_eliminated_proxies = 0
+    n_merged_perceptrons = 0
+
+    for neuron in order:
+        if neuron in input_set:
+            continue
+
+        if isinstance(neuron, ProxyNeuron):
+            if neuron.source is None:
+                raise ValueError("ProxyNeuron source unset")
+            source = replacements[neuron.source]
+            if eliminate_proxies:
+                n_eliminated_proxies += 1
+                replacements[neuron] = source
+            else:
+                replacements[neuron] = ProxyNeuron(source if isinstance(source, BaseNeuron) else const_neuron(source))
+        elif isinstance(neuron, ConstNeuron):
+            replacements[neuron] = neuron.value if fold_constants else const_neuron(neuron.value)
+        elif isinstance(neuron, Perceptron):
+            bias = neuron.bias
+            inputs = []
+            for weight, input_ in neuron.inputs:
+                replacement = replacements[input_]
+                if isinstance(replacement, BaseNeuron):
+                    inputs.append((weight, replacement))
+                else:
+                    bias -= weight * replacement
+                    n_folded_edges += 1
+
+            if fold_constants:
+                if not inputs:
+                    # every input is constant, so evaluate it just as `Perceptron.do_call` would
+                    n_folded_perceptrons += 1
+                    replacements[neuron] = Perceptron.heaviside(
+                        sum(weight * replacements[input_] for (weight, input_) in neuron.inputs) - neuron.bias
+                    )
+                    continue
+
+                # every input is 0 or 1, so the sum lies between the sums of the negative and positive weights,
+                # and if both bounds are on the same side of the bias, with a margin for rounding, it's constant
+                min_sum = sum(weight for (weight, _) in inputs if weight < 0)
+                max_sum = sum(weight for (weight, _) in inputs if weight > 0)
+                if max_sum - bias < 0 - 2 * epsilon or min_sum - bias >= 0:
+                    n_folded_perceptrons += 1
+                    n_folded_edges += len(inputs)
+                    replacements[neuron] = 1.0 if min_sum - bias >= 0 else 0.0
+                    continue
+
+            if merge_duplicates:
+                key = (bias, tuple(sorted((id(input_), weight) for (weight, input_) in inputs)))
+                if key in perceptron_keys:
+                    n_merged_perceptrons += 1
+                    replacements[neuron] = perceptron_keys[key]
+                    continue
+
+            replacement = Perceptron(bias, inputs)
+            n_perceptrons += 1
+            if merge_duplicates:
+                perceptron_keys[key] = replacement
+            replacements[neuron] = replacement
+        else:
+            raise TypeError(f"Cannot optimize neuron of type {type(neuron).__name__}")
+
+    new_output_layer = [
+        replacement if isinstance(replacement, BaseNeuron) else const_neuron(replacement)
+        for replacement in (replacements[neuron] for neuron in output_layer)
+    ]
+
+    after = NetworkStats.from_layers(new_input_layer, new_output_layer)
+
+    report = OptimizationReport(
+        NetworkStats.from_layers(input_layer, output_layer),
+        after,
+        n_folded_edges,
+        n_folded_perceptrons,
+        n_eliminated_proxies,
+        n_merged_perceptrons,
+        n_perceptrons - after.n_perceptrons,
+    )
+
+    return new_input_layer, new_output_layer, report
@@ -0,0 +1,209 @@
+from collections import Counter
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from .Neurons import BaseNeuron
+from .util import topological_order
+
+class NeuronProfile:
+    """
+    What one neuron did while profiled: `hits` and `misses` of its lookups in the `cache` dict,
+    each miss being one evaluation, and `time`, the seconds spent evaluating it,
+    not counting the evaluation of its inputs
+    """
+    __slots__ = ("hits", "misses", "time")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.time = 0.0
+
+    @property
+    def evaluations(self) -> int:
+        return self.misses
+
+class _ProfilingCache(dict):
+    """
+    The `cache` of a profiled `NeuronNetwork.__call__`, counting the hits and misses of
+    `BaseNeuron.__call__`'s lookups, which test `neuron in cache`
+    """
+    __slots__ = ("profiles",)
+
+    def __contains__(self, neuron: BaseNeuron) -> bool:
+        profile = self.profiles.get(neuron)
+        if profile is None:
+            profile = self.profiles[neuron] = NeuronProfile()
+        found = dict.__contains__(self, neuron)
+        if found:
+            profile.hits += 1
+        else:
+            profile.misses += 1
+        return found
+
+class Profiler:
+    """
+    An opt-in profiler of `NeuronNetwork.__call__`, active within a `with profiler:` block
+    or between `enable` and `disable`, recording the evaluation count, `cache` hits and misses,
+    and time of every neuron; see `NeuronProfile`.
+
+    Every network records the subnetworks constructed within its `__init__`, such as the
+    `AND`s and `GenericBitAdder`s inside a `GenericBitMultiplier` and those stamped out by
+    `NeuronNetwork.instance`, whether or not a profiler is active, so `report` can name them,
+    like `GenericBitAdder#3`, and attribute each neuron to the innermost subnetwork it is part of,
+    however long before profiling the network was built.
+
+    When no profiler is active `NeuronNetwork.__call__` checks only `Profiler.active`,
+    so the hook costs nothing measurable and can stay in production code.
+    Only one profiler is active at a time, for every thread
+    """
+    active: Optional["Profiler"] = None
+
+    def __init__(self) -> None:
+        self.profiles: Dict[BaseNeuron, NeuronProfile] = {}
+        self.networks: Dict[int, object] = {} # those evaluated while profiling, by `id`, in order
+        self.names: Dict[int, str] = {} # of each network named by `register`, by `id`
+        self._previous: Optional[Profiler] = None
+
+    def enable(self) -> None:
+        self._previous = Profiler.active
+        Profiler.active = self
+
+    def disable(self) -> None:
+        Profiler.active = self._previous
+        self._previous = None
+
+    def __enter__(self) -> "Profiler":
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+    def register(self, network, name: str) -> None:
+        """
+        Name `network` in the `report`, in place of its class name and a counter
+        """
+        self.names[id(network)] = name
+
+    def evaluate(self, network, cache: dict) -> dict:
+        """
+        Evaluate `network`'s neurons in `cache` as `NeuronNetwork.__call__` does, timing each one.
+        Returns the cache to read the outputs from, which keeps counting lookups
+        """
+        self.networks.setdefault(id(network), network)
+
+        profiled = _ProfilingCache(cache)
+        profiled.profiles = self.profiles
+
+        for neuron in network.evaluation_order:
+            start = perf_counter()
+            neuron(profiled)
+            elapsed = perf_counter() - start
+            self.profiles[neuron].time += elapsed
+
+        return profiled
+
+    def profile(self, neuron: BaseNeuron) -> NeuronProfile:
+        return self.profiles.get(neuron) or NeuronProfile()
+
+    def _hierarchy(self):
+        """
+        The evaluated networks and their subnetworks, each listed before its own subnetworks,
+        with each one's parent, `None` for the evaluated networks which aren't subnetworks of others,
+        the neurons each owns, those not in any of its subnetworks, and each one's name
+        """
+        # an evaluated network which is also a subnetwork of another is reported under it
+        subnetwork_ids = set()
+        stack = list(self.networks.values())
+        while stack:
+            for subnetwork in getattr(stack.pop(), "subnetworks", ()):
+                if id(subnetwork) not in subnetwork_ids:
+                    subnetwork_ids.add(id(subnetwork))
+                    stack.append(subnetwork)
+
+        networks: List = []
+        parent: Dict[int, Optional[int]] = {}
+        seen = set()
+
+        # walked with an explicit stack, lest deep hierarchies recurse
+        stack = [(network, None) for network in reversed(self.networks.values()) if id(network) not in subnetwork_ids]
+        while stack:
+            network, parent_idx = stack.pop()
+            if id(network) in seen:
+                continue
+            seen.add(id(network))
+            idx = len(networks)
+            networks.append(network)
+            parent[idx] = parent_idx
+            stack.extend((subnetwork, idx) for subnetwork in reversed(getattr(network, "subnetworks", ())))
+
+        # innermost first, so each neuron is owned by the smallest network containing it
+        owned: Dict[int, List[BaseNeuron]] = {}
+        owner = set()
+        for idx in reversed(range(len(networks))):
+            owned[idx] = []
+            for neuron in topological_order(networks[idx].output_layer, networks[idx].input_layer):
+                if neuron not in owner:
+                    owner.add(neuron)
+                    owned[idx].append(neuron)
+
+        names: Dict[int, str] = {}
+        class_counts = Counter()
+        for idx, network in enumerate(networks):
+            name = self.names.get(id(network))
+            if name is None:
+                class_name = type(network).__name__
+                name = f"{class_name}#{class_counts[class_name]}"
+                class_counts[class_name] += 1
+            names[idx] = name
+
+        return owned, parent, names
+
+    def report(self, show_neurons: bool = False) -> str:
+        """
+        A tree of the evaluated networks, each subnetwork under its parent,
+        with the number of neurons, evaluations, cache hits and time of each, including its subnetworks.
+        With `show_neurons` every evaluated neuron is listed under the subnetwork owning it, slowest first
+        """
+        owned, parent, names = self._hierarchy()
+        children: Dict[Optional[int], List[int]] = {}
+        for idx in sorted(owned):
+            children.setdefault(parent[idx], []).append(idx)
+
+        totals: Dict[int, List] = {} # of `[n_neurons, evaluations, hits, time]` including subnetworks
+        # children are listed after their parents, so in reverse every child's total comes first
+        for idx in sorted(owned, reverse = True):
+            profiles = [self.profiles[neuron] for neuron in owned[idx] if neuron in self.profiles]
+            sums = [
+                len(owned[idx]),
+                sum(profile.misses for profile in profiles),
+                sum(profile.hits for profile in profiles),
+                sum(profile.time for profile in profiles),
+            ]
+            for child in children.get(idx, []):
+                sums = [a + b for (a, b) in zip(sums, totals[child])]
+            totals[idx] = sums
+
+        lines = [f"{'network':<40} {'neurons':>8} {'evaluations':>12} {'cache hits':>12} {'time (ms)':>10}"]
+        # walked with an explicit stack, in construction order, lest deep hierarchies recurse
+        stack = [(idx, 0) for idx in reversed(children.get(None, []))]
+        while stack:
+            idx, depth = stack.pop()
+            n_neurons, evaluations, hits, elapsed = totals[idx]
+            if not evaluations and not hits:
+                continue # a subnetwork whose neurons were never read
+            name = "  " * depth + names[idx]
+            lines.append(f"{name:<40} {n_neurons:>8} {evaluations:>12} {hits:>12} {elapsed * 1000:>10.3f}")
+
+            if show_neurons:
+                profiled = sorted(
+                    ((neuron, self.profiles[neuron]) for neuron in owned[idx] if neuron in self.profiles),
+                    key = lambda pair: -pair[1].time,
+                )
+                for neuron, profile in profiled:
+                    name = "  " * (depth + 1) + f"{type(neuron).__name__} at {id(neuron):#x}"
+                    lines.append(f"{name:<40} {'':>8} {profile.misses:>12} {profile.hits:>12} {profile.time * 1000:>10.3f}")
+
+            stack.extend((child, depth + 1) for child in reversed(children.get(idx, [])))
+
+        return "\n".join(lines)
@@ -0,0 +1,207 @@
+from operator import itemgetter, mul
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .CompiledNetwork import CompiledNetwork
+
+_MIN_FAN_IN = 64
+# the mean number of inputs per perceptron from which the savings outweigh the cost of the walk;
+# below it `CompiledNetwork.evaluate`'s single pass is faster, even for a `GAND` or a `GenericBitAdder`
+
+class ShortCircuitNetwork:
+    """
+    Evaluates a `CompiledNetwork` on demand, back from its outputs, deciding each perceptron
+    as soon as its result is settled rather than after summing every input.
+
+    Each perceptron's inputs are visited in order of decreasing weight magnitude, with precomputed
+    bounds `min_rest[j]` and `max_rest[j]`, the sums of the negative and of the positive weights
+    of the inputs from `j` onwards. Once the partial sum plus `min_rest[j]` reaches the threshold the
+    perceptron fires whatever its remaining inputs are, and once the partial sum plus `max_rest[j]`
+    falls short of it the perceptron can't fire. The remaining inputs are never read, and perceptrons
+    read by nothing else that is evaluated are skipped entirely; an input is only evaluated when
+    it is reached, with an explicit stack rather than recursion, so deep networks don't recurse.
+
+    This saves the most for wide fan-in, such as a `GAND`, decided by the first mismatched bit,
+    or a `HammingGate` once the distance is beyond the radius. Perceptrons reading the same inputs
+    with the same weight, such as every bit of a `GenericBitAdder`, share the sums of those inputs.
+    Networks of narrow perceptrons, such as a ripple carry adder, have little to skip, and walking back
+    from the outputs costs more than `CompiledNetwork.evaluate`, so `NeuronNetwork.short_circuit`
+    only short-circuits networks for which `pays_off`.
+    Exact networks agree exactly with `CompiledNetwork.evaluate`; otherwise the weights are summed
+    in a different order, which agrees with `NeuronNetwork.__call__` except where float rounding
+    carries a sum across the threshold; this never happens for the example networks' dyadic weights
+    """
+    def __init__(self, compiled: CompiledNetwork) -> None:
+        self.compiled = compiled
+
+        self._program = None # built on first use by `evaluate`
+        self._n_chunks = None
+
+    @staticmethod
+    def pays_off(compiled: CompiledNetwork) -> bool:
+        """
+        Whether the perceptrons of `compiled` are wide enough, on average, for short-circuiting
+        to be faster than `CompiledNetwork.evaluate`
+        """
+        return compiled.n_edges >= _MIN_FAN_IN * max(1, compiled.n_perceptrons)
+
+    @property
+    def program(self) -> List[Tuple[float, object, object, List[Tuple[int, Callable[[List], Sequence], Tuple, object, List[int], object, object]]]]:
+        """
+        One `(bias, min_rest, max_rest, chunks)` entry per perceptron, its inputs sorted by decreasing
+        weight magnitude and each run of inputs of the same magnitude split into
+        `(index, gather, weights, weight, upstream, min_rest, max_rest)` chunks of 1, 2, 4, 8, ... inputs,
+        `upstream` being the perceptrons the chunk reads, and `weight` the weight shared
+        by all of the chunk's inputs, if they share one, in which case they are summed unweighted.
+        A chunk's `min_rest` and `max_rest` bound the inputs after it, and the entry's bound all of them.
+        The result is checked after each chunk, so at most about twice as many inputs are read
+        as needed, but each chunk is summed in one C-level call.
+        Chunks of the same inputs, and weights or shared weight, have the same `index`, and are summed once
+        per evaluation however many perceptrons read them, as every bit of a `GenericBitAdder` reads its inputs
+        """
+        if self._program is None:
+            self._program = self._build_program()
+        return self._program
+
+    def _build_program(self) -> list:
+        compiled = self.compiled
+        zero = compiled.value_type(0)
+        first_perceptron_slot = compiled.first_perceptron_slot
+
+        chunk_indices = {} # of each distinct chunk's sources, and weights unless they are all the same
+        program = []
+        for bias, start, stop in zip(compiled.biases, compiled.offsets, compiled.offsets[1:]):
+            # stable, so inputs of equal weight are read in the order of `Perceptron.inputs`
+            edges = sorted(
+                zip(compiled.sources[start:stop], compiled.weights[start:stop]),
+                key = lambda edge: -abs(edge[1]),
+            )
+
+            # the least and greatest sums of the weights from each input onwards
+            min_rest = [zero] * (len(edges) + 1)
+            max_rest = [zero] * (len(edges) + 1)
+            for j in reversed(range(len(edges))):
+                weight = edges[j][1]
+                min_rest[j] = min_rest[j + 1] + min(weight, zero)
+                max_rest[j] = max_rest[j + 1] + max(weight, zero)
+
+            chunks = []
+            run_start = 0
+            while run_start < len(edges):
+                run_stop = run_start
+                while run_stop < len(edges) and abs(edges[run_stop][1]) == abs(edges[run_start][1]):
+                    run_stop += 1
+
+                # chunks double from the start of each run, so that perceptrons reading the same run
+                # of inputs, whatever comes before it, split it into the same chunks
+                chunk_start = run_start
+                while chunk_start < run_stop:
+                    chunk_stop = min(chunk_start + max(1, chunk_start - run_start + 1), run_stop)
+                    sources = tuple(source for (source, _) in edges[chunk_start:chunk_stop])
+                    weights = tuple(weight for (_, weight) in edges[chunk_start:chunk_stop])
+                    weight = weights[0] if len(set(weights)) == 1 else None
+                    # a chunk of inputs sharing a weight is summed unweighted, and shared whatever the weight
+                    key = sources if weight is not None else (sources, weights)
+                    index = chunk_indices.setdefault(key, len(chunk_indices))
+                    if len(sources) > 1:
+                        gather = itemgetter(*sources)
+                    else:
+                        # as in `CompiledNetwork._build_program`, a slice so that `gather` always returns a sequence
+                        gather = itemgetter(slice(sources[0], sources[0] + 1))
+                    upstream = list(dict.fromkeys(source for source in sources if source >= first_perceptron_slot))
+                    chunks.append((index, gather, weights, weight, upstream, min_rest[chunk_stop], max_rest[chunk_stop]))
+                    chunk_start = chunk_stop
+
+                run_start = run_stop
+
+            program.append((bias, min_rest[0], max_rest[0], chunks))
+
+        self._n_chunks = len(chunk_indices)
+        return program
+
+    def evaluate(self, inputs: Sequence[int]) -> List[Optional[float]]:
+        """
+        Evaluate the network for a sequence of 0/1 inputs, returning the values of its slots,
+        floats or ints for an exact network, as `CompiledNetwork.evaluate` does,
+        except that the inputs are as given and perceptrons which weren't needed for the outputs are `None`
+        """
+        compiled = self.compiled
+        value_type = compiled.value_type
+        # the 0/1 inputs as they are, rather than converted to `value_type` whether they are read or not;
+        # summed with the weights they give the same values
+        values: List = list(inputs)
+        values += compiled.const_values
+        values += [None] * compiled.n_perceptrons
+
+        program = self.program
+        chunk_sums = [None] * self._n_chunks
+        first_perceptron_slot = compiled.first_perceptron_slot
+        zero = value_type(0)
+        one = value_type(1)
+        threshold = 0 - compiled.tolerance
+
+        for output in compiled.output_slots:
+            if values[output] is not None:
+                continue
+
+            # of `(perceptron, chunk, partial)`, a perceptron whose chunks before `chunk` sum to `partial`
+            stack = [(output - first_perceptron_slot, 0, zero)]
+            while stack:
+                perceptron, chunk, partial = stack.pop()
+                if values[first_perceptron_slot + perceptron] is not None:
+                    continue # pushed by several perceptrons, and evaluated for the first of them
+                bias, min_rest, max_rest, chunks = program[perceptron]
+
+                if partial + min_rest - bias >= threshold:
+                    values[first_perceptron_slot + perceptron] = one
+                    continue
+                if partial + max_rest - bias < threshold:
+                    values[first_perceptron_slot + perceptron] = zero
+                    continue
+
+                for index, gather, weights, weight, upstream, min_rest, max_rest in chunks[chunk:]:
+                    chunk_sum = chunk_sums[index]
+                    if chunk_sum is None:
+                        if upstream:
+                            missing = [source for source in upstream if values[source] is None]
+                            if missing:
+                                # resume at this chunk once the perceptrons it reads have been evaluated
+                                stack.append((perceptron, chunk, partial))
+                                stack.extend((source - first_perceptron_slot, 0, zero) for source in missing)
+                                break
+
+                        if weight is None:
+                            chunk_sum = sum(map(mul, weights, gather(values)))
+                        else:
+                            chunk_sum = sum(gather(values))
+                        chunk_sums[index] = chunk_sum
+
+                    partial += chunk_sum if weight is None else weight * chunk_sum
+                    chunk += 1
+                    if partial + min_rest - bias >= threshold:
+                        values[first_perceptron_slot + perceptron] = one
+                        break
+                    if partial + max_rest - bias < threshold:
+                        values[first_perceptron_slot + perceptron] = zero
+                        break
+
+        return values
+
+    def __call__(self, *inputs: int) -> Tuple[int]:
+        """
+        The short-circuiting equivalent of `NeuronNetwork.__call__`
+        """
+        assert len(inputs) == self.compiled.n_inputs
+        valid_inputs = {0, 1}
+        assert all(i in valid_inputs for i in inputs)
+
+        values = self.evaluate(inputs)
+
+        outputs = tuple(values[slot] for slot in self.compiled.output_slots)
+        valid_outputs = {0, 1}
+
+        assert all(o in valid_outputs for o in outputs)
+
+        return tuple(int(o) for o in outputs)
+
+    def __repr__(self) -> str:
+        return f"ShortCircuitNetwork({self.compiled.n_perceptrons} perceptrons)"
@@ -0,0 +1,150 @@
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .Neurons import BaseNeuron, ConstNeuron, Perceptron, ProxyNeuron
+from .util import topological_order
+
+class DelayModel:
+    """
+    The propagation delay of each neuron: a base delay looked up by the neuron's class
+    (or its nearest base class in `delays`), plus `per_input` for each of a perceptron's inputs.
+    By default a `Perceptron` takes 1 unit of time and `ProxyNeuron`s and `ConstNeuron`s,
+    being wires, take none, so arrival times are logic depths.
+    Any callable taking a neuron and returning its delay can be used in place of a `DelayModel`
+    """
+    def __init__(self, delays: Optional[Dict[type, float]] = None, per_input: float = 0.0) -> None:
+        self.delays = {Perceptron: 1.0, ProxyNeuron: 0.0, ConstNeuron: 0.0}
+        if delays is not None:
+            self.delays.update(delays)
+        self.per_input = per_input
+
+        self._class_delays: Dict[type, float] = {} # resolved along the MRO, once per class
+
+    def class_delay(self, neuron_class: type) -> float:
+        delay = self._class_delays.get(neuron_class)
+        if delay is None:
+            delay = next((self.delays[base] for base in neuron_class.__mro__ if base in self.delays), 0.0)
+            self._class_delays[neuron_class] = delay
+        return delay
+
+    def __call__(self, neuron: BaseNeuron) -> float:
+        delay = self.class_delay(type(neuron))
+        if self.per_input and isinstance(neuron, Perceptron):
+            delay += self.per_input * len(neuron.inputs)
+        return delay
+
+class TimingReport:
+    """
+    The result of `analyze_timing`
+    - `arrival` is the time each neuron's output settles, after its inputs' latest arrival plus its own delay
+    - `output_arrivals` are the arrival times of the output layer, in order
+    - `required_time` is when the outputs are required, by default the latest output arrival
+    - `slack` is how much later each neuron's output could settle without delaying any output
+      past `required_time`; it is negative for the neurons on a path that misses it
+    - `critical_path` is a latest arriving path, from the input layer neuron (or `ConstNeuron`)
+      at its start to the latest arriving output neuron at its end
+    """
+    def __init__(
+        self,
+        arrival: Dict[BaseNeuron, float],
+        output_arrivals: List[float],
+        required_time: float,
+        slack: Dict[BaseNeuron, float],
+        critical_path: List[BaseNeuron],
+    ) -> None:
+        self.arrival = arrival
+        self.output_arrivals = output_arrivals
+        self.required_time = required_time
+        self.slack = slack
+        self.critical_path = critical_path
+
+    @property
+    def max_arrival(self) -> float:
+        return max(self.output_arrivals, default = 0.0)
+
+    @property
+    def output_slacks(self) -> List[float]:
+        return [self.required_time - arrival for arrival in self.output_arrivals]
+
+    @property
+    def worst_slack(self) -> float:
+        return self.required_time - self.max_arrival
+
+    def __str__(self) -> str:
+        return "\n".join((
+            f"latest output arrival: {self.max_arrival:g}",
+            f"required time:         {self.required_time:g}",
+            f"worst slack:           {self.worst_slack:g}",
+            f"critical path:         {len(self.critical_path)} neurons",
+        ))
+
+def analyze_timing(
+    input_layer: List[ProxyNeuron],
+    output_layer: List[BaseNeuron],
+    delay: Optional[Callable[[BaseNeuron], float]] = None,
+    input_arrivals: Optional[Sequence[float]] = None,
+    required_time: Optional[float] = None,
+) -> TimingReport:
+    """
+    Static timing analysis of the network between `input_layer` and `output_layer`:
+    a forward pass in topological order propagates arrival times from the inputs, which arrive at
+    `input_arrivals` (by default all 0), and a backward pass propagates the times each neuron's output
+    is required by, giving its slack. Both passes are linear in the number of neurons and edges.
+    `delay` gives each neuron's delay, by default `DelayModel()`
+    """
+    if delay is None:
+        delay = DelayModel()
+    if input_arrivals is None:
+        input_arrivals = [0.0] * len(input_layer)
+    assert len(input_arrivals) == len(input_layer)
+
+    order = topological_order(output_layer, input_layer)
+
+    arrival: Dict[BaseNeuron, float] = dict(zip(input_layer, input_arrivals))
+    input_set = set(input_layer)
+
+    delays: Dict[BaseNeuron, float] = {}
+    predecessor: Dict[BaseNeuron, BaseNeuron] = {} # a latest arriving dependency of each neuron
+    for neuron in order:
+        if neuron in input_set:
+            delays[neuron] = 0.0
+            continue
+
+        if isinstance(neuron, ProxyNeuron) and neuron.source is None:
+            raise ValueError("ProxyNeuron source unset")
+
+        latest = None
+        for dependency in neuron.dependencies():
+            if latest is None or arrival[dependency] > arrival[latest]:
+                latest = dependency
+
+        delays[neuron] = delay(neuron)
+        arrival[neuron] = delays[neuron] + (arrival[latest] if latest is not None else 0.0)
+        if latest is not None:
+            predecessor[neuron] = latest
+
+    output_arrivals = [arrival[neuron] for neuron in output_layer]
+    if required_time is None:
+        required_time = max(output_arrivals, default = 0.0)
+
+    # backwards, the time by which each neuron's output is needed
+    required: Dict[BaseNeuron, float] = {neuron: required_time for neuron in output_layer}
+    for neuron in reversed(order):
+        if neuron in input_set:
+            continue
+        input_required = required[neuron] - delays[neuron]
+        for dependency in neuron.dependencies():
+            if dependency not in required or input_required < required[dependency]:
+                required[dependency] = input_required
+
+    slack = {neuron: required[neuron] - arrival[neuron] for neuron in order}
+
+    critical_path = []
+    if output_layer:
+        neuron = max(output_layer, key = arrival.__getitem__)
+        critical_path.append(neuron)
+        while neuron in predecessor:
+            neuron = predecessor[neuron]
+            critical_path.append(neuron)
+        critical_path.reverse()
+
+    return TimingReport(arrival, output_arrivals, required_time, slack, critical_path)
@@ -0,0 +1,202 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+import math
+import multiprocessing
+import os
+import time
+
+from .BitSlicedNetwork import pack_operands
+from .CompiledNetwork import CompiledNetwork
+
+OperandSpec = Union[int, Tuple[int, range]]
+# either `n_bit`, enumerating all `2 ** n_bit` values of an operand,
+# or `(n_bit, values)` enumerating just `values`
+
+class Counterexample:
+    """
+    Operands for which the network's output differs from the oracle's
+    """
+    def __init__(self, operands: Tuple[int], expected: int, actual: int) -> None:
+        self.operands = operands
+        self.expected = expected
+        self.actual = actual
+
+    def __repr__(self) -> str:
+        return f"Counterexample(operands = {self.operands}, expected = {self.expected}, actual = {self.actual})"
+
+class VerificationResult:
+    """
+    The outcome of `verify`; `counterexample` is `None` when every input vector checked out
+    """
+    def __init__(self, n_total: int, n_checked: int, counterexample: Optional[Counterexample], elapsed: float) -> None:
+        self.n_total = n_total
+        self.n_checked = n_checked
+        self.counterexample = counterexample
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.counterexample is None and self.n_checked == self.n_total
+
+    @property
+    def vectors_per_second(self) -> float:
+        return self.n_checked / self.elapsed if self.elapsed > 0 else math.inf
+
+    def __str__(self) -> str:
+        status = "OK" if self.ok else f"FAILED, {self.counterexample}"
+        return f"{status}: checked {self.n_checked:_} of {self.n_total:_} vectors in {self.elapsed:.3f}s ({self.vectors_per_second:_.0f} vectors/sec)"
+
+def _operand_values(input_spec: Sequence[OperandSpec]) -> Tuple[List[int], List[range]]:
+    widths = []
+    values = []
+    for operand_spec in input_spec:
+        if isinstance(operand_spec, int):
+            widths.append(operand_spec)
+            values.append(range(2 ** operand_spec))
+        else:
+            n_bit, operand_values = operand_spec
+            widths.append(n_bit)
+            values.append(operand_values)
+
+    return widths, values
+
+# per worker process state, set up once by `_init_worker` rather than shipped with every shard
+_worker_state = None
+
+def _init_worker(compiled: CompiledNetwork, oracle, input_spec, stop_event) -> None:
+    global _worker_state
+    _worker_state = (compiled, oracle, _operand_values(input_spec), stop_event)
+
+def _verify_shard(start: int, stop: int, batch_size: int) -> Tuple[int, Optional[int], Optional[Counterexample]]:
+    """
+    Check vectors `[start, stop)` of the input space, in order.
+    Returns the number of vectors checked, and the index and details of the first counterexample if any
+    """
+    compiled, oracle, (widths, values), stop_event = _worker_state
+
+    n_checked = 0
+    for batch_start in range(start, stop, batch_size):
+        if stop_event is not None and stop_event.is_set():
+            break
+
+        batch = range(batch_start, min(batch_start + batch_size, stop))
+
+        # vector index to operands in mixed radix, the first operand varying fastest
+        operands = []
+        for index in batch:
+            vector = []
+            for operand_values in values:
+                index, digit = divmod(index, len(operand_values))
+                vector.append(operand_values[digit])
+            operands.append(tuple(vector))
+
+        # lane `k` of each input wire is the corresponding bit of vector `k` of the batch
+        input_lanes = pack_operands(operands, widths)
+
+        output_lanes = compiled.output_lanes(input_lanes, len(batch))
+
+        expected = [oracle(*vector) for vector in operands]
+        mismatches = 0
+        for bit, lane in enumerate(output_lanes):
+            expected_lane = int("".join("1" if (e >> bit) & 1 else "0" for e in reversed(expected)), 2)
+            mismatches |= lane ^ expected_lane
+        if any(e >> len(output_lanes) for e in expected):
+            # the oracle's answer doesn't fit in the output layer
+            mismatches |= int("".join("1" if e >> len(output_lanes) else "0" for e in reversed(expected)), 2)
+
+        if mismatches:
+            k = (mismatches & -mismatches).bit_length() - 1 # lowest set bit
+            actual = sum(((lane >> k) & 1) << bit for (bit, lane) in enumerate(output_lanes))
+            if stop_event is not None:
+                stop_event.set()
+            return n_checked + k + 1, batch[k], Counterexample(operands[k], expected[k], actual)
+
+        n_checked += len(batch)
+
+    return n_checked, None, None
+
+def verify(
+    network,
+    oracle: Callable[..., int],
+    input_spec: Sequence[OperandSpec],
+    n_workers: Optional[int] = None,
+    shard_size: int = 2 ** 16,
+    batch_size: int = 2 ** 12,
+) -> VerificationResult:
+    """
+    Exhaustively check `network` against `oracle` over the input space described by `input_spec`.
+
+    The input layer is read as a concatenation of little bittian operands, one per entry of
+    `input_spec`, and the output layer as one little bittian number.
+    For each vector of operands `oracle(*operands)` must return the expected output as an int;
+    it must be picklable, eg a module level function, when using more than one worker.
+
+    The input space is split into shards of `shard_size` vectors which are farmed out to a pool
+    of `n_workers` processes (by default one per CPU), each evaluating `batch_size` vectors at a time
+    with `CompiledNetwork.output_lanes`. Only the flat `CompiledNetwork` is shipped to the workers.
+    The network is checked as `NeuronNetwork.__call__` evaluates it, with `Perceptron.heaviside`'s epsilon:
+    by a `BitSlicedNetwork`, the ideal step, when `CompiledNetwork.epsilon_free` proves that agrees,
+    as it does for the example networks, else by the much slower `CompiledNetwork.evaluate`.
+    Verification stops early on a counterexample; the one with the lowest index found is reported
+    """
+    if isinstance(network, CompiledNetwork):
+        compiled = network
+    else:
+        compiled = network.compiled
+
+    widths, values = _operand_values(input_spec)
+    assert sum(widths) == compiled.n_inputs
+    n_total = math.prod(len(operand_values) for operand_values in values)
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+
+    shards = [(start, min(start + shard_size, n_total)) for start in range(0, n_total, shard_size)]
+
+    start_time = time.perf_counter()
+
+    n_checked = 0
+    found: List[Tuple[int, Counterexample]] = []
+
+    if n_workers <= 1 or len(shards) <= 1:
+        _init_worker(compiled, oracle, input_spec, None)
+        for shard_start, shard_stop in shards:
+            n_shard_checked, index, counterexample = _verify_shard(shard_start, shard_stop, batch_size)
+            n_checked += n_shard_checked
+            if counterexample is not None:
+                found.append((index, counterexample))
+                break
+    else:
+        context = multiprocessing.get_context()
+        stop_event = context.Event()
+        with ProcessPoolExecutor(
+            max_workers = n_workers,
+            mp_context = context,
+            initializer = _init_worker,
+            initargs = (compiled, oracle, input_spec, stop_event),
+        ) as executor:
+            pending = {executor.submit(_verify_shard, shard_start, shard_stop, batch_size) for (shard_start, shard_stop) in shards}
+            while pending:
+                done, pending = wait(pending, return_when = FIRST_COMPLETED)
+                for future in done:
+                    n_shard_checked, index, counterexample = future.result()
+                    n_checked += n_shard_checked
+                    if counterexample is not None:
+                        found.append((index, counterexample))
+                if found:
+                    for future in pending:
+                        future.cancel()
+                    # shards already running stop at their next batch, but are still counted
+                    for future in pending:
+                        if not future.cancelled():
+                            n_shard_checked, index, counterexample = future.result()
+                            n_checked += n_shard_checked
+                            if counterexample is not None:
+                                found.append((index, counterexample))
+                    break
+
+    elapsed = time.perf_counter() - start_time
+
+    counterexample = min(found, key = lambda pair: pair[0])[1] if found else None
+
+    return VerificationResult(n_total, n_checked, counterexample, elapsed)
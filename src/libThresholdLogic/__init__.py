@@ -3,4 +3,19 @@
 __version__ = "1.0.0a"
 
 from .Neurons import BaseNeuron, ConstNeuron, Perceptron, ProxyNeuron
+from .CompiledNetwork import CompiledNetwork
+from .BitSlicedNetwork import BitSlicedNetwork, exhaustive_lanes, pack_operands, unpack_lanes
+from .Equivalence import BDD, check_equivalence, EquivalenceResult, variable_order
+from .EvaluationSession import EvaluationSession
+from .FaultSimulation import FaultSimulationResult, Gaussian, NoiseModel, simulate_faults, Uniform
+from .IntegerNetwork import IntegerNetwork
+from .LookupNetwork import LookupBlock, LookupNetwork
+from .NetworkBuilder import NetworkBuilder
+from .NetworkStats import NetworkStats
+from .NetworkTemplate import clear_templates, NetworkTemplate
 from .NeuronNetwork import NeuronNetwork
+from .Optimizer import optimize_layers, OptimizationReport
+from .Profiler import NeuronProfile, Profiler
+from .ShortCircuitNetwork import ShortCircuitNetwork
+from .TimingAnalysis import analyze_timing, DelayModel, TimingReport
+from .Verification import verify, VerificationResult, Counterexample
@@ -0,0 +1,94 @@
+from fractions import Fraction
+from math import ceil, gcd, lcm
+from typing import Iterable, List, Set, Tuple, Union
+
+from .Neurons import BaseNeuron
+from .Neurons.Perceptron import epsilon
+
+def topological_order(output_layer: Iterable[BaseNeuron], leaves: Iterable[BaseNeuron] = ()) -> List[BaseNeuron]:
+    """
+    Every neuron that `output_layer` depends upon, each listed after all of its dependencies.
+    The walk does not descend past any neuron in `leaves`, such as a network's `input_layer`.
+    This is an iterative depth-first walk, so arbitrarily deep networks don't hit the recursion limit
+    """
+    leaves: Set[BaseNeuron] = set(leaves)
+    visited: Set[BaseNeuron] = set()
+    order: List[BaseNeuron] = []
+
+    for root in output_layer:
+        if root in visited:
+            continue
+
+        visited.add(root)
+        stack = [(root, iter(() if root in leaves else root.dependencies()))]
+
+        while stack:
+            neuron, dependencies = stack[-1]
+            for dependency in dependencies:
+                if dependency not in visited:
+                    visited.add(dependency)
+                    stack.append((dependency, iter(() if dependency in leaves else dependency.dependencies())))
+                    break
+            else:
+                # all dependencies of `neuron` have been listed
+                stack.pop()
+                order.append(neuron)
+
+    return order
+
+def integer_threshold_form(
+    weights: Iterable[Union[int, float, Fraction]],
+    bias: Union[int, float, Fraction],
+) -> Tuple[List[int], int]:
+    """
+    Rescale a perceptron's weights and bias exactly into integers `int_weights` and `threshold`
+    such that the perceptron outputs 1 exactly when `sum(int_weights[i] * x[i]) >= threshold`.
+    Floats are dyadic rationals, so the common denominator is a power of two; it is then divided
+    back down by the gcd of the weights to keep the integers as small as possible.
+    This is the ideal Heaviside step, without `Perceptron.heaviside`'s epsilon
+    """
+    fractions = [Fraction(weight) for weight in weights]
+    bias = Fraction(bias)
+
+    denominator = lcm(bias.denominator, *(f.denominator for f in fractions))
+    int_weights = [int(f * denominator) for f in fractions]
+    threshold = bias * denominator
+
+    divisor = gcd(*int_weights)
+    if divisor > 1:
+        # every weighted sum is a multiple of `divisor`
+        int_weights = [weight // divisor for weight in int_weights]
+        threshold /= divisor
+
+    return int_weights, ceil(threshold)
+
+def ideal_step_agrees(
+    weights: Iterable[Union[int, float, Fraction]],
+    bias: Union[int, float, Fraction],
+) -> bool:
+    """
+    Whether a perceptron gives the same output for every 0/1 input under `Perceptron.heaviside`,
+    summing its float weights in any order, as under the ideal step of `integer_threshold_form`.
+    They differ only where a weighted sum short of the bias comes within epsilon of it, or where float
+    rounding could carry a sum across; every weighted sum is a multiple of the gcd of the weights,
+    so it suffices that the greatest multiple below the bias is further than epsilon plus a bound on
+    the rounding. Conservative, as not every multiple need be a reachable sum
+    """
+    fractions = [Fraction(weight) for weight in weights]
+    bias = Fraction(bias)
+
+    # each of the `n + 1` float additions and subtractions, and each product of a weight and a
+    # constant input, is off by at most a relative 2 ** -53 of a value no bigger than this sum
+    rounding = Fraction(2 * (len(fractions) + 1), 2 ** 53) * (sum(abs(f) for f in fractions) + abs(bias))
+    if rounding >= epsilon:
+        return False
+
+    denominator = lcm(*(f.denominator for f in fractions)) if fractions else 1
+    divisor = gcd(*(int(f * denominator) for f in fractions))
+    if divisor == 0:
+        # the sum is always 0, which fires in float for `bias <= epsilon` but ideally for `bias <= 0`
+        return not 0 < bias <= epsilon
+
+    unit = Fraction(divisor, denominator)
+    below = (ceil(bias / unit) - 1) * unit
+    return bias - below > epsilon + rounding
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+import itertools
+import random
+import tracemalloc
+
+import numpy as np
+
+from libThresholdLogic.ExampleNetworks import GenericNumberAdder, GenericBitMultiplier, HammingGate, ints_to_bit_matrix, bit_matrix_to_ints
+
+def test_against_call() -> None:
+    for network in (
+        GenericNumberAdder(2, 3),
+        HammingGate((1, 1, 0, 0, 1), 2),
+    ):
+        inputs = np.array(list(itertools.product((0, 1), repeat = len(network.input_layer))))
+        outputs = network.evaluate_batch(inputs, chunk_size = 100)
+        for input_bits, output_bits in zip(inputs.tolist(), outputs.tolist()):
+            assert network(*input_bits) == tuple(output_bits)
+        print(type(network).__name__, len(inputs), "rows")
+
+def test_multiplier() -> None:
+    n_bit = 8
+    mult = GenericBitMultiplier(n_bit)
+    x, y = np.divmod(np.arange(2 ** (2 * n_bit)), 2 ** n_bit)
+    inputs = ints_to_bit_matrix([x, y], (n_bit, n_bit))
+
+    outputs = mult.evaluate_batch(inputs)
+
+    [res] = bit_matrix_to_ints(outputs)
+    assert (res == x * y).all()
+    print(type(mult).__name__, n_bit, len(inputs), "rows")
+
+def test_memory() -> None:
+    # the default chunk size bounds the per-chunk matrix of slot values by the network's size
+    n_bit = 64
+    mult = GenericBitMultiplier(n_bit)
+    compiled = mult.compiled
+    random.seed(0)
+    x = [random.getrandbits(n_bit) for _ in range(5000)]
+    y = [random.getrandbits(n_bit) for _ in range(5000)]
+    inputs = ints_to_bit_matrix([x, y], (n_bit, n_bit))
+    mult.evaluate_batch(inputs[:1]) # build the levels outside the measurement
+
+    tracemalloc.start()
+    outputs = mult.evaluate_batch(inputs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    [products] = bit_matrix_to_ints(outputs, (outputs.shape[1],))
+    assert list(products) == [a * b for (a, b) in zip(x, y)]
+    assert peak < 64 * 2 ** 20, peak # about 16 MiB of slot values, and a level's sums
+    print(type(mult).__name__, n_bit, compiled.n_slots, "slots", len(inputs), f"rows, peak {peak / 2 ** 20:.1f} MiB")
+
+def main() -> None:
+    test_against_call()
+    test_multiplier()
+    test_memory()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+import random
+import time
+
+import numpy as np
+
+from libThresholdLogic.ExampleNetworks import (
+    GenericNumberAdder, GenericBitMultiplier,
+    int_to_bit_tuple_lb, int_to_bit_tuple_bb, bit_tuple_lb_to_int, bit_tuple_bb_to_int,
+    ints_to_bit_tuple_lb, ints_to_bit_matrix, bit_matrix_to_ints,
+)
+
+def test_scalar() -> None:
+    for x in range(-8, 64):
+        for n_bits in range(8):
+            bits = int_to_bit_tuple_lb(x, n_bits)
+            assert bits == tuple(1 if x & (1 << bit) else 0 for bit in range(n_bits))
+            assert int_to_bit_tuple_bb(x, n_bits) == bits[::-1]
+            assert bit_tuple_lb_to_int(bits) == x % 2 ** n_bits
+            assert bit_tuple_bb_to_int(bits[::-1]) == x % 2 ** n_bits
+
+    assert ints_to_bit_tuple_lb((1, 2, 3), 2) == (1, 0, 0, 1, 1, 1)
+    random.seed(2)
+    for n_bits in (1, 3, 8, 64, 65):
+        for n_operands in range(1, 5):
+            operands = [random.getrandbits(n_bits) for _ in range(n_operands)]
+            assert ints_to_bit_tuple_lb(operands, n_bits) == sum((int_to_bit_tuple_lb(x, n_bits) for x in operands), ())
+    assert ints_to_bit_tuple_lb((), 8) == ()
+
+def test_matrix_layout() -> None:
+    # row for row, the same as concatenating the operands' bit tuples
+    random.seed(0)
+    widths = (3, 64, 65, 200)
+    rows = [tuple(random.getrandbits(n_bits) for n_bits in widths) for _ in range(100)]
+    matrix = ints_to_bit_matrix(list(zip(*rows)), widths)
+    assert matrix.dtype == np.uint8 and matrix.shape == (100, sum(widths))
+    for row, bits in zip(rows, matrix.tolist()):
+        assert tuple(bits) == sum((int_to_bit_tuple_lb(x, n_bits) for (x, n_bits) in zip(row, widths)), ())
+
+    columns = bit_matrix_to_ints(matrix, widths)
+    assert columns[0].dtype == np.uint64 and columns[1].dtype == np.uint64
+    for operand_idx, column in enumerate(columns):
+        assert [int(x) for x in column] == [row[operand_idx] for row in rows]
+
+    for bad in ([8], np.array([8]), [-1], np.array([-1])):
+        try:
+            ints_to_bit_matrix([bad], (3,))
+        except ValueError:
+            pass
+        else:
+            assert False, "operand too wide accepted"
+
+def test_networks() -> None:
+    n_bit = 8
+    adder = GenericNumberAdder(n_bit, 3)
+    numbers = [np.random.default_rng(idx).integers(0, 2 ** n_bit, 1000) for idx in range(5)]
+    [sums] = bit_matrix_to_ints(adder.evaluate_batch(ints_to_bit_matrix(numbers, (n_bit,) * 5)))
+    assert (sums == sum(numbers) % 2 ** n_bit).all()
+
+    n_bit = 40 # products wider than 64 bits
+    mult = GenericBitMultiplier(n_bit)
+    random.seed(1)
+    x = [random.getrandbits(n_bit) for _ in range(50)]
+    y = [random.getrandbits(n_bit) for _ in range(50)]
+    outputs = mult.evaluate_batch(ints_to_bit_matrix([x, y], (n_bit, n_bit)))
+    [products] = bit_matrix_to_ints(outputs, (outputs.shape[1],))
+    assert list(products) == [a * b for (a, b) in zip(x, y)]
+
+def test_speed() -> None:
+    n_bit = 32
+    rng = np.random.default_rng(0)
+    x, y = rng.integers(0, 2 ** n_bit, (2, 100_000))
+
+    start = time.perf_counter()
+    one_at_a_time = np.array([int_to_bit_tuple_lb(a, n_bit) + int_to_bit_tuple_lb(b, n_bit) for (a, b) in zip(x.tolist(), y.tolist())], dtype = np.uint8)
+    one_at_a_time_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = ints_to_bit_matrix([x, y], (n_bit, n_bit))
+    batched_time = time.perf_counter() - start
+
+    assert (batched == one_at_a_time).all()
+    print(f"encoding {len(x)} pairs of {n_bit}-bit operands: one at a time {one_at_a_time_time:.3f}s, batched {batched_time:.4f}s")
+
+def main() -> None:
+    test_scalar()
+    test_matrix_layout()
+    test_networks()
+    test_speed()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+import itertools
+
+from libThresholdLogic import BitSlicedNetwork, exhaustive_lanes
+from libThresholdLogic.ExampleNetworks import (
+    FullAdder, GenericBitAdder, GenericNumberAdder,
+    HammingGate, GNAND, XOR, XNOR,
+    BitMultiplier2x2, GenericBitMultiplier,
+)
+
+def test_against_call() -> None:
+    for network in (
+        FullAdder(),
+        GenericBitAdder(4),
+        GenericNumberAdder(3, 3),
+        HammingGate((1, 1, 0, 0, 1), 2),
+        GNAND((1, 0, 1)),
+        XOR(return_carry_bit = True),
+        XNOR(return_carry_bit = True),
+        BitMultiplier2x2(),
+        GenericBitMultiplier(3),
+    ):
+        bit_sliced = BitSlicedNetwork(network.compile())
+        inputs = list(itertools.product((0, 1), repeat = len(network.input_layer)))
+        assert bit_sliced.evaluate_batch(inputs) == [network(*input_bits) for input_bits in inputs]
+        print(type(network).__name__, len(inputs), "lanes")
+
+def test_multiplier() -> None:
+    n_bit = 8
+    bit_sliced = BitSlicedNetwork(GenericBitMultiplier(n_bit).compile())
+
+    # lane `k` multiplies the lower `n_bit` bits of `k` by the upper `n_bit` bits
+    input_lanes, n_lanes = exhaustive_lanes(2 * n_bit)
+    output_lanes = bit_sliced.output_lanes(input_lanes, n_lanes)
+
+    for k in range(n_lanes):
+        x, y = k % 2 ** n_bit, k // 2 ** n_bit
+        res = sum(((lane >> k) & 1) << idx for (idx, lane) in enumerate(output_lanes))
+        assert x * y == res
+    print(GenericBitMultiplier.__name__, n_bit, n_lanes, "lanes")
+
+def main() -> None:
+    test_against_call()
+    test_multiplier()
+
+if __name__ == "__main__":
+    main()
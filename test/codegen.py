@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+import itertools
+import pickle
+import random
+import time
+
+from libThresholdLogic.ExampleNetworks import BitMultiplier2x2, FullAdder, GenericBitMultiplier, GenericNumberAdder, HammingGate, int_to_bit_tuple_lb
+
+def test_exhaustive() -> None:
+    for network in (FullAdder(), BitMultiplier2x2(), HammingGate((1, 0, 1, 1, 0, 0), 2), GenericNumberAdder(3, 2), GenericBitMultiplier(4)):
+        function = network.codegen()
+        for inputs in itertools.product((0, 1), repeat = len(network.input_layer)):
+            assert function(*inputs) == network(*inputs)
+
+def test_cached() -> None:
+    adder = GenericNumberAdder(4, 2)
+    assert adder.codegen() is adder.codegen()
+    assert "def network(" in adder.codegen().source
+
+    # the generated function is rebuilt rather than pickled
+    compiled = pickle.loads(pickle.dumps(adder.compiled))
+    assert compiled.codegen()(*(1,) * 8) == adder(*(1,) * 8)
+
+def test_exact() -> None:
+    mult = GenericBitMultiplier(4)
+    function = mult.compiled.to_exact().codegen()
+    assert "." not in function.source.split(":", 1)[1] # integer literals only
+    for inputs in itertools.product((0, 1), repeat = 8):
+        assert function(*inputs) == mult(*inputs)
+
+def test_wide() -> None:
+    # a perceptron with more inputs than fit in one expression
+    target = tuple(random.Random(0).getrandbits(1) for _ in range(500))
+    gate = HammingGate(target, 10)
+    function = gate.codegen()
+    assert function(*target) == (1,)
+    flipped = list(target)
+    for idx in range(11):
+        flipped[idx] ^= 1
+    assert function(*flipped) == gate(*flipped) == (0,)
+
+def test_speed() -> None:
+    n_bit = 16
+    mult = GenericBitMultiplier(n_bit)
+    random.seed(0)
+    rows = [int_to_bit_tuple_lb(random.getrandbits(n_bit), n_bit) + int_to_bit_tuple_lb(random.getrandbits(n_bit), n_bit) for _ in range(200)]
+
+    start = time.perf_counter()
+    called = [mult(*row) for row in rows]
+    called_time = time.perf_counter() - start
+
+    compiled = mult.compiled
+    compiled(*rows[0]) # compile outside of the timing
+    start = time.perf_counter()
+    interpreted = [compiled(*row) for row in rows]
+    interpreted_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    function = mult.codegen()
+    codegen_time = time.perf_counter() - start
+    start = time.perf_counter()
+    generated = [function(*row) for row in rows]
+    generated_time = time.perf_counter() - start
+
+    assert called == interpreted == generated
+    print(
+        f"{len(rows)} {n_bit}-bit products: __call__ {called_time:.3f}s, compiled {interpreted_time:.3f}s, "
+        f"generated {generated_time:.3f}s (+{codegen_time:.3f}s to generate)"
+    )
+
+def main() -> None:
+    test_exhaustive()
+    test_cached()
+    test_exact()
+    test_wide()
+    test_speed()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+import itertools
+
+from libThresholdLogic import NeuronNetwork
+from libThresholdLogic.ExampleNetworks import (
+    HalfAdder, FullAdder, GenericBitAdder, GenericNumberAdder,
+    HammingGate, XOR, XNOR, NOT,
+    BitMultiplier2x2, GenericBitMultiplier,
+)
+
+def check_exhaustive(network: NeuronNetwork) -> None:
+    compiled = network.compile()
+    for inputs in itertools.product((0, 1), repeat = len(network.input_layer)):
+        assert compiled(*inputs) == network(*inputs)
+    print(type(network).__name__, compiled.n_perceptrons, "perceptrons", compiled.depth, "levels")
+
+def main() -> None:
+    for network in (
+        HalfAdder(),
+        FullAdder(),
+        GenericBitAdder(3),
+        GenericNumberAdder(2, 3),
+        HammingGate((1, 1, 0, 0, 1), 2),
+        XOR(return_carry_bit = True),
+        XNOR(return_carry_bit = True),
+        NOT(),
+        BitMultiplier2x2(),
+        GenericBitMultiplier(4),
+    ):
+        check_exhaustive(network)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import random
+
+from libThresholdLogic import NeuronNetwork, ProxyNeuron
+from libThresholdLogic.ExampleNetworks import GenericNumberAdder, XOR, ints_to_bit_tuple_lb, bit_tuple_lb_to_int
+
+class XORChain(NeuronNetwork):
+    """
+    The parity of `n_inputs` bits, from a chain of `XOR`s joined with `connect_inputs`
+    """
+    def __init__(self, n_inputs: int) -> None:
+        input_layer = [ProxyNeuron() for _ in range(n_inputs)]
+
+        parity = input_layer[0]
+        for neuron in input_layer[1:]:
+            xor = XOR()
+            xor.connect_inputs(parity, neuron)
+            parity = xor.output_layer[0]
+
+        super().__init__(input_layer, [parity])
+
+def test_ripple_carry() -> None:
+    n_bit = 5000 # a recursive depth-first evaluation would need a stack at least this deep
+    adder = GenericNumberAdder(n_bit, 2)
+    compiled = adder.compile()
+    for _ in range(3):
+        nums = (random.getrandbits(n_bit - 1), random.getrandbits(n_bit - 1))
+        input_bits = ints_to_bit_tuple_lb(nums, n_bit)
+        assert bit_tuple_lb_to_int(adder(*input_bits)) == sum(nums)
+        assert bit_tuple_lb_to_int(compiled(*input_bits)) == sum(nums)
+    print(type(adder).__name__, n_bit, "bits,", compiled.depth, "levels")
+
+def test_chained() -> None:
+    n_inputs = 3000
+    chain = XORChain(n_inputs)
+    for _ in range(3):
+        input_bits = tuple(random.getrandbits(1) for _ in range(n_inputs))
+        assert chain(*input_bits) == (sum(input_bits) % 2,)
+    print(type(chain).__name__, n_inputs, "inputs")
+
+def main() -> None:
+    test_ripple_carry()
+    test_chained()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+import itertools
+
+from libThresholdLogic import BDD, check_equivalence, NeuronNetwork
+from libThresholdLogic.ExampleNetworks import (
+    AND, BitMultiplier2x2, GenericBitMultiplier, GenericNumberAdder, HammingGate, PrefixAdder, WallaceTreeMultiplier,
+)
+
+def test_bdd() -> None:
+    bdd = BDD(3)
+    x, y, z = (bdd.var(i) for i in range(3))
+    # canonical, so equal functions built differently are the same node
+    assert bdd.ite(x, y, bdd.FALSE) == bdd.ite(y, x, bdd.FALSE)
+    assert bdd.negate(bdd.negate(z)) == z
+    assert bdd.xor(x, x) == bdd.FALSE
+
+    majority = bdd.threshold([1, 1, 1], [x, y, z], 2)
+    for bits in itertools.product((0, 1), repeat = 3):
+        f = majority
+        while f not in (bdd.FALSE, bdd.TRUE):
+            var, low, high = bdd.nodes[f]
+            f = high if bits[var] else low
+        assert (f == bdd.TRUE) == (sum(bits) >= 2)
+
+    assert bdd.satisfying_assignment(bdd.FALSE) is None
+    assert bdd.satisfying_assignment(bdd.ite(x, bdd.negate(y), bdd.FALSE)) == {0: 1, 1: 0}
+
+def first_outputs(network, n_outputs: int) -> NeuronNetwork:
+    return NeuronNetwork(network.input_layer, network.output_layer[:n_outputs])
+
+def test_equivalent() -> None:
+    result = check_equivalence(BitMultiplier2x2(), GenericBitMultiplier(2))
+    print(result)
+    assert result.equivalent and result.counterexample is None
+
+    # `GenericBitMultiplier` has an extra carry output, always 0
+    assert check_equivalence(first_outputs(GenericBitMultiplier(6), 12), WallaceTreeMultiplier(6))
+    assert check_equivalence(AND(5), HammingGate((1,) * 5, 0).compile())
+
+    # an adder in a bad variable order is still proved, just with more nodes
+    good = check_equivalence(GenericNumberAdder(6, 2), PrefixAdder(6))
+    bad = check_equivalence(GenericNumberAdder(6, 2), PrefixAdder(6), order = list(range(12)))
+    assert good and bad and good.n_nodes < bad.n_nodes
+
+def test_counterexample() -> None:
+    adder = GenericNumberAdder(8, 2)
+    broken = GenericNumberAdder(8, 2)
+    broken.output_layer[5].bias += 1.0
+
+    result = check_equivalence(adder, broken)
+    print(result)
+    assert not result.equivalent
+    assert result.mismatched_outputs == [5]
+    assert adder(*result.counterexample) == result.outputs[0]
+    assert broken(*result.counterexample) == result.outputs[1]
+    assert result.outputs[0][5] != result.outputs[1][5]
+
+    try:
+        check_equivalence(adder, PrefixAdder(4))
+    except ValueError:
+        pass
+    else:
+        assert False, "networks of different sizes compared"
+
+def test_large() -> None:
+    # 320 input bits, far beyond enumerating
+    adder = GenericNumberAdder(64, 3)
+    optimized, _ = adder.optimize()
+    result = check_equivalence(adder, optimized)
+    print(f"GenericNumberAdder(64, 3) against its optimized form: {result}")
+    assert result
+
+    result = check_equivalence(GenericNumberAdder(64, 2), PrefixAdder(64))
+    print(f"GenericNumberAdder(64, 2) against PrefixAdder(64): {result}")
+    assert result
+
+def main() -> None:
+    test_bdd()
+    test_equivalent()
+    test_counterexample()
+    test_large()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+import random
+
+from libThresholdLogic.ExampleNetworks import GenericBitMultiplier, GenericNumberAdder, int_to_bit_tuple_lb, bit_tuple_lb_to_int
+
+def test_sweep_one_operand() -> None:
+    n_bit = 8
+    mult = GenericBitMultiplier(n_bit)
+    session = mult.session()
+
+    y = 173
+    y_bits = int_to_bit_tuple_lb(y, n_bit)
+    for x in range(2 ** n_bit):
+        x_bits = int_to_bit_tuple_lb(x, n_bit)
+        res = bit_tuple_lb_to_int(session(*(x_bits + y_bits)))
+        assert x * y == res
+
+    n_full = 2 ** n_bit * len(mult.compiled.biases)
+    print(f"{type(mult).__name__} sweep: {session.n_evaluations} of {n_full} perceptron evaluations")
+    assert session.n_evaluations < n_full
+
+def test_counter() -> None:
+    n_bit = 16
+    adder = GenericNumberAdder(n_bit, 2)
+    one = int_to_bit_tuple_lb(1, n_bit)
+
+    # accumulate by feeding the sum back in as the first operand
+    session = adder.session(int_to_bit_tuple_lb(0, n_bit) + one)
+    for count in range(1, 1000):
+        total = session.outputs
+        assert bit_tuple_lb_to_int(total) == count
+        session.update({idx: bit for (idx, bit) in enumerate(total)})
+
+def test_random_updates() -> None:
+    adder = GenericNumberAdder(12, 3)
+    n_inputs = len(adder.input_layer)
+    session = adder.session()
+    for _ in range(500):
+        changes = {random.randrange(n_inputs): random.getrandbits(1) for _ in range(random.randint(1, 4))}
+        outputs = session.update(changes)
+        assert outputs == adder(*session.inputs)
+
+def main() -> None:
+    test_sweep_one_operand()
+    test_counter()
+    test_random_updates()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+import itertools
+
+from libThresholdLogic import NeuronNetwork, Perceptron, ProxyNeuron
+from libThresholdLogic.ExampleNetworks import GenericBitAdder, GenericNumberAdder, HammingGate, BitMultiplier2x2, GenericBitMultiplier
+
+class NearlyAND(NeuronNetwork):
+    """
+    `x0 AND NOT x1`, but with `x1` only very slightly inhibitory,
+    within `Perceptron.heaviside`'s epsilon
+    """
+    def __init__(self) -> None:
+        neuron = Perceptron(1.0)
+        input_layer = [ProxyNeuron() for _ in range(2)]
+        neuron.add_input(1.0, input_layer[0])
+        neuron.add_input(-(2 ** -25), input_layer[1])
+        super().__init__(input_layer, [neuron])
+
+def test_agrees_with_float() -> None:
+    for network in (
+        GenericBitAdder(4),
+        GenericNumberAdder(3, 3),
+        HammingGate((1, 1, 0, 0, 1), 2),
+        BitMultiplier2x2(),
+        GenericBitMultiplier(3),
+    ):
+        exact = network.compile(exact = True)
+        assert all(isinstance(weight, int) for weight in exact.weights)
+        for input_bits in itertools.product((0, 1), repeat = len(network.input_layer)):
+            assert exact(*input_bits) == network(*input_bits)
+        print(type(network).__name__, "weights", sorted(set(exact.weights)))
+
+def test_beyond_epsilon() -> None:
+    network = NearlyAND()
+    exact = network.compile(exact = True)
+    print(type(network).__name__, "weights", exact.weights, "threshold", exact.biases)
+
+    assert network(1, 1) == (1,) # the float epsilon hack gets this wrong
+    assert exact(1, 1) == (0,)
+    assert exact(1, 0) == (1,)
+
+def main() -> None:
+    test_agrees_with_float()
+    test_beyond_epsilon()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+from libThresholdLogic import Gaussian, NeuronNetwork, NoiseModel, ProxyNeuron, simulate_faults, Uniform
+from libThresholdLogic.ExampleNetworks import AND, OR, FullAdder, GenericBitMultiplier, GenericNumberAdder
+
+def test_ideal() -> None:
+    # without noise or faults every trial matches the ideal network
+    adder = GenericNumberAdder(8, 2)
+    result = simulate_faults(adder, NoiseModel(), 10_000, n_workers = 1)
+    assert result.word_errors == 0
+    assert result.bit_error_rates == [0.0] * 8
+    assert result.most_sensitive() == []
+
+    # nor does noise too small to cross `Perceptron.heaviside`'s epsilon
+    result = simulate_faults(adder, NoiseModel(bias = Uniform(1e-8), weight = Uniform(1e-8, relative = True)), 10_000, n_workers = 1)
+    assert result.word_errors == 0
+
+def test_stuck() -> None:
+    # with every perceptron stuck at 1 every output is 1, wrong for half of the random inputs
+    adder = FullAdder()
+    result = simulate_faults(adder, NoiseModel(stuck_at_1 = 1.0), 20_000, n_workers = 1)
+    assert result.fault_counts == [20_000, 20_000]
+    for rate in result.bit_error_rates:
+        assert 0.45 < rate < 0.55
+    assert 0.85 < result.word_error_rate < 0.90 # right only when all three inputs are 1, 1/8 of the time
+
+    # in `a OR (b AND c)` a fault of the `AND` only matters when `a` is 0, whereas one of the `OR` always might
+    input_layer = [ProxyNeuron() for _ in range(3)]
+    and_ = AND()
+    and_.connect_inputs(*input_layer[1:])
+    or_ = OR()
+    or_.connect_inputs(input_layer[0], and_.output_layer[0])
+    network = NeuronNetwork(input_layer, or_.output_layer)
+
+    result = simulate_faults(network, NoiseModel(stuck_at_0 = 0.05, stuck_at_1 = 0.05), 50_000, n_workers = 1)
+    (slot, neuron, sensitivity, n_faults), (_, and_neuron, and_sensitivity, _) = result.most_sensitive()
+    assert neuron is or_.output_layer[0] and and_neuron is and_.output_layer[0]
+    assert sensitivity > 0.45 and and_sensitivity < 0.3 and n_faults > 0
+
+def test_reproducible() -> None:
+    mult = GenericBitMultiplier(4)
+    noise = NoiseModel(bias = Gaussian(0.1), weight = Gaussian(0.05, relative = True), stuck_at_0 = 1e-3, stuck_at_1 = 1e-3)
+
+    # the same seed gives the same counts whether the chunks are simulated in one process or several
+    result_1 = simulate_faults(mult, noise, 20_000, seed = 7, n_workers = 1, chunk_size = 1024)
+    result_2 = simulate_faults(mult, noise, 20_000, seed = 7, n_workers = 2, chunk_size = 1024)
+    assert result_1.bit_errors == result_2.bit_errors
+    assert result_1.fault_counts == result_2.fault_counts
+    assert result_1.fault_errors == result_2.fault_errors
+
+    result_3 = simulate_faults(mult, noise, 20_000, seed = 8, n_workers = 1, chunk_size = 1024)
+    assert result_3.bit_errors != result_1.bit_errors
+
+def test_report() -> None:
+    for network in (GenericNumberAdder(16, 2), GenericBitMultiplier(8)):
+        result = simulate_faults(network, NoiseModel(stuck_at_0 = 1e-3, stuck_at_1 = 1e-3), 100_000, n_workers = 1)
+        print(type(network).__name__)
+        print(result)
+        assert len(result.bit_error_rates) == len(network.output_layer)
+        assert 0 < result.word_error_rate < 1
+
+def main() -> None:
+    test_ideal()
+    test_stuck()
+    test_reproducible()
+    test_report()
+
+if __name__ == "__main__":
+    main()
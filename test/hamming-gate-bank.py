@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+import itertools
+import random
+import time
+
+from libThresholdLogic.ExampleNetworks import AND, GAND, HammingGate, HammingGateBank, NAND, NOR, OR
+
+def make_gates(n_bits: int, n_gates: int, seed: int):
+    rng = random.Random(seed)
+    # including radii which aren't integers, and within `Perceptron.heaviside`'s epsilon of one
+    max_distances = (-1, 0, 1, 2, 3, n_bits, 1.5, 2.5, 0.4999999, 2.4999995)
+    gates = [
+        HammingGate(tuple(rng.getrandbits(1) for _ in range(n_bits)), rng.choice(max_distances))
+        for _ in range(n_gates)
+    ]
+    gates += [AND(n_bits), NOR(n_bits), OR(n_bits), NAND(n_bits), GAND(tuple(idx % 2 for idx in range(n_bits)))]
+    return gates
+
+def test_matches_gates() -> None:
+    n_bits = 7
+    gates = make_gates(n_bits, 30, 0)
+    bank = HammingGateBank.from_gates(gates)
+    assert bank.n_targets == len(gates)
+
+    for inputs in itertools.product((0, 1), repeat = n_bits):
+        assert bank(*inputs) == tuple(gate(*inputs)[0] for gate in gates)
+
+def test_nearest() -> None:
+    bank = HammingGateBank([(0, 0, 0, 0), (1, 1, 0, 0), (1, 1, 1, 1)], [1, 0, 1])
+    assert bank.distances((1, 1, 1, 0)) == [3, 1, 1]
+    assert bank.nearest((1, 1, 1, 0)) == (1, 1) # the lowest index of the ties
+    assert bank.nearest((1, 1, 1, 0), within_ball = True) == (2, 1)
+    assert bank.nearest((1, 0, 1, 0), within_ball = True) == (-1, -1)
+
+def test_batch() -> None:
+    try:
+        import numpy as np
+    except ImportError:
+        print("NumPy not installed, skipping")
+        return
+
+    n_bits = 7
+    gates = make_gates(n_bits, 30, 1)
+    bank = HammingGateBank.from_gates(gates)
+    rows = list(itertools.product((0, 1), repeat = n_bits))
+
+    expected = np.array([[gate(*row)[0] for gate in gates] for row in rows], dtype = np.uint8)
+    assert (bank.evaluate_batch(rows) == expected).all()
+    assert (bank.evaluate_batch(rows, chunk_size = 5) == expected).all()
+
+    for within_ball in (False, True):
+        indices, distances = bank.nearest_batch(rows, within_ball)
+        assert [bank.nearest(row, within_ball) for row in rows] == list(zip(indices.tolist(), distances.tolist()))
+
+    # targets of several words
+    n_bits = 150
+    bank = HammingGateBank([gate.target_vector for gate in make_gates(n_bits, 50, 2)], 60)
+    rows = np.random.default_rng(0).integers(0, 2, (40, n_bits))
+    assert bank.distance_matrix(rows).tolist() == [bank.distances(row) for row in rows.tolist()]
+
+def test_speed() -> None:
+    try:
+        import numpy as np
+    except ImportError:
+        return
+
+    n_bits, n_targets, n_rows = 256, 2000, 2000
+    rng = np.random.default_rng(0)
+    targets = rng.integers(0, 2, (n_targets, n_bits))
+    bank = HammingGateBank([tuple(target) for target in targets.tolist()], 100)
+    rows = rng.integers(0, 2, (n_rows, n_bits))
+
+    start = time.perf_counter()
+    membership = bank.evaluate_batch(rows)
+    batch_time = time.perf_counter() - start
+
+    gate = HammingGate(tuple(targets[0].tolist()), 100)
+    sample = rows[:20].tolist()
+    start = time.perf_counter()
+    assert [gate(*row)[0] for row in sample] == membership[:20, 0].tolist()
+    gate_time = (time.perf_counter() - start) / len(sample)
+
+    print(
+        f"{n_rows} inputs against {n_targets} {n_bits}-bit balls: bank {batch_time:.3f}s, "
+        f"one HammingGate call per pair would take ~{gate_time * n_rows * n_targets:.0f}s"
+    )
+
+def main() -> None:
+    test_matches_gates()
+    test_nearest()
+    test_batch()
+    test_speed()
+
+if __name__ == "__main__":
+    main()
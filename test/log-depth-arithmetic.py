@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import itertools
+import operator
+
+from libThresholdLogic import verify
+from libThresholdLogic.ExampleNetworks import (
+    GenericNumberAdder, GenericBitMultiplier, PrefixAdder, WallaceTreeMultiplier,
+    int_to_bit_tuple_lb, bit_tuple_lb_to_int,
+)
+
+def test_prefix_adder() -> None:
+    # exhaustively against `GenericNumberAdder`, which adds 2 numbers when `n_neurons` is 2
+    for n_bit in range(1, 7):
+        adder = PrefixAdder(n_bit)
+        reference = GenericNumberAdder(n_bit, 2)
+        for inputs in itertools.product((0, 1), repeat = 2 * n_bit):
+            assert adder(*inputs) == reference(*inputs)
+
+    for n_bit in (1, 5, 8):
+        result = verify(PrefixAdder(n_bit, return_carry_bit = True), operator.add, (n_bit, n_bit), n_workers = 1)
+        assert result.ok
+
+    adder = PrefixAdder(64, return_carry_bit = True).integers()
+    assert adder(2 ** 64 - 1, 1) == 2 ** 64
+    assert adder(12_345_678_901_234, 98_765_432_109_876) == 12_345_678_901_234 + 98_765_432_109_876
+
+def test_wallace_tree_multiplier() -> None:
+    for n_neurons in (2, 3):
+        # exhaustively against `GenericBitMultiplier`
+        for n_bit in range(1, 5):
+            mult = WallaceTreeMultiplier(n_bit, n_neurons)
+            reference = GenericBitMultiplier(n_bit)
+            for inputs in itertools.product((0, 1), repeat = 2 * n_bit):
+                assert bit_tuple_lb_to_int(mult(*inputs)) == bit_tuple_lb_to_int(reference(*inputs))
+
+        for n_bit in (5, 8):
+            result = verify(WallaceTreeMultiplier(n_bit, n_neurons), operator.mul, (n_bit, n_bit), n_workers = 1)
+            print(f"WallaceTreeMultiplier({n_bit}, {n_neurons})", result)
+            assert result.ok
+
+    mult = WallaceTreeMultiplier(32)
+    x, y = 3_141_592_653, 2_718_281_828
+    assert bit_tuple_lb_to_int(mult(*(int_to_bit_tuple_lb(x, 32) + int_to_bit_tuple_lb(y, 32)))) == x * y
+
+def test_depth() -> None:
+    previous = None
+    for n_bit in (4, 8, 16, 32, 64):
+        adder_depth = PrefixAdder(n_bit).stats().depth
+        ripple_adder_depth = GenericNumberAdder(n_bit, 2).stats().depth
+        assert adder_depth == (n_bit - 1).bit_length() + 2
+
+        mult_depth = WallaceTreeMultiplier(n_bit).stats().depth
+        ripple_mult_depth = GenericBitMultiplier(n_bit).stats().depth
+        print(f"{n_bit} bits: adder depth {adder_depth} (ripple {ripple_adder_depth}), multiplier depth {mult_depth} (ripple {ripple_mult_depth})")
+
+        # doubling the width adds a constant number of levels, two compressor stages and a prefix adder level
+        if previous is not None:
+            assert mult_depth - previous <= 5
+        previous = mult_depth
+
+    # columns of at most two bits go straight to the final adder, with no compressors
+    mult = WallaceTreeMultiplier(2)
+    assert mult.n_stages == 0
+    assert mult.stats().depth == GenericBitMultiplier(2).stats().depth
+    assert mult.compiled.n_perceptrons == GenericBitMultiplier(2).compiled.n_perceptrons
+
+def main() -> None:
+    test_prefix_adder()
+    test_wallace_tree_multiplier()
+    test_depth()
+
+if __name__ == "__main__":
+    main()
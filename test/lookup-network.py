@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+import itertools
+import random
+import time
+
+from libThresholdLogic import LookupNetwork, NeuronNetwork, Perceptron, ProxyNeuron
+from libThresholdLogic.ExampleNetworks import (
+    BitMultiplier2x2, FullAdder, GenericBitAdder, GenericBitMultiplier, GenericNumberAdder, HammingGate, WallaceTreeMultiplier,
+)
+
+def test_exhaustive() -> None:
+    networks = (
+        FullAdder(), BitMultiplier2x2(), GenericBitAdder(3), GenericNumberAdder(4, 2),
+        GenericNumberAdder(3, 3), GenericBitMultiplier(4), HammingGate((1, 0, 1, 1, 0), 2),
+    )
+    for network in networks:
+        for max_inputs in (1, 2, 3, 6, 10):
+            lookup = network.lookup(max_inputs)
+            assert all(len(block.input_slots) <= max_inputs for block in lookup.blocks if block.lookup)
+            for inputs in itertools.product((0, 1), repeat = len(network.input_layer)):
+                assert lookup(*inputs) == network(*inputs)
+
+def test_epsilon() -> None:
+    # tables are of `__call__`'s epsilon step, not the ideal step, for `x0 AND NOT x1`
+    # with `x1` inhibitory only within epsilon, and a 3 input `AND` of weights `1 / 3`
+    input_layer = [ProxyNeuron() for _ in range(2)]
+    nearly_and = NeuronNetwork(input_layer, [Perceptron(1.0, [(1.0, input_layer[0]), (-(2 ** -25), input_layer[1])])])
+    input_layer = [ProxyNeuron() for _ in range(3)]
+    thirds = NeuronNetwork(input_layer, [Perceptron(1.0, [(1 / 3, neuron) for neuron in input_layer])])
+
+    assert nearly_and.lookup()(1, 1) == nearly_and(1, 1) == (1,)
+    assert thirds.lookup()(1, 1, 1) == thirds(1, 1, 1) == (1,)
+    for network in (nearly_and, thirds):
+        lookup = network.lookup()
+        for inputs in itertools.product((0, 1), repeat = len(network.input_layer)):
+            assert lookup(*inputs) == network(*inputs)
+
+def test_blocks() -> None:
+    # a whole small subnetwork is one table
+    assert FullAdder().lookup().n_blocks == 1
+    assert GenericBitAdder(4).lookup(16).n_blocks == 1
+
+    # a perceptron too wide for a table is evaluated directly
+    gate = HammingGate((1, 0) * 8, 3)
+    lookup = gate.lookup(4)
+    assert [block.lookup for block in lookup.blocks] == [False]
+    assert lookup(*(1, 0) * 8) == (1,)
+    assert lookup(*(0, 1) * 8) == (0,)
+
+    # the identical ripple blocks of an adder share their tables
+    adder = GenericNumberAdder(16, 2).lookup(5)
+    adder(*(0,) * 32)
+    assert len({id(block.table) for block in adder.blocks}) < adder.n_blocks
+
+    exact = LookupNetwork(GenericBitMultiplier(3).compile(exact = True), 6)
+    mult = GenericBitMultiplier(3)
+    assert all(exact(*inputs) == mult(*inputs) for inputs in itertools.product((0, 1), repeat = 6))
+
+def test_speed() -> None:
+    random.seed(0)
+    for network in (GenericNumberAdder(32, 2), WallaceTreeMultiplier(16), GenericBitMultiplier(16)):
+        rows = [tuple(random.getrandbits(1) for _ in network.input_layer) for _ in range(300)]
+
+        compiled = network.compiled
+        compiled(*rows[0]) # compile outside of the timing
+        start = time.perf_counter()
+        lookup = network.lookup()
+        lookup(*rows[0])
+        build_time = time.perf_counter() - start
+
+        timings = []
+        for evaluator in (compiled, lookup):
+            times = []
+            for _ in range(3):
+                start = time.perf_counter()
+                outputs = [evaluator(*row) for row in rows]
+                times.append(time.perf_counter() - start)
+            timings.append(min(times))
+            if evaluator is compiled:
+                expected = outputs
+            assert outputs == expected
+
+        compiled_time, lookup_time = timings
+        print(
+            f"{type(network).__name__}: {compiled.n_perceptrons} perceptrons in {lookup.n_blocks} blocks, "
+            f"{len(rows)} calls compiled {compiled_time:.3f}s, lookup {lookup_time:.3f}s (+{build_time:.3f}s to build)"
+        )
+        assert lookup_time < compiled_time
+
+    # the `AND`s of the wide columns are tiled into blocks rather than each being a table of its own
+    lookup = GenericBitMultiplier(16).lookup()
+    assert all(len(block.perceptrons) > 1 for block in lookup.blocks if block.lookup and block.input_slots)
+    assert lookup.n_blocks < 100
+
+def main() -> None:
+    test_exhaustive()
+    test_epsilon()
+    test_blocks()
+    test_speed()
+
+if __name__ == "__main__":
+    main()
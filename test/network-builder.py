@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+from typing import List, Tuple
+import itertools
+import random
+import tracemalloc
+import weakref
+
+from libThresholdLogic import CompiledNetwork, NetworkBuilder, Perceptron, ProxyNeuron
+from libThresholdLogic.NetworkBuilder import NodeHandle, ProxyHandle
+from libThresholdLogic.ExampleNetworks import GenericBitAdder, GenericBitMultiplier, int_to_bit_tuple_lb, bit_tuple_lb_to_int
+
+def build_bit_adder(builder: NetworkBuilder, n_neurons: int) -> Tuple[List[ProxyHandle], List[NodeHandle]]:
+    """
+    `GenericBitAdder.__init__`, translated to a `NetworkBuilder`
+    """
+    neurons = [builder.perceptron(1.0) for _ in range(n_neurons)]
+
+    for neuron_src_idx, neuron_src in enumerate(neurons):
+        for neuron_dest_idx, neuron_dest in enumerate(neurons[:neuron_src_idx]):
+            neuron_dest.add_input(-(2 ** (neuron_src_idx - neuron_dest_idx)), neuron_src)
+
+    input_layer = [builder.proxy() for _ in range(2 ** n_neurons - 1)]
+
+    for neuron_src in input_layer:
+        for neuron_dest_idx, neuron_dest in enumerate(neurons):
+            neuron_dest.add_input(2 ** (-neuron_dest_idx), neuron_src)
+
+    return input_layer, neurons
+
+def test_bit_adder() -> None:
+    n_neurons = 4
+    builder = NetworkBuilder()
+    compiled = builder.build(*build_bit_adder(builder, n_neurons))
+
+    adder = GenericBitAdder(n_neurons)
+    for input_bits in itertools.product((0, 1), repeat = len(adder.input_layer)):
+        assert compiled(*input_bits) == adder(*input_bits)
+    print(GenericBitAdder.__name__, n_neurons, "via NetworkBuilder")
+
+def build_ripple_adder(n_bit: int) -> CompiledNetwork:
+    """
+    A ripple carry adder of `FullAdder`s as `GenericNumberAdder(n_bit, 2)`
+    """
+    builder = NetworkBuilder()
+    input_layer_x = [builder.proxy() for _ in range(n_bit)]
+    input_layer_y = [builder.proxy() for _ in range(n_bit)]
+    output_layer = []
+    carry = builder.const(0.0)
+    for x, y in zip(input_layer_x, input_layer_y):
+        adder_inputs, (neuron_sum, neuron_carry) = build_bit_adder(builder, 2)
+        for proxy, source in zip(adder_inputs, (carry, x, y)):
+            proxy.source = source
+        output_layer.append(neuron_sum)
+        carry = neuron_carry
+
+    return builder.build(input_layer_x + input_layer_y, output_layer)
+
+def test_large_ripple_adder() -> None:
+    n_bit = 50_000
+
+    tracemalloc.start()
+    compiled = build_ripple_adder(n_bit)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{compiled.n_perceptrons} perceptrons, {compiled.n_edges} edges in {size / 2 ** 20:.1f} MiB")
+    assert compiled.n_perceptrons == 2 * n_bit
+
+    for _ in range(2):
+        nums = (random.getrandbits(n_bit - 1), random.getrandbits(n_bit - 1))
+        input_bits = int_to_bit_tuple_lb(nums[0], n_bit) + int_to_bit_tuple_lb(nums[1], n_bit)
+        assert bit_tuple_lb_to_int(compiled(*input_bits)) == sum(nums)
+
+def test_neuron_memory() -> None:
+    # neurons have no `__dict__`, but can still be weakly referenced
+    neuron = Perceptron(1.0, [(1.0, ProxyNeuron())])
+    assert not hasattr(neuron, "__dict__")
+    assert weakref.ref(neuron)() is neuron
+
+    GenericBitMultiplier(8) # build the templates
+    tracemalloc.start()
+    multiplier = GenericBitMultiplier(64)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # about 6 MiB with a `__dict__` and a tuple per input on every perceptron
+    print(f"GenericBitMultiplier(64) in {size / 2 ** 20:.1f} MiB")
+    assert size < 5 * 2 ** 20
+
+def main() -> None:
+    test_bit_adder()
+    test_large_ripple_adder()
+    test_neuron_memory()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+import operator
+import os
+import pickle
+import random
+import tempfile
+import time
+
+from libThresholdLogic import BitSlicedNetwork, CompiledNetwork, NeuronNetwork, verify
+from libThresholdLogic.ExampleNetworks import GenericBitMultiplier, GenericNumberAdder
+
+def check_same(network: NeuronNetwork, loaded: CompiledNetwork, n_vectors: int = 200) -> None:
+    for _ in range(n_vectors):
+        inputs = tuple(random.getrandbits(1) for _ in range(len(network.input_layer)))
+        assert loaded(*inputs) == network(*inputs)
+
+def test_round_trip(directory: str) -> None:
+    path = os.path.join(directory, "mult.tln")
+    mult = GenericBitMultiplier(8)
+    mult.save(path)
+
+    loaded = NeuronNetwork.load(path)
+    assert isinstance(loaded.sources, memoryview)
+    assert loaded.path == path
+    assert loaded.neurons is None
+    assert (loaded.n_perceptrons, loaded.n_edges, loaded.depth) == (mult.compiled.n_perceptrons, mult.compiled.n_edges, mult.compiled.depth)
+    check_same(mult, loaded)
+
+    # the other evaluators work straight off the mapped arrays
+    assert BitSlicedNetwork(loaded).evaluate_batch([(1,) * 16]) == [mult(*(1,) * 16)]
+
+    read = NeuronNetwork.load(path, memory_map = False)
+    assert read.path is None
+    check_same(mult, read)
+
+    # a mapped network pickles as its path, anything derived from it pickles its arrays
+    assert len(pickle.dumps(loaded)) < 200
+    check_same(mult, pickle.loads(pickle.dumps(loaded)))
+    exact = loaded.to_exact()
+    check_same(mult, pickle.loads(pickle.dumps(exact)))
+
+    # workers each map the file rather than receiving the arrays
+    result = verify(loaded, operator.mul, (8, 8), n_workers = 2, shard_size = 4096)
+    print(result)
+    assert result.ok
+
+def test_exact(directory: str) -> None:
+    path = os.path.join(directory, "adder.tln")
+    adder = GenericNumberAdder(16, 3)
+    adder.compile(exact = True).save(path)
+    loaded = CompiledNetwork.load(path)
+    assert loaded.exact and loaded.value_type is int
+    assert loaded.weights.format == "q"
+    check_same(adder, loaded)
+
+def test_bad_files(directory: str) -> None:
+    path = os.path.join(directory, "bad.tln")
+    for contents in (b"", b"not a network file at all, but long enough for a header" * 2):
+        with open(path, "wb") as f:
+            f.write(contents)
+        try:
+            CompiledNetwork.load(path)
+        except ValueError as e:
+            print(e)
+        else:
+            assert False, "bad file loaded"
+
+    GenericNumberAdder(4, 2).save(path)
+    with open(path, "rb") as f:
+        contents = f.read()
+    with open(path, "wb") as f:
+        f.write(contents[:-8])
+    try:
+        CompiledNetwork.load(path)
+    except ValueError as e:
+        print(e)
+    else:
+        assert False, "truncated file loaded"
+
+def test_load_time(directory: str) -> None:
+    path = os.path.join(directory, "big.tln")
+    n_bit = 64
+
+    start = time.perf_counter()
+    mult = GenericBitMultiplier(n_bit)
+    compiled = mult.compile(keep_neurons = False)
+    constructed = time.perf_counter() - start
+    compiled.save(path)
+
+    start = time.perf_counter()
+    loaded = CompiledNetwork.load(path)
+    loaded_time = time.perf_counter() - start
+
+    print(f"GenericBitMultiplier({n_bit}): {os.path.getsize(path):_} bytes, constructed and compiled in {constructed:.3f}s, loaded in {loaded_time * 1000:.3f}ms")
+    check_same(mult, loaded, 20)
+
+def main() -> None:
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as directory:
+        test_round_trip(directory)
+        test_exact(directory)
+        test_bad_files(directory)
+        test_load_time(directory)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+from libThresholdLogic import Perceptron
+from libThresholdLogic.ExampleNetworks import HalfAdder, GenericBitAdder, GenericNumberAdder, GenericBitMultiplier
+
+def test_half_adder() -> None:
+    stats = HalfAdder().stats()
+    print(stats)
+    assert stats.n_perceptrons == 2
+    assert stats.n_edges == 5
+    assert stats.n_proxies == 2
+    assert stats.depth == 2
+    assert stats.fan_in == {2: 1, 3: 1}
+    # each input feeds both perceptrons, the carry feeds the sum, and the sum feeds nothing
+    assert stats.fan_out == {0: 1, 1: 1, 2: 2}
+
+def test_bit_adder() -> None:
+    for n_neurons in range(1, 6):
+        adder = GenericBitAdder(n_neurons)
+        stats = adder.stats()
+        assert stats.n_perceptrons == n_neurons
+        assert stats.depth == n_neurons # the inhibitory chain from the top neuron down to the 1s neuron
+        assert stats.critical_path[-1] is adder.real_output
+
+def test_number_adder() -> None:
+    # ripple carry: the depth grows linearly with `n_bit`
+    for n_bit in (1, 10, 100, 10_000):
+        adder = GenericNumberAdder(n_bit, 3)
+        stats = adder.stats()
+        assert stats.n_perceptrons == 3 * n_bit
+        assert stats.depth == 2 * n_bit + 1
+        assert len(stats.critical_path) == stats.depth + 1
+        assert stats.critical_path[0] in adder.input_layer
+        assert all(isinstance(neuron, Perceptron) for neuron in stats.critical_path[1:])
+        print(type(adder).__name__, n_bit, "depth", stats.depth)
+
+def test_multiplier() -> None:
+    mult = GenericBitMultiplier(8)
+    stats = mult.stats()
+    compiled = mult.compile()
+    assert (stats.n_perceptrons, stats.n_edges, stats.depth) == (compiled.n_perceptrons, compiled.n_edges, compiled.depth)
+    assert stats.critical_path[-1] in mult.output_layer
+
+def main() -> None:
+    test_half_adder()
+    test_bit_adder()
+    test_number_adder()
+    test_multiplier()
+
+if __name__ == "__main__":
+    main()
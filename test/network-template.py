@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+import itertools
+import time
+
+from libThresholdLogic import clear_templates, NetworkTemplate, NeuronNetwork, ProxyNeuron
+from libThresholdLogic.NetworkTemplate import template_of
+from libThresholdLogic.ExampleNetworks import AND, XOR, GenericBitAdder, GenericBitMultiplier
+
+def test_same_outputs() -> None:
+    for network_class, args in ((AND, (3,)), (XOR, ()), (GenericBitAdder, (3,))):
+        original = network_class(*args)
+        instance = network_class.instance(*args)
+        assert type(instance) is network_class
+        for inputs in itertools.product((0, 1), repeat = len(original.input_layer)):
+            assert original(*inputs) == instance(*inputs)
+
+def test_attributes_remapped() -> None:
+    adder = GenericBitAdder.instance(3)
+    assert adder.n_neurons == 3
+    assert adder.carry_inputs == adder.input_layer[:2]
+    assert adder.real_inputs == adder.input_layer[2:]
+    assert adder.real_output is adder.output_layer[0]
+    assert adder.carry_outputs == adder.output_layer[1:]
+
+def test_instances_independent() -> None:
+    first = AND.instance()
+    second = AND.instance()
+    assert not set(first.input_layer) & set(second.input_layer)
+    assert first.output_layer[0] is not second.output_layer[0]
+
+    # connecting up one instance leaves the other, and the template, unconnected
+    x = ProxyNeuron()
+    first.connect_inputs(x, x)
+    assert all(neuron.source is None for neuron in second.input_layer)
+    assert all(neuron.source is None for neuron in AND.instance().input_layer)
+
+class Wrapped(NeuronNetwork):
+    """
+    An `XOR` held as an attribute, and an unconnected `AND` held only as an attribute
+    """
+    def __init__(self) -> None:
+        self.inner = XOR()
+        self.spare = AND()
+        self.parts = (self.inner, self.spare)
+        input_layer = [ProxyNeuron() for _ in range(2)]
+        self.inner.connect_inputs(*input_layer)
+        super().__init__(input_layer, list(self.inner.output_layer))
+
+class Keyed(NeuronNetwork):
+    def __init__(self) -> None:
+        input_layer = [ProxyNeuron()]
+        self.by_name = {"x": input_layer[0]}
+        super().__init__(input_layer, input_layer)
+
+def test_subnetwork_attributes() -> None:
+    first = Wrapped.instance()
+    second = Wrapped.instance()
+
+    # subnetworks are copied over each instance's own neurons, once however often they're held
+    assert first.inner is not second.inner and type(first.inner) is XOR
+    assert first.inner.output_layer[0] is first.output_layer[0]
+    assert first.inner.input_layer[0].source is first.input_layer[0]
+    assert first.parts[0] is first.inner and first.parts[1] is first.spare
+    assert [first(*inputs) for inputs in itertools.product((0, 1), repeat = 2)] == [(0,), (1,), (1,), (0,)]
+
+    x = ProxyNeuron()
+    first.spare.connect_inputs(x, x)
+    assert all(neuron.source is None for neuron in second.spare.input_layer)
+    assert all(neuron.source is None for neuron in Wrapped.instance().spare.input_layer)
+
+    # neurons held where they can't be remapped aren't silently shared
+    try:
+        Keyed.instance()
+    except TypeError:
+        pass
+    else:
+        assert False, "dict of neurons accepted"
+
+def test_connected_prototype() -> None:
+    network = AND()
+    network.pad_unconnected_inputs()
+    try:
+        NetworkTemplate(network)
+    except ValueError:
+        pass
+    else:
+        assert False, "connected input layer accepted"
+
+def test_weights_shared() -> None:
+    first = GenericBitAdder.instance(3)
+    second = GenericBitAdder.instance(3)
+    assert first.output_layer[0].weights is second.output_layer[0].weights
+    assert first.output_layer[0].sources is not second.output_layer[0].sources
+
+    # adding an input to one instance copies its weights first
+    first.output_layer[0].add_input(1.0, ProxyNeuron())
+    assert len(first.output_layer[0].weights) == len(second.output_layer[0].weights) + 1
+    assert GenericBitAdder.instance(3).output_layer[0].weights is second.output_layer[0].weights
+
+def test_cache_cleared() -> None:
+    template = template_of(AND, 4)
+    assert template_of(AND, 4) is template
+    clear_templates()
+    assert template_of(AND, 4) is not template
+
+def test_construction_time() -> None:
+    def best_time(construct) -> float:
+        times = []
+        for _ in range(5):
+            start = time.perf_counter()
+            construct()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    n_neurons = 8
+    GenericBitAdder.instance(n_neurons) # build the template
+    constructed = best_time(lambda: GenericBitAdder(n_neurons))
+    instanced = best_time(lambda: GenericBitAdder.instance(n_neurons))
+    print(f"GenericBitAdder({n_neurons}) constructed in {constructed * 1000:.2f}ms, instanced in {instanced * 1000:.2f}ms")
+    assert instanced * 2 < constructed
+
+    for n_bit in (32, 64, 128):
+        start = time.perf_counter()
+        GenericBitMultiplier(n_bit)
+        print(f"GenericBitMultiplier({n_bit}) constructed in {time.perf_counter() - start:.3f}s")
+
+def main() -> None:
+    test_same_outputs()
+    test_attributes_remapped()
+    test_instances_independent()
+    test_subnetwork_attributes()
+    test_connected_prototype()
+    test_weights_shared()
+    test_cache_cleared()
+    test_construction_time()
+
+if __name__ == "__main__":
+    main()
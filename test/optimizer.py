@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+import itertools
+import operator
+
+from libThresholdLogic import ConstNeuron, NeuronNetwork, ProxyNeuron, verify
+from libThresholdLogic.ExampleNetworks import AND, OR, GenericBitMultiplier, GenericNumberAdder
+
+def add_ints(*nums: int) -> int:
+    return sum(nums) % 2 ** 8
+
+def check_exhaustive(network: NeuronNetwork, optimized: NeuronNetwork) -> None:
+    for inputs in itertools.product((0, 1), repeat = len(network.input_layer)):
+        assert optimized(*inputs) == network(*inputs)
+
+def test_multiplier() -> None:
+    mult = GenericBitMultiplier(8)
+    optimized, report = mult.optimize()
+    print(report)
+    assert report.after.n_edges < report.before.n_edges
+    assert report.after.n_proxies == len(mult.input_layer) # only the input layer is left
+    assert report.n_folded_edges > 0
+    assert report.n_eliminated_proxies > 0
+
+    # the original network is untouched
+    assert mult.stats().n_edges == report.before.n_edges
+
+    result = verify(optimized, operator.mul, (8, 8), n_workers = 1)
+    print(result)
+    assert result.ok
+
+def test_adder() -> None:
+    adder = GenericNumberAdder(8, 3)
+    optimized, report = adder.optimize()
+    print(report)
+    result = verify(optimized, add_ints, [(8, range(0, 256, 37))] * 5, n_workers = 1)
+    assert result.ok
+
+def test_merge_duplicates() -> None:
+    # `(a AND b) OR (b AND a)`, built from separate `AND` gates
+    input_layer = [ProxyNeuron() for _ in range(2)]
+    and1 = AND()
+    and2 = AND()
+    or_ = OR()
+    and1.connect_inputs(*input_layer)
+    and2.connect_inputs(*input_layer[::-1])
+    or_.connect_inputs(and1.output_layer[0], and2.output_layer[0])
+    network = NeuronNetwork(input_layer, or_.output_layer)
+
+    optimized, report = network.optimize()
+    print(report)
+    assert report.n_merged_perceptrons == 1
+    # the OR now reads the same AND twice
+    assert report.after.n_perceptrons == 2
+    check_exhaustive(network, optimized)
+
+    _, report = network.optimize(merge_duplicates = False)
+    assert report.after.n_perceptrons == 3
+
+def test_constants() -> None:
+    # `a AND 1` is just `a`, `a AND 0` is constant, and the output of a constant perceptron is folded away
+    input_layer = [ProxyNeuron()]
+    and_one = AND()
+    and_one.connect_inputs(input_layer[0], ConstNeuron(1.0))
+    and_zero = AND()
+    and_zero.connect_inputs(input_layer[0])
+    and_zero.pad_unconnected_inputs()
+    or_ = OR()
+    or_.connect_inputs(and_one.output_layer[0], and_zero.output_layer[0])
+    network = NeuronNetwork(input_layer, or_.output_layer + and_zero.output_layer)
+
+    optimized, report = network.optimize()
+    print(report)
+    assert report.n_folded_perceptrons == 1
+    assert report.after.n_perceptrons == 2
+    assert report.after.n_consts == 1 # the second output
+    check_exhaustive(network, optimized)
+
+    optimized, report = network.optimize(fold_constants = False, eliminate_proxies = False)
+    assert report.after.n_perceptrons == 3
+    assert report.after.n_proxies == report.before.n_proxies
+    check_exhaustive(network, optimized)
+
+def test_dead() -> None:
+    # `a AND (b AND c) AND 0` is constant, leaving `b AND c` dead
+    input_layer = [ProxyNeuron() for _ in range(3)]
+    inner = AND()
+    inner.connect_inputs(*input_layer[1:])
+    outer = AND(3)
+    outer.connect_inputs(input_layer[0], inner.output_layer[0])
+    outer.pad_unconnected_inputs()
+    or_ = OR()
+    or_.connect_inputs(input_layer[0], outer.output_layer[0])
+    network = NeuronNetwork(input_layer, or_.output_layer)
+
+    optimized, report = network.optimize()
+    print(report)
+    assert report.n_folded_perceptrons == 1
+    assert report.n_dead_perceptrons == 1
+    assert report.after.n_perceptrons == 1
+    check_exhaustive(network, optimized)
+
+def main() -> None:
+    test_multiplier()
+    test_adder()
+    test_merge_duplicates()
+    test_constants()
+    test_dead()
+
+if __name__ == "__main__":
+    main()
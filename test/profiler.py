@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+from libThresholdLogic import Profiler
+from libThresholdLogic.ExampleNetworks import FullAdder, GenericBitMultiplier, GenericNumberAdder
+
+def test_counts() -> None:
+    adder = FullAdder()
+
+    with Profiler() as profiler:
+        for _ in range(4):
+            assert adder(1, 1, 0) == (0, 1)
+
+    # every perceptron is evaluated, a cache miss, once per call,
+    # whereas the input layer is already in the cache
+    for neuron in adder.output_layer:
+        assert profiler.profile(neuron).evaluations == 4
+    for neuron in adder.input_layer:
+        assert profiler.profile(neuron).evaluations == 0
+        assert profiler.profile(neuron).hits == 4 * 3 # once in the walk, and by each perceptron
+
+    neuron_sum, neuron_carry = adder.output_layer
+    # the carry is read by the sum and as an output, the sum only as an output
+    assert profiler.profile(neuron_carry).hits == 4 * 2
+    assert profiler.profile(neuron_sum).hits == 4
+    assert profiler.profile(neuron_sum).time > 0
+
+def test_disabled() -> None:
+    adder = FullAdder()
+    profiler = Profiler()
+    with profiler:
+        pass
+    assert Profiler.active is None
+    adder(1, 0, 1)
+    assert not profiler.profiles
+
+    profiler.enable()
+    adder(1, 0, 1)
+    profiler.disable()
+    adder(1, 0, 1)
+    assert all(profiler.profile(neuron).evaluations == 1 for neuron in adder.output_layer)
+
+def test_hierarchy() -> None:
+    with Profiler() as profiler:
+        mult = GenericBitMultiplier(3)
+        mult(1, 0, 1, 1, 1, 0)
+
+    report = profiler.report()
+    print(report)
+    lines = report.splitlines()
+    assert lines[1].startswith("GenericBitMultiplier#0")
+    # subnetworks, including those stamped out from templates, are indented under it
+    assert any(line.startswith("  GenericBitAdder#") for line in lines)
+    assert sum(line.startswith("  AND#") for line in lines) == 9
+    # the prototypes of the `NetworkTemplate`s aren't subnetworks
+    assert len(mult.subnetworks) == sum(line.startswith("  ") for line in lines[1:])
+
+    detailed = profiler.report(show_neurons = True)
+    assert "    Perceptron at " in detailed
+
+    # subnetworks are recorded at construction, so a network built before profiling is reported in full
+    adder = GenericNumberAdder(4, 2)
+    with Profiler() as profiler:
+        adder(*(1,) * 8)
+    lines = profiler.report().splitlines()
+    assert lines[1].startswith("GenericNumberAdder#0")
+    assert sum(line.startswith("  GenericBitAdder#") for line in lines) == 4
+
+    # evaluating a subnetwork as well reports it under its parent, and naming one renames it
+    with Profiler() as profiler:
+        adder(*(1,) * 8)
+        adder.subnetworks[0](1, 0, 1)
+        profiler.register(adder.subnetworks[0], "low bits")
+    lines = profiler.report().splitlines()
+    assert lines[1].startswith("GenericNumberAdder#0") and lines[2].startswith("  low bits ")
+
+    # only the networks evaluated are held, not every one constructed while profiling
+    with Profiler() as profiler:
+        GenericBitMultiplier(2)
+    assert not profiler.networks and profiler.report().count("\n") == 0
+
+def main() -> None:
+    test_counts()
+    test_disabled()
+    test_hierarchy()
+
+if __name__ == "__main__":
+    main()
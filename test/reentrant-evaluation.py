@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import random
+import threading
+
+from libThresholdLogic import ProxyNeuron
+from libThresholdLogic.ExampleNetworks import AND, GenericBitMultiplier, GenericNumberAdder, XOR
+
+def test_unmodified() -> None:
+    adder = GenericNumberAdder(4, 2)
+    adder(*(1,) * 8)
+    assert all(neuron.source is None for neuron in adder.input_layer)
+
+    # so it can still be connected up after being called
+    xor = XOR()
+    assert xor(1, 0) == (1,)
+    x = ProxyNeuron()
+    xor.connect_inputs(x, x)
+    assert all(neuron.source is x for neuron in xor.input_layer)
+
+def test_chained() -> None:
+    # calling a network which is chained to another leaves the chain intact
+    first = AND()
+    second = AND()
+    second.connect_inputs(first.output_layer[0])
+    assert second(1, 1) == (1,)
+    assert second.input_layer[0].source is first.output_layer[0]
+    assert second.input_layer[1].source is None
+
+def test_threads() -> None:
+    mult = GenericBitMultiplier(4)
+    rows = list(itertools.product((0, 1), repeat = 8))
+    expected = {row: mult.compiled(*row) for row in rows}
+
+    n_threads = 8
+    barrier = threading.Barrier(n_threads)
+    failures = []
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        barrier.wait()
+        for _ in range(300):
+            row = rng.choice(rows)
+            if mult(*row) != expected[row]:
+                failures.append(row)
+
+    threads = [threading.Thread(target = worker, args = (seed,)) for seed in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not failures
+
+def test_map() -> None:
+    adder = GenericNumberAdder(3, 2)
+    rows = list(itertools.product((0, 1), repeat = 6))
+    expected = [adder(*row) for row in rows]
+
+    assert adder.map(rows) == expected
+    assert adder.map(iter(rows), chunk_size = 5) == expected
+    with ThreadPoolExecutor(max_workers = 4) as executor:
+        assert adder.map(rows, executor = executor, chunk_size = 1) == expected
+    assert adder.map([]) == []
+
+def main() -> None:
+    test_unmodified()
+    test_chained()
+    test_threads()
+    test_map()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+import itertools
+import random
+import time
+
+from libThresholdLogic import NeuronNetwork, ProxyNeuron, ShortCircuitNetwork
+from libThresholdLogic.ExampleNetworks import (
+    AND, OR, BitMultiplier2x2, FullAdder, GAND, GenericBitAdder, GenericBitMultiplier, GenericNumberAdder, HammingGate,
+)
+
+def test_exhaustive() -> None:
+    networks = (
+        FullAdder(), BitMultiplier2x2(), GenericBitAdder(3), GenericBitAdder(4), GenericNumberAdder(4, 2),
+        GenericNumberAdder(3, 3), GenericBitMultiplier(3), HammingGate((1, 0, 1, 1, 0), 2), GAND((0, 1, 1, 0)),
+    )
+    for network in networks:
+        short_circuit = ShortCircuitNetwork(network.compiled)
+        exact = ShortCircuitNetwork(network.compile(exact = True))
+        for inputs in itertools.product((0, 1), repeat = len(network.input_layer)):
+            expected = network(*inputs)
+            assert short_circuit(*inputs) == expected
+            assert exact(*inputs) == expected
+
+def test_skipped() -> None:
+    # `a OR (b AND c)` doesn't need `b AND c` when `a` is set
+    input_layer = [ProxyNeuron() for _ in range(3)]
+    and_ = AND()
+    and_.connect_inputs(*input_layer[1:])
+    or_ = OR()
+    or_.connect_inputs(input_layer[0], and_.output_layer[0])
+    network = NeuronNetwork(input_layer, or_.output_layer)
+
+    short_circuit = ShortCircuitNetwork(network.compiled)
+    compiled = network.compiled
+    and_slot = compiled.first_perceptron_slot # level 1, before the `OR`
+    assert short_circuit.evaluate((1, 1, 1))[and_slot] is None
+    assert short_circuit.evaluate((0, 1, 1))[and_slot] == 1.0
+
+    # a `GAND` is decided by its first mismatched bit, reading no more than twice as many bits
+    random.seed(0)
+    target = tuple(random.getrandbits(1) for _ in range(1000))
+    gate = GAND(target).short_circuit()
+    bias, min_rest, max_rest, chunks = gate.program[0]
+    assert [len(chunk[2]) for chunk in chunks[:4]] == [1, 2, 4, 8]
+    assert gate(*target) == (1,)
+    assert gate(*((1 - target[0],) + target[1:])) == (0,)
+
+def test_speed() -> None:
+    random.seed(0)
+    networks = (
+        GenericBitAdder(10),
+        HammingGate(tuple(random.getrandbits(1) for _ in range(1000)), 50),
+        GAND(tuple(random.getrandbits(1) for _ in range(1000))),
+    )
+    for network in networks:
+        rows = [tuple(random.getrandbits(1) for _ in network.input_layer) for _ in range(100)]
+        short_circuit = network.short_circuit()
+        assert isinstance(short_circuit, ShortCircuitNetwork)
+        short_circuit(*rows[0]) # build the program outside of the timing
+
+        timings = []
+        for evaluator in (network, network.compiled, short_circuit):
+            times = []
+            for _ in range(3):
+                start = time.perf_counter()
+                outputs = [evaluator(*row) for row in rows]
+                times.append(time.perf_counter() - start)
+            timings.append(min(times))
+            if evaluator is network:
+                expected = outputs
+            assert outputs == expected
+
+        print(
+            f"{type(network).__name__:<20}"
+            f" __call__ {timings[0] * 1e1:7.3f}ms"
+            f" compiled {timings[1] * 1e1:7.3f}ms"
+            f" short_circuit {timings[2] * 1e1:7.3f}ms per call"
+        )
+        assert timings[2] < timings[1]
+
+    # too narrow to gain, so evaluated compiled
+    for network in (GenericNumberAdder(32, 3), GenericBitMultiplier(8), GenericBitAdder(4)):
+        assert network.short_circuit() is network.compiled
+
+def main() -> None:
+    test_exhaustive()
+    test_skipped()
+    test_speed()
+
+if __name__ == "__main__":
+    main()
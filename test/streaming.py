@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import io
+import itertools
+import random
+import time
+
+from libThresholdLogic import IntegerNetwork, NeuronNetwork, Perceptron, ProxyNeuron
+from libThresholdLogic.ExampleNetworks import GenericBitMultiplier, GenericNumberAdder, int_to_bit_tuple_lb
+
+def test_stream_bits() -> None:
+    adder = GenericNumberAdder(4, 2)
+    rows = list(itertools.product((0, 1), repeat = len(adder.input_layer)))
+    assert list(adder.stream(iter(rows), chunk_size = 100)) == [adder(*row) for row in rows]
+    assert list(adder.stream([])) == []
+
+def test_stream_epsilon() -> None:
+    # perceptrons on which the ideal step of the bit-sliced evaluator differs from `__call__`:
+    # `x0 AND NOT x1` with `x1` inhibitory only within epsilon, and a 3 input `AND` of weights `1 / 3`
+    input_layer = [ProxyNeuron() for _ in range(2)]
+    nearly_and = NeuronNetwork(input_layer, [Perceptron(1.0, [(1.0, input_layer[0]), (-(2 ** -25), input_layer[1])])])
+    input_layer = [ProxyNeuron() for _ in range(3)]
+    thirds = NeuronNetwork(input_layer, [Perceptron(1.0, [(1 / 3, neuron) for neuron in input_layer])])
+
+    for network in (nearly_and, thirds):
+        assert not network.compiled.epsilon_free
+        rows = list(itertools.product((0, 1), repeat = len(network.input_layer)))
+        assert list(network.stream(rows, chunk_size = 3)) == [network(*row) for row in rows]
+        assert network.compiled.bit_sliced.evaluate_batch(rows) != [network(*row) for row in rows]
+
+    assert nearly_and(1, 1) == (1,)
+    assert list(nearly_and.stream([(1, 1)])) == [(1,)]
+    integers = IntegerNetwork(nearly_and, (1, 1))
+    assert integers(1, 1) == 1
+    assert list(integers.stream([(1, 1), (0, 1)])) == [1, 0]
+
+def test_lazy() -> None:
+    mult = GenericBitMultiplier(4)
+    pulled = 0
+    def rows():
+        nonlocal pulled
+        for row in itertools.product((0, 1), repeat = 8):
+            pulled += 1
+            yield row
+
+    outputs = mult.stream(rows(), chunk_size = 16)
+    assert pulled == 0
+    first = next(outputs)
+    assert first == mult(*(0,) * 8)
+    assert pulled == 16 # only the first chunk has been read
+    assert len(list(outputs)) == 255
+
+def test_integers() -> None:
+    mult = GenericBitMultiplier(8).integers()
+    assert mult(13, 17) == 221
+    pairs = ((x, y) for x in range(256) for y in range(0, 256, 7))
+    for (x, y), product in zip(((x, y) for x in range(256) for y in range(0, 256, 7)), mult.stream(pairs, chunk_size = 1000)):
+        assert product == x * y
+
+    adder = GenericNumberAdder(16, 3).integers()
+    assert adder.widths == (16,) * 5
+    assert adder(19_374, 28_383, 7_312, 1_382, 99) == (19_374 + 28_383 + 7_312 + 1_382 + 99) % 2 ** 16
+
+def test_file() -> None:
+    # operands streamed from a file, one whitespace separated pair per line
+    file = io.StringIO("".join(f"{x} {x + 1}\n" for x in range(1000)))
+    mult = GenericBitMultiplier(16).integers()
+    products = mult.stream(tuple(map(int, line.split())) for line in file)
+    assert list(products) == [x * (x + 1) for x in range(1000)]
+
+def test_speed() -> None:
+    n_bit = 16
+    mult = GenericBitMultiplier(n_bit)
+    random.seed(0)
+    pairs = [(random.getrandbits(n_bit), random.getrandbits(n_bit)) for _ in range(2000)]
+
+    start = time.perf_counter()
+    called = [mult(*(int_to_bit_tuple_lb(x, n_bit) + int_to_bit_tuple_lb(y, n_bit))) for (x, y) in pairs]
+    called_time = time.perf_counter() - start
+
+    integers = mult.integers()
+    integers(0, 0) # compile outside of the timing
+    start = time.perf_counter()
+    streamed = list(integers.stream(iter(pairs)))
+    streamed_time = time.perf_counter() - start
+
+    assert streamed == [x * y for (x, y) in pairs]
+    assert len(called) == len(streamed)
+    print(f"{len(pairs)} {n_bit}-bit products: __call__ per item {called_time:.3f}s, streamed {streamed_time:.3f}s")
+
+def main() -> None:
+    test_stream_bits()
+    test_stream_epsilon()
+    test_lazy()
+    test_integers()
+    test_file()
+    test_speed()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+import time
+
+from libThresholdLogic import DelayModel, Perceptron, ProxyNeuron
+from libThresholdLogic.ExampleNetworks import HalfAdder, GenericBitAdder, GenericNumberAdder
+
+def test_half_adder() -> None:
+    adder = HalfAdder()
+    neuron_sum, neuron_carry = adder.output_layer
+
+    timing = adder.timing()
+    print(timing)
+    # the sum waits for the carry
+    assert timing.output_arrivals == [2.0, 1.0]
+    assert timing.critical_path == [adder.input_layer[0], neuron_carry, neuron_sum]
+    assert timing.slack[neuron_sum] == 0.0
+    assert timing.slack[neuron_carry] == 0.0 # it feeds the sum, so is critical too
+    assert timing.output_slacks == [0.0, 1.0]
+
+    # a late input delays everything
+    timing = adder.timing(input_arrivals = [0.0, 5.0])
+    assert timing.output_arrivals == [7.0, 6.0]
+    assert timing.critical_path[0] is adder.input_layer[1]
+    assert timing.slack[adder.input_layer[0]] == 5.0
+
+    # missing the required time shows as negative slack
+    timing = adder.timing(required_time = 1.5)
+    assert timing.worst_slack == -0.5
+    assert timing.slack[neuron_carry] == -0.5
+
+def test_delay_models() -> None:
+    adder = GenericBitAdder(3) # 7 inputs, perceptrons with fan-in 7, 8 and 9
+
+    timing = adder.timing(DelayModel({Perceptron: 2.0, ProxyNeuron: 0.5}))
+    # the input layer starts every path so adds no delay, leaving the chain of 3 perceptrons
+    assert timing.max_arrival == 0.0 + 3 * 2.0
+
+    timing = adder.timing(DelayModel(per_input = 0.5))
+    assert timing.max_arrival == (1 + 0.5 * 7) + (1 + 0.5 * 8) + (1 + 0.5 * 9)
+
+    # any callable works, here a delay growing with the log of the fan-in
+    timing = adder.timing(lambda neuron: len(neuron.inputs).bit_length() if isinstance(neuron, Perceptron) else 0)
+    assert timing.max_arrival == 3 + 4 + 4
+
+def test_ripple_carry() -> None:
+    # the carry ripples through two perceptrons per bit
+    for n_bit in (1, 10, 100, 1000):
+        adder = GenericNumberAdder(n_bit, 3)
+        timing = adder.timing()
+        assert timing.output_arrivals == [2.0 * bit + 3.0 for bit in range(n_bit)]
+        assert timing.max_arrival == adder.stats().depth
+        print(f"GenericNumberAdder({n_bit}, 3) latest output at {timing.max_arrival:g}")
+
+def test_scaling() -> None:
+    adder = GenericNumberAdder(30_000, 3)
+    start = time.perf_counter()
+    timing = adder.timing(DelayModel(per_input = 0.1))
+    print(f"{len(timing.arrival):_} neurons timed in {time.perf_counter() - start:.2f}s")
+    assert len(timing.critical_path) > 2 * 30_000
+
+def main() -> None:
+    test_half_adder()
+    test_delay_models()
+    test_ripple_carry()
+    test_scaling()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+import operator
+
+from libThresholdLogic import NeuronNetwork, Perceptron, ProxyNeuron, verify
+from libThresholdLogic.ExampleNetworks import GenericBitMultiplier, GenericNumberAdder
+
+def add_ints(*nums: int) -> int:
+    return sum(nums)
+
+def wrong_mul(x: int, y: int) -> int:
+    return x * y + (x == 200 and y == 100)
+
+class NearlyAND(NeuronNetwork):
+    """
+    `x0 AND NOT x1`, but with `x1` inhibitory only within `Perceptron.heaviside`'s epsilon,
+    so that as called it is just `x0`
+    """
+    def __init__(self) -> None:
+        neuron = Perceptron(1.0)
+        input_layer = [ProxyNeuron() for _ in range(2)]
+        neuron.add_input(1.0, input_layer[0])
+        neuron.add_input(-(2 ** -25), input_layer[1])
+        super().__init__(input_layer, [neuron])
+
+def and_not(x: int, y: int) -> int:
+    return x & (1 - y)
+
+def first(x: int, y: int) -> int:
+    return x
+
+def and3(x: int, y: int, z: int) -> int:
+    return x & y & z
+
+def test_epsilon() -> None:
+    # the network is checked as called, not as its ideal integer form
+    network = NearlyAND()
+    assert not network.compiled.epsilon_free
+    assert network(1, 1) == (1,)
+
+    result = verify(network, and_not, (1, 1), n_workers = 1)
+    print(result)
+    assert not result.ok
+    assert result.counterexample.operands == (1, 1)
+    assert result.counterexample.actual == 1
+
+    assert verify(network, first, (1, 1), n_workers = 1).ok
+
+    # a 3 input `AND` of weights `1 / 3`, whose float sum rounds up to its bias of 1
+    input_layer = [ProxyNeuron() for _ in range(3)]
+    network = NeuronNetwork(input_layer, [Perceptron(1.0, [(1 / 3, neuron) for neuron in input_layer])])
+    assert not network.compiled.epsilon_free
+    assert network.compile(exact = True)(1, 1, 1) == (0,)
+    assert verify(network, and3, (1, 1, 1), n_workers = 1).ok
+
+def main() -> None:
+    mult = GenericBitMultiplier(8)
+
+    result = verify(mult, operator.mul, (8, 8), n_workers = 2, shard_size = 4096)
+    print(result)
+    assert result.ok
+
+    result = verify(mult, wrong_mul, (8, 8), n_workers = 2, shard_size = 4096)
+    print(result)
+    assert not result.ok
+    assert result.counterexample.operands == (200, 100)
+    assert result.counterexample.actual == 200 * 100
+
+    # as `generic-number-adder.py`'s `main_slow`
+    adder = GenericNumberAdder(8, 3)
+    result = verify(adder, add_ints, [(8, range(16))] * 5, n_workers = 1)
+    print(result)
+    assert result.ok
+
+    test_epsilon()
+
+if __name__ == "__main__":
+    main()